@@ -0,0 +1 @@
+"""Fancall performance benchmarks"""
@@ -0,0 +1,304 @@
+"""
+End-to-end API load test.
+
+Starts the FastAPI app from ``main.py`` under uvicorn against a temporary SQLite
+database and an in-process ``FakeLiveKitServer``, then drives the create, token,
+dispatch and call-setup flows at each concurrency level and reports throughput
+and p50/p95/p99 latency.
+
+A room has one agent dispatch, so ``dispatch`` dispatches to a new room per
+operation, while ``dispatch_replay`` repeats the dispatch of rooms that already
+have one and measures the idempotent replay.
+
+Usage:
+    python -m benchmarks.api_load --requests 500 --concurrency 1 8 32 --output api.json
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.common import (
+    BenchmarkResult,
+    latency_summary,
+    print_results,
+    write_results,
+)
+from fancall.testing import FakeLiveKitServer
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+SCENARIOS = (
+    "create",
+    "token",
+    "dispatch",
+    "dispatch_replay",
+    "call_setup",
+    "start_call",
+)
+
+Operation = Callable[[httpx.AsyncClient, int], Awaitable[Any]]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def start_api(
+    livekit: FakeLiveKitServer, data_dir: str
+) -> tuple[subprocess.Popen, str]:
+    """
+    Start ``main:create_app`` under uvicorn and wait until it is healthy.
+
+    Args:
+        livekit: Started fake LiveKit server the API dispatches to
+        data_dir: Directory for the SQLite database
+
+    Returns:
+        The server process and its base URL
+    """
+    port = _free_port()
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{Path(data_dir) / 'fancall.db'}",
+        "FANCALL_API_CREATE_SCHEMA": "true",
+        "LIVEKIT_URL": livekit.url,
+        "LIVEKIT_API_KEY": livekit.api_key,
+        "LIVEKIT_API_SECRET": livekit.api_secret,
+    }
+    # pylint: disable-next=consider-using-with
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "--factory",
+            "main:create_app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        for _ in range(200):
+            if process.poll() is not None:
+                raise RuntimeError("API server exited during startup")
+            try:
+                if (await client.get("/healthz")).status_code == 200:
+                    return process, base_url
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.05)
+    process.terminate()
+    raise RuntimeError("API server did not become healthy")
+
+
+async def _post(client: httpx.AsyncClient, path: str, **kwargs) -> httpx.Response:
+    response = await client.post(path, **kwargs)
+    response.raise_for_status()
+    return response
+
+
+async def _create_rooms(client: httpx.AsyncClient, count: int) -> list[str]:
+    responses = await asyncio.gather(
+        *(_post(client, "/live-rooms") for _ in range(count))
+    )
+    return [response.json()["data"]["id"] for response in responses]
+
+
+async def _operation(
+    client: httpx.AsyncClient, scenario: str, requests: int, rooms: int
+) -> Operation:
+    """Build the operation of a scenario, preparing the rooms it uses."""
+    if scenario == "create":
+        return lambda c, _: _post(c, "/live-rooms")
+    if scenario == "call_setup":
+
+        async def call_setup(c: httpx.AsyncClient, _: int) -> None:
+            room_id = (await _post(c, "/live-rooms")).json()["data"]["id"]
+            await _post(c, f"/live-rooms/{room_id}/token")
+            await _post(c, f"/live-rooms/{room_id}/dispatch", json={})
+
+        return call_setup
+    if scenario == "start_call":
+        return lambda c, _: _post(c, "/live-rooms/start-call", json={})
+    if scenario == "dispatch":
+        # Every operation is a first dispatch: one new room each
+        new_room_ids = await _create_rooms(client, requests)
+        return lambda c, i: _post(c, f"/live-rooms/{new_room_ids[i]}/dispatch", json={})
+
+    room_ids = await _create_rooms(client, rooms)
+    if scenario == "token":
+        return lambda c, i: _post(c, f"/live-rooms/{room_ids[i % len(room_ids)]}/token")
+    await asyncio.gather(
+        *(
+            _post(client, f"/live-rooms/{room_id}/dispatch", json={})
+            for room_id in room_ids
+        )
+    )
+    return lambda c, i: _post(
+        c, f"/live-rooms/{room_ids[i % len(room_ids)]}/dispatch", json={}
+    )
+
+
+async def run_case(
+    client: httpx.AsyncClient,
+    scenario: str,
+    requests: int,
+    concurrency: int,
+    rooms: int,
+) -> BenchmarkResult:
+    """
+    Run one scenario with ``concurrency`` workers sharing ``requests`` operations.
+
+    Args:
+        client: HTTP client bound to the API
+        scenario: One of SCENARIOS
+        requests: Total operations
+        concurrency: Concurrent workers
+        rooms: Pre-created rooms reused by the token and dispatch_replay scenarios
+
+    Returns:
+        Throughput, latency percentiles and error count of the case
+    """
+    operation = await _operation(client, scenario, requests, rooms)
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                await operation(client, i)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    duration = time.perf_counter() - start
+    return BenchmarkResult(
+        f"{scenario}_c{concurrency}",
+        len(latencies),
+        duration,
+        extra={
+            "scenario": scenario,
+            "concurrency": concurrency,
+            "errors": errors,
+            "latency_ms": latency_summary(latencies),
+        },
+    )
+
+
+async def run(
+    livekit: FakeLiveKitServer,
+    scenarios: list[str],
+    requests: int,
+    concurrency_levels: list[int],
+    rooms: int,
+    warmup: int,
+) -> list[BenchmarkResult]:
+    """
+    Start the fake LiveKit server and the API, then run every case.
+
+    Args:
+        livekit: Fake LiveKit server (not yet started) with its injected faults
+        scenarios: Scenarios to run
+        requests: Operations per case
+        concurrency_levels: Concurrency of each case
+        rooms: Pre-created rooms reused by the token and dispatch_replay scenarios
+        warmup: Unmeasured operations per scenario before its cases
+
+    Returns:
+        Benchmark results
+    """
+    await livekit.start()
+    data_dir = tempfile.mkdtemp()
+    process = None
+    try:
+        process, base_url = await start_api(livekit, data_dir)
+        limits = httpx.Limits(max_connections=max(concurrency_levels))
+        async with httpx.AsyncClient(
+            base_url=base_url, limits=limits, timeout=30
+        ) as client:
+            results = []
+            for scenario in scenarios:
+                if warmup:
+                    await run_case(client, scenario, warmup, 1, 1)
+                for concurrency in concurrency_levels:
+                    results.append(
+                        await run_case(client, scenario, requests, concurrency, rooms)
+                    )
+            return results
+    finally:
+        if process:
+            process.terminate()
+            process.wait(timeout=10)
+        await livekit.stop()
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").split("\n\n", maxsplit=1)[0]
+    )
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--rooms", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument(
+        "--livekit-latency", type=float, default=0.0, help="Seconds per LiveKit call"
+    )
+    parser.add_argument(
+        "--livekit-error-rate", type=float, default=0.0, help="LiveKit failure rate"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    livekit = FakeLiveKitServer(
+        latency=args.livekit_latency,
+        error_rate=args.livekit_error_rate,
+        seed=args.seed,
+    )
+    results = asyncio.run(
+        run(
+            livekit,
+            list(args.scenarios),
+            args.requests,
+            args.concurrency,
+            args.rooms,
+            args.warmup,
+        )
+    )
+    print_results(results)
+    if args.output:
+        write_results(args.output, "api_load", results)
+
+
+if __name__ == "__main__":
+    main()
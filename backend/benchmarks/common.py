@@ -0,0 +1,117 @@
+"""
+Shared helpers for Fancall benchmarks.
+"""
+
+import json
+import platform
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+
+@dataclass
+class BenchmarkResult:
+    """Throughput result of one benchmark case"""
+
+    name: str
+    operations: int
+    duration_seconds: float
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def ops_per_second(self) -> float:
+        """Operations per second"""
+        return self.operations / self.duration_seconds if self.duration_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize including derived throughput"""
+        return {**asdict(self), "ops_per_second": round(self.ops_per_second, 2)}
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """
+    Return the q-th percentile using linear interpolation between ranks.
+
+    Args:
+        samples: Measurements (need not be sorted)
+        q: Percentile in [0, 100]
+
+    Returns:
+        The percentile, or 0.0 if there are no samples
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * q / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def latency_summary(seconds: list[float]) -> dict[str, float]:
+    """
+    Summarize latencies in milliseconds.
+
+    Args:
+        seconds: Per-operation latencies in seconds
+
+    Returns:
+        mean, p50, p95, p99 and max in milliseconds
+    """
+    ms = [value * 1000 for value in seconds]
+    return {
+        "mean": round(sum(ms) / len(ms), 3) if ms else 0.0,
+        "p50": round(percentile(ms, 50), 3),
+        "p95": round(percentile(ms, 95), 3),
+        "p99": round(percentile(ms, 99), 3),
+        "max": round(max(ms), 3) if ms else 0.0,
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(path: str, suite: str, results: list[BenchmarkResult]) -> None:
+    """
+    Write results as JSON so runs can be compared across commits.
+
+    Args:
+        path: Output file path
+        suite: Benchmark suite name
+        results: Benchmark results
+    """
+    report = {
+        "suite": suite,
+        "git_revision": _git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "results": [result.to_dict() for result in results],
+    }
+    with open(path, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2)
+
+
+def print_results(results: list[BenchmarkResult]) -> None:
+    """Print a human-readable summary table."""
+    for result in results:
+        line = (
+            f"{result.name:<32} {result.operations:>8} ops "
+            f"{result.duration_seconds:>8.3f}s {result.ops_per_second:>12.1f} ops/s"
+        )
+        latency = result.extra.get("latency_ms")
+        if latency:
+            line += (
+                f"  p50 {latency['p50']:>8.2f}ms  p95 {latency['p95']:>8.2f}ms"
+                f"  p99 {latency['p99']:>8.2f}ms"
+            )
+        print(line)
@@ -0,0 +1,115 @@
+"""
+Token minting throughput benchmark.
+
+Compares the ``api.AccessToken`` builder chain (previous per-request path) with
+``TokenSigner`` single and batch issuance.
+
+Usage:
+    python -m benchmarks.token_minting --count 20000 --batch-size 100 --output tokens.json
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from livekit import api
+
+from benchmarks.common import BenchmarkResult, print_results, write_results
+from fancall.services.livekit_service import LiveKitService
+from fancall.services.token_signer import TokenGrant, TokenSigner
+from fancall.settings import LiveKitSettings
+
+API_KEY = "devkey"
+API_SECRET = "benchmark-secret-with-at-least-32-bytes"
+
+
+def _measure(name: str, operations: int, body: Callable[[], None]) -> BenchmarkResult:
+    start = time.perf_counter()
+    body()
+    return BenchmarkResult(name, operations, time.perf_counter() - start)
+
+
+def _builder_chain(grants: list[TokenGrant]) -> None:
+    for grant in grants:
+        (
+            api.AccessToken(API_KEY, API_SECRET)
+            .with_identity(grant.identity)
+            .with_name(grant.name)
+            .with_grants(
+                api.VideoGrants(
+                    room_join=True,
+                    room=grant.room_name,
+                    can_publish=True,
+                    can_subscribe=True,
+                )
+            )
+            .to_jwt()
+        )
+
+
+def run(count: int, batch_size: int) -> list[BenchmarkResult]:
+    """
+    Run all token minting cases.
+
+    Args:
+        count: Tokens minted per case
+        batch_size: Grants per batch in the batch case
+
+    Returns:
+        Benchmark results
+    """
+    grants = [
+        TokenGrant(f"user-{i}", f"Fan {i}", f"room-{i % 50}") for i in range(count)
+    ]
+    signer = TokenSigner(API_KEY, API_SECRET)
+    service = LiveKitService(
+        LiveKitSettings(
+            url="ws://localhost:7880", api_key=API_KEY, api_secret=API_SECRET
+        )
+    )
+
+    def single() -> None:
+        for grant in grants:
+            signer.sign(grant)
+
+    def service_single() -> None:
+        for grant in grants:
+            service.generate_token(grant.identity, grant.name, grant.room_name)
+
+    batches = [grants[i : i + batch_size] for i in range(0, count, batch_size)]
+
+    def batch() -> None:
+        for chunk in batches:
+            signer.sign_many(chunk)
+
+    def service_batch() -> None:
+        for chunk in batches:
+            service.generate_tokens(chunk)
+
+    return [
+        _measure("access_token_builder", count, lambda: _builder_chain(grants)),
+        _measure("token_signer_single", count, single),
+        _measure("livekit_service_single", count, service_single),
+        _measure(f"token_signer_batch_{batch_size}", count, batch),
+        _measure(f"livekit_service_batch_{batch_size}", count, service_batch),
+    ]
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").split("\n\n", maxsplit=1)[0]
+    )
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    results = run(args.count, args.batch_size)
+    print_results(results)
+    if args.output:
+        write_results(args.output, "token_minting", results)
+
+
+if __name__ == "__main__":
+    main()
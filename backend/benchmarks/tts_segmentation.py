@@ -0,0 +1,204 @@
+"""
+LLM-to-TTS segmentation benchmark.
+
+Streams persona-style replies (mixed Korean/English, ``*action*`` markup) from
+``FakeLLM`` through the session's text transforms into ``FakeTTS`` and measures
+time to first audio from the LLM request, once per segmenter:
+
+- ``provider``: raw text streamed to the TTS, which buffers it server-side like
+  Fish Audio (``PluginTiming.tts_stream_chunk_chars``).
+- ``mixed``: ``MixedSentenceTokenizer`` segments, synthesized one by one.
+
+Usage:
+    python -m benchmarks.tts_segmentation --repeat 3 --output segmentation.json
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from typing import Any, get_args
+
+from livekit.agents import llm
+from livekit.agents.voice.transcription.filters import (
+    TextTransforms,
+    apply_text_transforms,
+)
+
+from benchmarks.common import (
+    BenchmarkResult,
+    latency_summary,
+    print_results,
+    write_results,
+)
+from fancall.agent.segmentation import (
+    SEGMENTED_TEXT_TRANSFORMS,
+    create_sentence_tokenizer,
+    segment_tts,
+)
+from fancall.settings import TtsSegmentationSettings, TtsSegmenter
+from fancall.testing.agent_plugins import FakeLLM, FakeTTS, PluginTiming
+
+# AgentSession's default tts_text_transforms
+DEFAULT_TEXT_TRANSFORMS: tuple[TextTransforms, ...] = (
+    "filter_markdown",
+    "filter_emoji",
+)
+
+REPLIES = [
+    "Oh, hi.",
+    "*blushes* 와줘서 고마워요.",
+    "응. I was waiting for you, honestly.",
+    "오늘 공연 봤어요? *looks away* I was a bit nervous, but it went well. "
+    "다음에는 더 잘할게요.",
+    "Dr. Kim says I practice too much. 3.5 hours a day is normal for us, though. "
+    "그래도 팬들이 좋아해 주면 힘이 나요!",
+    "I wasn't worried about you. 그냥... 심심해서 물어본 거예요. *scratches head* "
+    "Anyway, did you eat dinner? 밥은 꼭 챙겨 먹어요. 제 말 들어요, 알았죠?",
+]
+
+
+class CountingTTS(FakeTTS):
+    """FakeTTS counting synthesis requests"""
+
+    def __init__(self, timing: PluginTiming):
+        super().__init__(timing)
+        self.requests = 0
+
+    def synthesize(self, text: str, **kwargs: Any) -> Any:
+        self.requests += 1
+        return super().synthesize(text, **kwargs)
+
+    def stream(self, **kwargs: Any) -> Any:
+        self.requests += 1
+        return super().stream(**kwargs)
+
+
+async def _llm_text(reply: str, timing: PluginTiming) -> AsyncIterator[str]:
+    async with FakeLLM(timing, reply=reply).chat(
+        chat_ctx=llm.ChatContext.empty()
+    ) as stream:
+        async for chunk in stream:
+            if chunk.delta and chunk.delta.content:
+                yield chunk.delta.content
+
+
+async def speak_reply(
+    reply: str, timing: PluginTiming, settings: TtsSegmentationSettings
+) -> tuple[float, float, int]:
+    """
+    Stream one reply from the LLM to the TTS.
+
+    Args:
+        reply: Reply the fake LLM streams
+        timing: Simulated service timing
+        settings: Segmentation settings
+
+    Returns:
+        Seconds to first audio, seconds to last audio, TTS requests
+    """
+    tokenizer = create_sentence_tokenizer(settings)
+    provider_tts = CountingTTS(timing)
+    session_tts = segment_tts(provider_tts, tokenizer)
+    transforms: tuple[TextTransforms, ...] = (
+        SEGMENTED_TEXT_TRANSFORMS if tokenizer else DEFAULT_TEXT_TRANSFORMS
+    )
+    start = time.monotonic()
+    first_audio: float | None = None
+
+    async with session_tts.stream() as tts_stream:
+
+        async def forward() -> None:
+            text = apply_text_transforms(_llm_text(reply, timing), transforms)
+            async for chunk in text:
+                tts_stream.push_text(chunk)
+            tts_stream.end_input()
+
+        forward_task = asyncio.create_task(forward())
+        async for _ in tts_stream:
+            if first_audio is None:
+                first_audio = time.monotonic() - start
+        await forward_task
+
+    last_audio = time.monotonic() - start
+    return first_audio or last_audio, last_audio, provider_tts.requests
+
+
+async def run(
+    segmenters: list[TtsSegmenter], repeat: int, timing: PluginTiming
+) -> list[BenchmarkResult]:
+    """
+    Speak every reply ``repeat`` times with each segmenter.
+
+    Args:
+        segmenters: ``TtsSegmentationSettings.segmenter`` values to compare
+        repeat: Runs per reply
+        timing: Simulated service timing
+
+    Returns:
+        Benchmark results; ``latency_ms`` is time to first audio
+    """
+    results = []
+    for segmenter in segmenters:
+        settings = TtsSegmentationSettings(segmenter=segmenter)
+        start = time.monotonic()
+        # Replies are independent, so they run concurrently
+        samples = await asyncio.gather(
+            *[
+                speak_reply(reply, timing, settings)
+                for reply in REPLIES
+                for _ in range(repeat)
+            ]
+        )
+        results.append(
+            BenchmarkResult(
+                segmenter,
+                len(samples),
+                time.monotonic() - start,
+                extra={
+                    "latency_ms": latency_summary([s[0] for s in samples]),
+                    "last_audio_ms": latency_summary([s[1] for s in samples]),
+                    "tts_requests_per_reply": round(
+                        sum(s[2] for s in samples) / len(samples), 2
+                    ),
+                },
+            )
+        )
+    return results
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").split("\n\n", maxsplit=1)[0]
+    )
+    parser.add_argument(
+        "--segmenters",
+        nargs="+",
+        choices=get_args(TtsSegmenter),
+        default=["provider", "mixed"],
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--llm-ttft", type=float, default=PluginTiming.llm_ttft)
+    parser.add_argument("--tts-ttfb", type=float, default=PluginTiming.tts_ttfb)
+    parser.add_argument(
+        "--tts-stream-chunk-chars",
+        type=int,
+        default=PluginTiming.tts_stream_chunk_chars,
+    )
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    timing = PluginTiming(
+        llm_ttft=args.llm_ttft,
+        tts_ttfb=args.tts_ttfb,
+        tts_stream_chunk_chars=args.tts_stream_chunk_chars,
+    )
+    results = asyncio.run(run(args.segmenters, args.repeat, timing))
+    print_results(results)
+    if args.output:
+        write_results(args.output, "tts_segmentation", results)
+
+
+if __name__ == "__main__":
+    main()
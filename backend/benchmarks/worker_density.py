@@ -0,0 +1,416 @@
+"""
+Agent worker job-density harness.
+
+Runs N simulated jobs through the real ``entrypoint`` concurrently on one event
+loop, with ``FakeLLM``, ``FakeTTS`` and ``FakeAvatarSession`` in place of the
+OpenAI, Fish Audio and Hedra plugins. For each N it reports setup latency, time
+to the join greeting, time to first audio per turn, event-loop lag, audio
+underruns, CPU and RSS per job.
+
+All jobs share one process here, so the results show what a single job costs
+and at which N one event loop starts to glitch. With LiveKit's process executor
+every job has its own process, so host capacity is roughly the number of cores
+divided by the CPU share of one job, bounded by memory.
+
+Usage:
+    python -m benchmarks.worker_density --jobs 1 5 10 20 --turns 3 --output density.json
+"""
+
+import argparse
+import asyncio
+import contextvars
+import inspect
+import logging
+import resource
+import shutil
+import tempfile
+import time
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import psutil
+from aioia_core.settings import (
+    DatabaseSettings,
+    FishAudioSettings,
+    HedraSettings,
+    OpenAIAPISettings,
+)
+from livekit import rtc
+from livekit.agents import AgentSession
+from livekit.plugins import hedra
+
+from benchmarks.common import (
+    BenchmarkResult,
+    latency_summary,
+    print_results,
+    write_results,
+)
+from fancall.agent.prewarm import WORKER_RESOURCES_KEY, WorkerResources
+from fancall.agent.worker import entrypoint
+from fancall.persona import DEFAULT_PERSONA
+from fancall.settings import (
+    AgentTelemetrySettings,
+    AssetHttpSettings,
+    AvatarCacheSettings,
+    ConversationMemorySettings,
+    FancallModelSettings,
+    LiveKitSettings,
+    PersonaCacheSettings,
+    SessionLifetimeSettings,
+    TtsCacheSettings,
+    TtsSegmentationSettings,
+)
+from fancall.testing.agent_plugins import (
+    FakeAvatarAudioOutput,
+    FakeAvatarSession,
+    FakeLLM,
+    FakeTTS,
+    PluginTiming,
+)
+
+LAG_INTERVAL = 0.01
+GREETING_TIMEOUT = 5.0
+USER_INPUT = "Hi! How was your day?"
+
+# Avatars created by the current job (each job task runs in its own context)
+_job_avatars: contextvars.ContextVar[list[FakeAvatarSession]] = contextvars.ContextVar(
+    "job_avatars"
+)
+
+
+def _create_avatar(timing: PluginTiming, **kwargs: Any) -> FakeAvatarSession:
+    """Stand-in for ``hedra.AvatarSession`` recording the avatar on its job"""
+    avatar = FakeAvatarSession(timing=timing, **kwargs)
+    _job_avatars.get().append(avatar)
+    return avatar
+
+
+class SimulatedWorkerResources(WorkerResources):
+    """Worker resources handing out the fake LLM and TTS"""
+
+    def __init__(self, timing: PluginTiming):
+        super().__init__(
+            default_persona=DEFAULT_PERSONA,
+            fish_settings=FishAudioSettings(),
+            model_settings=FancallModelSettings(),
+            avatar_cache_settings=AvatarCacheSettings(),
+            asset_http_settings=AssetHttpSettings(),
+            tts_cache_settings=TtsCacheSettings(),
+            segmentation_settings=TtsSegmentationSettings(),
+            persona_cache_settings=PersonaCacheSettings(),
+            database_settings=DatabaseSettings(),
+        )
+        self.timing = timing
+
+    def create_llm(self) -> Any:
+        return FakeLLM(self.timing)
+
+    def create_tts(self, voice_id: str | None) -> Any:
+        return self.wrap_tts(FakeTTS(self.timing), voice_id)
+
+
+class SimulatedRoom(rtc.Room):
+    """Unconnected room carrying the job's room name"""
+
+    def __init__(self, room_name: str):
+        super().__init__()
+        self._simulated_name = room_name
+
+    @property
+    def name(self) -> str:
+        return self._simulated_name
+
+
+class SimulatedJobContext:
+    """The parts of ``JobContext`` the entrypoint uses"""
+
+    def __init__(
+        self, job_id: str, metadata: str, resources: WorkerResources, connect: float
+    ):
+        self.room = SimulatedRoom(f"room-{job_id}")
+        self.job = SimpleNamespace(id=job_id, metadata=metadata, agent_name="fancall")
+        self.proc = SimpleNamespace(userdata={WORKER_RESOURCES_KEY: resources})
+        self.shutdown_reason: str | None = None
+        self._connect = connect
+        self._callbacks: list[Callable[..., Coroutine[Any, Any, None]]] = []
+
+    async def connect(self) -> None:
+        """Simulate the room connection"""
+        await asyncio.sleep(self._connect)
+
+    def shutdown(self, reason: str = "") -> None:
+        """Record an entrypoint-requested shutdown"""
+        self.shutdown_reason = reason
+
+    def add_shutdown_callback(
+        self, callback: Callable[..., Coroutine[Any, Any, None]]
+    ) -> None:
+        """Register a shutdown callback (with or without the reason argument)"""
+        self._callbacks.append(callback)
+
+    async def run_shutdown_callbacks(self, reason: str) -> None:
+        """Run shutdown callbacks like LiveKit does at job end"""
+        for callback in self._callbacks:
+            if inspect.signature(callback).parameters:
+                await callback(reason)
+            else:
+                await callback()
+
+
+@dataclass
+class LevelSamples:
+    """Measurements collected while running one job count"""
+
+    setup: list[float] = field(default_factory=list)
+    greeting: list[float] = field(default_factory=list)
+    first_audio: list[float] = field(default_factory=list)
+    lag: list[float] = field(default_factory=list)
+    underruns: int = 0
+    failed: int = 0
+    peak_rss: int = 0
+
+
+async def _wait_ready(session: AgentSession) -> None:
+    ready = asyncio.Event()
+    session.on("agent_state_changed", lambda _ev: ready.set())
+    if session.agent_state != "initializing":
+        return
+    await ready.wait()
+
+
+async def _wait_greeting(
+    session: AgentSession, audio_output: FakeAvatarAudioOutput
+) -> float | None:
+    """Wait for the join greeting to play out; return when its audio started."""
+    deadline = time.monotonic() + GREETING_TIMEOUT
+    while audio_output.first_frame_at is None and time.monotonic() < deadline:
+        await asyncio.sleep(LAG_INTERVAL)
+    if session.current_speech is not None:
+        await session.current_speech.wait_for_playout()
+    return audio_output.first_frame_at
+
+
+async def run_job(
+    index: int,
+    resources: WorkerResources,
+    telemetry_settings: AgentTelemetrySettings,
+    turns: int,
+    samples: LevelSamples,
+) -> None:
+    """
+    Run one simulated job: setup, ``turns`` replies, then shutdown.
+
+    Args:
+        index: Job number, used for job and room names
+        resources: Shared worker resources with fake plugins
+        telemetry_settings: Telemetry settings (session timelines)
+        turns: Replies generated after setup
+        samples: Collector of the level's measurements
+    """
+    avatars: list[FakeAvatarSession] = []
+    _job_avatars.set(avatars)
+    ctx = SimulatedJobContext(
+        f"job-{index}", '{"avatarId": "fake-avatar"}', resources, connect=0.05
+    )
+    start = time.monotonic()
+    job = asyncio.create_task(
+        entrypoint(
+            ctx,  # type: ignore[arg-type]
+            default_persona=DEFAULT_PERSONA,
+            livekit_settings=LiveKitSettings(),
+            openai_settings=OpenAIAPISettings(),
+            hedra_settings=HedraSettings(enabled=True, api_key="fake"),
+            telemetry_settings=telemetry_settings,
+            lifetime_settings=SessionLifetimeSettings(),
+            memory_settings=ConversationMemorySettings(),
+        )
+    )
+    while not avatars or avatars[0].agent_session is None:
+        if job.done():
+            samples.failed += 1
+            await job
+            return
+        await asyncio.sleep(LAG_INTERVAL)
+    avatar = avatars[0]
+    session = avatar.agent_session
+    assert session is not None and avatar.audio_output is not None
+    await _wait_ready(session)
+    samples.setup.append(time.monotonic() - start)
+
+    try:
+        greeting_at = await _wait_greeting(session, avatar.audio_output)
+        if greeting_at is not None:
+            samples.greeting.append(greeting_at - start)
+        for _ in range(turns):
+            avatar.audio_output.first_frame_at = None
+            turn_start = time.monotonic()
+            await session.generate_reply(user_input=USER_INPUT)
+            if avatar.audio_output.first_frame_at is not None:
+                samples.first_audio.append(
+                    avatar.audio_output.first_frame_at - turn_start
+                )
+    finally:
+        samples.underruns += avatar.audio_output.underruns
+        job.cancel()
+        await asyncio.gather(job, return_exceptions=True)
+        await ctx.run_shutdown_callbacks("benchmark finished")
+        await session.aclose()
+
+
+async def _monitor(samples: LevelSamples, stop: asyncio.Event) -> None:
+    process = psutil.Process()
+    expected = time.monotonic() + LAG_INTERVAL
+    while not stop.is_set():
+        await asyncio.sleep(LAG_INTERVAL)
+        now = time.monotonic()
+        samples.lag.append(max(now - expected, 0.0))
+        expected = now + LAG_INTERVAL
+        samples.peak_rss = max(samples.peak_rss, process.memory_info().rss)
+
+
+def _cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+async def run_level(
+    jobs: int,
+    turns: int,
+    timing: PluginTiming,
+    telemetry_settings: AgentTelemetrySettings,
+) -> BenchmarkResult:
+    """
+    Run ``jobs`` simulated jobs concurrently and summarize their cost.
+
+    Args:
+        jobs: Concurrent jobs
+        turns: Replies per job
+        timing: Simulated service timing
+        telemetry_settings: Telemetry settings (session timelines)
+
+    Returns:
+        Result with setup, first-audio and loop-lag percentiles, underruns,
+        CPU and RSS per job
+    """
+    resources = SimulatedWorkerResources(timing)
+    resources.warm_up()
+    samples = LevelSamples()
+    baseline_rss = psutil.Process().memory_info().rss
+    samples.peak_rss = baseline_rss
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_monitor(samples, stop))
+
+    cpu_start = _cpu_seconds()
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            run_job(i, resources, telemetry_settings, turns, samples)
+            for i in range(jobs)
+        )
+    )
+    duration = time.perf_counter() - start
+    cpu = _cpu_seconds() - cpu_start
+    stop.set()
+    await monitor
+
+    return BenchmarkResult(
+        f"jobs_{jobs}",
+        jobs - samples.failed,
+        duration,
+        extra={
+            "jobs": jobs,
+            "turns": turns,
+            "failed": samples.failed,
+            "setup_ms": latency_summary(samples.setup),
+            "greeting_ms": latency_summary(samples.greeting),
+            "first_audio_ms": latency_summary(samples.first_audio),
+            "loop_lag_ms": latency_summary(samples.lag),
+            "underruns_per_job": round(samples.underruns / jobs, 2),
+            "cpu_percent": round(100 * cpu / duration, 1),
+            "cpu_seconds_per_job": round(cpu / jobs, 3),
+            "rss_mb_per_job": round(
+                (samples.peak_rss - baseline_rss) / jobs / 2**20, 2
+            ),
+            "peak_rss_mb": round(samples.peak_rss / 2**20, 1),
+        },
+    )
+
+
+async def run(
+    job_counts: list[int], turns: int, timing: PluginTiming, timeline_dir: str
+) -> list[BenchmarkResult]:
+    """
+    Run every job count in turn, with ``hedra.AvatarSession`` replaced.
+
+    Args:
+        job_counts: Concurrent job counts
+        turns: Replies per job
+        timing: Simulated service timing
+        timeline_dir: Directory for session timeline records
+
+    Returns:
+        Benchmark results
+    """
+    results = []
+    with patch.object(hedra, "AvatarSession", partial(_create_avatar, timing)):
+        for jobs in job_counts:
+            telemetry_settings = AgentTelemetrySettings(
+                timeline_path=str(Path(timeline_dir) / f"jobs_{jobs}.jsonl")
+            )
+            results.append(await run_level(jobs, turns, timing, telemetry_settings))
+    return results
+
+
+def _print_density(results: list[BenchmarkResult]) -> None:
+    for result in results:
+        extra = result.extra
+        print(
+            f"{result.name:<10} setup p95 {extra['setup_ms']['p95']:>8.1f}ms"
+            f"  greeting p95 {extra['greeting_ms']['p95']:>8.1f}ms"
+            f"  first audio p95 {extra['first_audio_ms']['p95']:>8.1f}ms"
+            f"  loop lag p99 {extra['loop_lag_ms']['p99']:>7.1f}ms"
+            f"  underruns/job {extra['underruns_per_job']:>5}"
+            f"  cpu {extra['cpu_percent']:>5.1f}%"
+            f"  rss/job {extra['rss_mb_per_job']:>6.2f}MB"
+        )
+
+
+def main() -> None:
+    """Run the harness from the command line."""
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").split("\n\n", maxsplit=1)[0]
+    )
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 5, 10, 20])
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--llm-ttft", type=float, default=PluginTiming.llm_ttft)
+    parser.add_argument("--tts-ttfb", type=float, default=PluginTiming.tts_ttfb)
+    parser.add_argument("--avatar-start", type=float, default=PluginTiming.avatar_start)
+    parser.add_argument("--timeline-dir", help="Keep session timelines here")
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    # The entrypoint logs every job step at INFO
+    logging.getLogger().setLevel(logging.WARNING)
+    timing = PluginTiming(
+        llm_ttft=args.llm_ttft, tts_ttfb=args.tts_ttfb, avatar_start=args.avatar_start
+    )
+    timeline_dir = args.timeline_dir or tempfile.mkdtemp()
+    Path(timeline_dir).mkdir(parents=True, exist_ok=True)
+    try:
+        results = asyncio.run(run(args.jobs, args.turns, timing, timeline_dir))
+    finally:
+        if not args.timeline_dir:
+            shutil.rmtree(timeline_dir, ignore_errors=True)
+    print_results(results)
+    _print_density(results)
+    if args.output:
+        write_results(args.output, "worker_density", results)
+
+
+if __name__ == "__main__":
+    main()
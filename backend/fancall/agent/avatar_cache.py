@@ -0,0 +1,218 @@
+"""
+Avatar image cache for the Fancall agent worker.
+
+Normalized (RGB, downscaled) avatar images are cached per process, keyed by the
+digest of the profile picture URL or data URL, so repeated jobs for the same
+persona skip both the network fetch and the image decode. Decoding and disk I/O
+run on the bounded thread pool of ``AvatarImagePipeline``.
+
+Tiers:
+    - Memory: LRU bounded by a byte budget of decoded pixels.
+    - Disk (optional): normalized PNGs plus validator metadata. In process-per-job
+      mode this is the tier that carries images across jobs.
+
+HTTP(S) entries older than ``revalidate_after_seconds`` are revalidated with
+``If-None-Match`` / ``If-Modified-Since``; a 304 reuses the cached image.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+
+import httpx
+from PIL import Image
+
+from fancall.agent.http_client import AssetHttpClient
+from fancall.agent.image_pipeline import AvatarImagePipeline, timed
+from fancall.agent.lru import ByteBudgetLRU
+from fancall.settings import AvatarCacheSettings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedAvatar:
+    """Normalized avatar image with its HTTP validators"""
+
+    image: Image.Image
+    etag: str | None = None
+    last_modified: str | None = None
+    validated_at: float = 0.0
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate in-memory size of the decoded pixels"""
+        return self.image.width * self.image.height * len(self.image.getbands())
+
+
+class AvatarImageCache:
+    """Process-wide, content-addressed cache of normalized avatar images"""
+
+    def __init__(self, settings: AvatarCacheSettings):
+        """
+        Initialize the avatar image cache.
+
+        Args:
+            settings: Avatar cache settings (memory budget, disk tier, revalidation)
+        """
+        self.settings = settings
+        # Decoding, hashing and disk I/O run here, never on the event loop
+        self.pipeline = AvatarImagePipeline(settings)
+        self._memory: ByteBudgetLRU[CachedAvatar] = ByteBudgetLRU(
+            settings.memory_budget_bytes
+        )
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes currently held by the memory tier"""
+        return self._memory.size_bytes
+
+    async def get_image(
+        self,
+        url: str,
+        http_client: AssetHttpClient,
+        timings: dict[str, float] | None = None,
+    ) -> Image.Image:
+        """
+        Return the normalized avatar image for a URL, fetching it only when needed.
+
+        Args:
+            url: HTTP(S) URL or base64 image data URL
+            http_client: Shared asset HTTP client for fetches and revalidation
+            timings: Optional dict receiving the seconds spent per pipeline stage
+                (queue, hash, disk_read, fetch, base64, validate, decode, resize,
+                disk_write)
+
+        Returns:
+            RGB avatar image, at most ``target_size`` on its longest side
+            (shared; callers must not mutate it)
+
+        Raises:
+            ValueError: If a data URL is malformed, the image exceeds the size
+                limits or cannot be decoded
+            httpx.HTTPError: If fetching an HTTP(S) URL fails
+        """
+        timings = {} if timings is None else timings
+        key = await self.pipeline.cache_key(url, timings)
+        is_data_url = url.startswith("data:")
+
+        entry = self._memory.get(key)
+        if entry is None and self.settings.disk_dir:
+            entry = await self.pipeline.run(
+                "disk_read", timings, self._load_from_disk, key
+            )
+            if entry is not None:
+                self._memory.put(key, entry)
+
+        if entry is not None and (is_data_url or self._is_fresh(entry)):
+            self.hits += 1
+            return entry.image
+
+        stale = entry
+        if is_data_url:
+            self.misses += 1
+            entry = CachedAvatar(
+                image=await self.pipeline.decode_data_url(url, timings)
+            )
+        else:
+            entry = await self._fetch(url, http_client, stale, timings)
+
+        self._memory.put(key, entry)
+        if self.settings.disk_dir:
+            await self.pipeline.run(
+                "disk_write",
+                timings,
+                self._save_to_disk,
+                key,
+                entry,
+                entry is not stale,
+            )
+        return entry.image
+
+    def _is_fresh(self, entry: CachedAvatar) -> bool:
+        age = time.time() - entry.validated_at
+        return age < self.settings.revalidate_after_seconds
+
+    async def _fetch(
+        self,
+        url: str,
+        http_client: AssetHttpClient,
+        stale: CachedAvatar | None,
+        timings: dict[str, float],
+    ) -> CachedAvatar:
+        headers = {}
+        if stale is not None:
+            if stale.etag:
+                headers["If-None-Match"] = stale.etag
+            if stale.last_modified:
+                headers["If-Modified-Since"] = stale.last_modified
+
+        with timed(timings, "fetch"):
+            response = await http_client.fetch(url, headers=headers)
+        if stale is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            self.revalidations += 1
+            stale.validated_at = time.time()
+            return stale
+
+        self.misses += 1
+        return CachedAvatar(
+            image=await self.pipeline.decode_bytes(response.content, timings),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            validated_at=time.time(),
+        )
+
+    # Disk tier
+
+    def _disk_paths(self, key: str) -> tuple[str, str]:
+        assert self.settings.disk_dir, "disk tier is disabled"
+        base = os.path.join(self.settings.disk_dir, key)
+        return f"{base}.png", f"{base}.json"
+
+    def _load_from_disk(self, key: str) -> CachedAvatar | None:
+        image_path, meta_path = self._disk_paths(key)
+        try:
+            with open(meta_path, encoding="utf-8") as meta_file:
+                meta = json.load(meta_file)
+            with Image.open(image_path) as image:
+                image.load()
+                return CachedAvatar(
+                    image=image.convert("RGB"),
+                    etag=meta.get("etag"),
+                    last_modified=meta.get("last_modified"),
+                    validated_at=meta.get("validated_at", 0.0),
+                )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable avatar cache entry %s: %s", key, e)
+            return None
+
+    def _save_to_disk(self, key: str, entry: CachedAvatar, write_image: bool) -> None:
+        assert self.settings.disk_dir, "disk tier is disabled"
+        image_path, meta_path = self._disk_paths(key)
+        meta = {
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "validated_at": entry.validated_at,
+        }
+        try:
+            os.makedirs(self.settings.disk_dir, exist_ok=True)
+            if write_image:
+                # Write then rename so concurrent readers never see a partial file
+                tmp_image_path = f"{image_path}.{os.getpid()}.tmp"
+                entry.image.save(tmp_image_path, format="PNG")
+                os.replace(tmp_image_path, image_path)
+            tmp_meta_path = f"{meta_path}.{os.getpid()}.tmp"
+            with open(tmp_meta_path, "w", encoding="utf-8") as meta_file:
+                json.dump(meta, meta_file)
+            os.replace(tmp_meta_path, meta_path)
+        except OSError as e:
+            logger.warning("Failed to persist avatar cache entry %s: %s", key, e)
@@ -0,0 +1,94 @@
+"""
+Pre-synthesized greetings played the moment the agent joins a call.
+
+A persona's greetings are synthesized ahead of time with the persona's voice:
+the default persona's in the prewarm stage, dispatched personas' while the job
+connects and starts the avatar. With the TTS cache enabled the audio is stored
+per voice ID, so later jobs replay it without calling the TTS provider.
+"""
+
+import asyncio
+import logging
+import random
+from collections.abc import AsyncIterator, Sequence
+
+from livekit import rtc
+from livekit.agents import tts
+
+logger = logging.getLogger(__name__)
+
+
+def pick_greeting(greetings: Sequence[str] | None) -> str | None:
+    """Pick one of a persona's greetings at random (None if it has none)."""
+    candidates = [greeting for greeting in greetings or [] if greeting.strip()]
+    return random.choice(candidates) if candidates else None
+
+
+async def synthesize_greeting(
+    greeting_tts: tts.TTS, greeting: str
+) -> list[rtc.AudioFrame]:
+    """
+    Synthesize a greeting (served from the TTS cache when already synthesized).
+
+    Args:
+        greeting_tts: TTS speaking with the persona's voice
+        greeting: Greeting text
+
+    Returns:
+        Audio frames of the greeting
+    """
+    async with greeting_tts.synthesize(greeting) as stream:
+        return [audio.frame async for audio in stream]
+
+
+async def presynthesize_greetings(
+    greeting_tts: tts.TTS, greetings: Sequence[str]
+) -> None:
+    """
+    Synthesize all greetings of a persona so they are cached for later jobs.
+
+    Failures are logged; the greeting is then synthesized again in the job.
+
+    Args:
+        greeting_tts: Cached TTS speaking with the persona's voice
+        greetings: Greeting texts
+    """
+    for greeting in greetings:
+        try:
+            await synthesize_greeting(greeting_tts, greeting)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Failed to pre-synthesize greeting %r: %s", greeting, e)
+
+
+class PendingGreeting:
+    """Greeting whose audio is being synthesized while the job starts up"""
+
+    def __init__(self, greeting_tts: tts.TTS, text: str):
+        """
+        Start synthesizing a greeting in the background.
+
+        Args:
+            greeting_tts: TTS speaking with the persona's voice
+            text: Greeting text
+        """
+        self.text = text
+        self._task = asyncio.create_task(synthesize_greeting(greeting_tts, text))
+
+    async def frames(self) -> list[rtc.AudioFrame] | None:
+        """Wait for the greeting audio; None if synthesis failed."""
+        try:
+            return await self._task
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Failed to synthesize greeting: %s", e)
+            return None
+
+    async def aclose(self) -> None:
+        """Stop synthesis if it is still running (e.g. the job shut down early)."""
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+
+async def replay(frames: list[rtc.AudioFrame]) -> AsyncIterator[rtc.AudioFrame]:
+    """Yield synthesized frames as the audio source of ``AgentSession.say``."""
+    for frame in frames:
+        yield frame
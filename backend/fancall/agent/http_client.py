@@ -0,0 +1,129 @@
+"""
+Shared HTTP client for worker-side asset fetches.
+
+One pooled ``httpx.AsyncClient`` (keep-alive, optional HTTP/2, strict timeouts)
+is kept per worker process and event loop, and downloads are streamed with a
+hard byte limit so a slow or oversized asset cannot stall or bloat a job.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from dataclasses import dataclass
+
+import httpx
+
+from fancall.settings import AssetHttpSettings
+
+logger = logging.getLogger(__name__)
+
+
+class AssetTooLargeError(ValueError):
+    """Raised when an asset download exceeds the configured byte limit"""
+
+
+@dataclass
+class FetchedAsset:
+    """Fully read (bounded) HTTP response"""
+
+    status_code: int
+    headers: httpx.Headers
+    content: bytes
+
+
+class AssetHttpClient:
+    """Pooled, bounded HTTP client shared by all jobs of a worker process"""
+
+    def __init__(
+        self,
+        settings: AssetHttpSettings,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Initialize the asset HTTP client.
+
+        Args:
+            settings: Timeouts, pool limits, HTTP/2 and size limit
+            transport: Optional transport override (e.g. ``httpx.MockTransport`` in tests)
+        """
+        self.settings = settings
+        self._transport = transport
+        # httpx pools are bound to the event loop they were first used on; in the
+        # thread executor (dev mode) every job runs its own loop
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled client for the running event loop, created on first use"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._create_client()
+            self._clients[loop] = client
+        return client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        settings = self.settings
+        return httpx.AsyncClient(
+            http2=settings.http2,
+            transport=self._transport,
+            timeout=httpx.Timeout(
+                connect=settings.connect_timeout,
+                read=settings.read_timeout,
+                write=settings.read_timeout,
+                pool=settings.connect_timeout,
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+            follow_redirects=True,
+        )
+
+    async def fetch(
+        self, url: str, headers: dict[str, str] | None = None
+    ) -> FetchedAsset:
+        """
+        GET an asset, streaming the body with the configured byte limit.
+
+        Args:
+            url: HTTP(S) URL to fetch
+            headers: Optional request headers (e.g. conditional validators)
+
+        Returns:
+            FetchedAsset with status, headers and body (empty for 304)
+
+        Raises:
+            AssetTooLargeError: If the body exceeds ``max_bytes``
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        max_bytes = self.settings.max_bytes
+        async with self.client.stream("GET", url, headers=headers) as response:
+            if response.status_code == httpx.codes.NOT_MODIFIED:
+                return FetchedAsset(response.status_code, response.headers, b"")
+            response.raise_for_status()
+
+            content_length = response.headers.get("Content-Length")
+            if content_length and int(content_length) > max_bytes:
+                raise AssetTooLargeError(
+                    f"Asset exceeds {max_bytes} bytes (Content-Length: {content_length})"
+                )
+
+            chunks = bytearray()
+            async for chunk in response.aiter_bytes():
+                chunks.extend(chunk)
+                if len(chunks) > max_bytes:
+                    raise AssetTooLargeError(f"Asset exceeds {max_bytes} bytes")
+            return FetchedAsset(response.status_code, response.headers, bytes(chunks))
+
+    async def aclose(self) -> None:
+        """Close the pooled client of the running event loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+            logger.debug("Closed asset HTTP client")
@@ -0,0 +1,286 @@
+"""
+Avatar image decode pipeline for the Fancall agent worker.
+
+Decoding a profile picture (base64, image decode, RGB conversion, downscaling)
+takes from milliseconds to seconds of CPU for large pictures. The event loop of
+a worker process also carries live audio, so every stage runs on a small,
+bounded thread pool instead, with hard limits applied before the expensive work:
+
+- ``max_input_bytes`` bounds the encoded image (data URL payload or download),
+  checked on the data URL length before anything is hashed or decoded.
+- ``max_pixels`` bounds the pixel count, read from the image header before the
+  pixels are decoded.
+- Images are downscaled to ``target_size`` (longest side); JPEGs are decoded at
+  a reduced scale directly (``Image.draft``).
+
+Each stage's duration is observed into a Prometheus histogram and returned to
+the caller for the session timeline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import io
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TypeVar
+
+from PIL import Image
+from prometheus_client import Histogram
+
+from fancall.agent.timeline import STAGE_BUCKETS
+from fancall.settings import AvatarCacheSettings
+
+ResultT = TypeVar("ResultT")
+
+AVATAR_IMAGE_STAGE_DURATION = Histogram(
+    "fancall_avatar_image_stage_seconds",
+    "Duration of avatar image pipeline stages (queue, base64, validate, decode, ...)",
+    ["stage"],
+    buckets=STAGE_BUCKETS,
+)
+
+DATA_URL_PREFIX = "data:image/"
+BASE64_MARKER = ";base64,"
+
+
+@contextmanager
+def timed(timings: dict[str, float], stage: str) -> Iterator[None]:
+    """
+    Time a pipeline stage into ``timings`` and the stage histogram.
+
+    Args:
+        timings: Stage name -> seconds, accumulated for repeated stages
+        stage: Stage name
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        timings[stage] = timings.get(stage, 0.0) + elapsed
+        AVATAR_IMAGE_STAGE_DURATION.labels(stage).observe(elapsed)
+
+
+def max_data_url_length(max_input_bytes: int) -> int:
+    """Longest data URL whose payload can decode to ``max_input_bytes``."""
+    # 4 base64 characters per 3 bytes, plus a generous allowance for the header
+    return (max_input_bytes + 2) // 3 * 4 + 256
+
+
+def avatar_cache_key(url: str) -> str:
+    """Return the content-addressed cache key for a profile picture URL or data URL."""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def decode_data_url(url: str) -> bytes:
+    """
+    Decode the base64 payload of an image data URL.
+
+    Args:
+        url: Data URL of the form ``data:image/<type>;base64,<payload>``
+
+    Returns:
+        Decoded image bytes
+
+    Raises:
+        ValueError: If the URL is not a base64 image data URL
+    """
+    header, marker, payload = url.partition(BASE64_MARKER)
+    if not (header.startswith(DATA_URL_PREFIX) and marker and payload):
+        raise ValueError("Invalid data URL format")
+    try:
+        return base64.b64decode(payload)
+    except binascii.Error as e:
+        raise ValueError(f"Invalid base64 payload in data URL: {e}") from e
+
+
+def open_rgb_image(
+    image_bytes: bytes,
+    settings: AvatarCacheSettings,
+    timings: dict[str, float] | None = None,
+) -> Image.Image:
+    """
+    Validate, decode and downscale image bytes to an RGB avatar image.
+
+    Args:
+        image_bytes: Encoded image (PNG, JPEG, ...)
+        settings: Input limits and target size
+        timings: Optional stage timings to record into
+
+    Returns:
+        RGB image whose longest side is at most ``target_size``
+
+    Raises:
+        ValueError: If the image exceeds the limits or cannot be decoded
+    """
+    timings = {} if timings is None else timings
+    if len(image_bytes) > settings.max_input_bytes:
+        raise ValueError(
+            f"Image is {len(image_bytes)} bytes, limit is {settings.max_input_bytes}"
+        )
+
+    try:
+        with timed(timings, "validate"):
+            # Only the header is read here; pixels are decoded by load()
+            source = Image.open(io.BytesIO(image_bytes))
+            width, height = source.size
+            if width * height > settings.max_pixels:
+                raise ValueError(
+                    f"Image is {width}x{height} pixels, limit is {settings.max_pixels}"
+                )
+
+        target = settings.target_size
+        with timed(timings, "decode"):
+            if target and source.format == "JPEG":
+                # Lets libjpeg decode at 1/2, 1/4 or 1/8 scale, still >= target
+                source.draft("RGB", (target, target))
+            image = source.convert("RGB")
+
+        if target and max(image.size) > target:
+            with timed(timings, "resize"):
+                image.thumbnail((target, target), Image.Resampling.LANCZOS)
+    except (OSError, Image.DecompressionBombError) as e:
+        # UnidentifiedImageError and truncated data are OSErrors
+        raise ValueError(f"Failed to decode image: {e}") from e
+    return image
+
+
+def open_data_url_image(
+    url: str,
+    settings: AvatarCacheSettings,
+    timings: dict[str, float] | None = None,
+) -> Image.Image:
+    """
+    Decode an image data URL to an RGB avatar image (see ``open_rgb_image``).
+
+    Args:
+        url: Base64 image data URL
+        settings: Input limits and target size
+        timings: Optional stage timings to record into
+
+    Returns:
+        RGB image whose longest side is at most ``target_size``
+
+    Raises:
+        ValueError: If the data URL is malformed, too large or not an image
+    """
+    timings = {} if timings is None else timings
+    with timed(timings, "base64"):
+        image_bytes = decode_data_url(url)
+    return open_rgb_image(image_bytes, settings, timings)
+
+
+class AvatarImagePipeline:
+    """Bounded thread pool running the avatar image stages off the event loop"""
+
+    def __init__(self, settings: AvatarCacheSettings):
+        """
+        Initialize the pipeline (threads are started on first use).
+
+        Args:
+            settings: Avatar cache settings (decode workers, limits, target size)
+        """
+        self.settings = settings
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.decode_workers, thread_name_prefix="avatar-image"
+        )
+
+    async def run(
+        self,
+        stage: str | None,
+        timings: dict[str, float],
+        func: Callable[..., ResultT],
+        *args: object,
+    ) -> ResultT:
+        """
+        Run a function on the pool, timing the wait for a free thread.
+
+        Args:
+            stage: Stage func is timed as (None if func records its own stages)
+            timings: Stage timings to record into
+            func: Function to run
+            args: Positional arguments of func
+
+        Returns:
+            Result of func
+        """
+        submitted = time.perf_counter()
+
+        def call() -> ResultT:
+            waited = time.perf_counter() - submitted
+            timings["queue"] = timings.get("queue", 0.0) + waited
+            AVATAR_IMAGE_STAGE_DURATION.labels("queue").observe(waited)
+            if stage is None:
+                return func(*args)
+            with timed(timings, stage):
+                return func(*args)
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    async def cache_key(self, url: str, timings: dict[str, float]) -> str:
+        """
+        Hash a URL; data URLs are hashed on the pool (they can be megabytes).
+
+        Raises:
+            ValueError: If a data URL is too large to be decoded
+        """
+        if not url.startswith("data:"):
+            return avatar_cache_key(url)
+        self._check_data_url_length(url)
+        return await self.run("hash", timings, avatar_cache_key, url)
+
+    async def decode_data_url(self, url: str, timings: dict[str, float]) -> Image.Image:
+        """
+        Decode an image data URL to an RGB avatar image.
+
+        Args:
+            url: Base64 image data URL
+            timings: Stage timings to record into
+
+        Returns:
+            RGB avatar image
+
+        Raises:
+            ValueError: If the data URL is malformed, too large or not an image
+        """
+        self._check_data_url_length(url)
+        return await self.run(
+            None, timings, open_data_url_image, url, self.settings, timings
+        )
+
+    def _check_data_url_length(self, url: str) -> None:
+        # Checked on the loop: O(1), and nothing is queued for oversized input
+        if len(url) > max_data_url_length(self.settings.max_input_bytes):
+            raise ValueError(
+                f"Data URL exceeds the {self.settings.max_input_bytes} byte image limit"
+            )
+
+    async def decode_bytes(
+        self, image_bytes: bytes, timings: dict[str, float]
+    ) -> Image.Image:
+        """
+        Decode downloaded image bytes to an RGB avatar image.
+
+        Args:
+            image_bytes: Encoded image
+            timings: Stage timings to record into
+
+        Returns:
+            RGB avatar image
+
+        Raises:
+            ValueError: If the image is too large or cannot be decoded
+        """
+        return await self.run(
+            None, timings, open_rgb_image, image_bytes, self.settings, timings
+        )
+
+    def shutdown(self) -> None:
+        """Stop the pool's threads once queued work is done."""
+        self._executor.shutdown(wait=False)
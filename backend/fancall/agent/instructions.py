@@ -0,0 +1,204 @@
+"""
+Instruction composition for the Fancall agent worker.
+
+LLM providers cache the longest prompt prefix they have recently seen (OpenAI:
+from 1024 tokens, in 128-token steps), which cuts time to first token on every
+turn of every session that shares it. Instructions are therefore composed as:
+
+- a static prefix, the role playing guidelines and the persona's system prompt.
+  It is composed once per persona version and memoized, so every job of that
+  version sends the same bytes;
+- per-call context (e.g. conversation memory) after it, trimmed to what the
+  ``prompt_max_tokens`` budget leaves.
+
+The tokens of each part, and how much of the prefix the provider can cache,
+are reported per session.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from prometheus_client import Histogram
+
+from fancall.prompts import compose_instructions, estimate_tokens, truncate_to_tokens
+from fancall.settings import FancallModelSettings
+
+logger = logging.getLogger(__name__)
+
+PROMPT_TOKEN_BUCKETS = (256, 512, 1024, 1536, 2048, 3072, 4096, 6144, 8192, 16384)
+
+PROMPT_TOKENS = Histogram(
+    "fancall_agent_prompt_tokens",
+    "Estimated tokens of composed instructions (part=prefix, context, cacheable)",
+    ["part"],
+    buckets=PROMPT_TOKEN_BUCKETS,
+)
+
+# Persona versions whose static prefix is kept per process
+PREFIX_MEMO_SIZE = 64
+CONTEXT_SEPARATOR = "\n\n"
+
+
+@dataclass(frozen=True)
+class StaticPrefix:
+    """Static part of a persona version's instructions"""
+
+    system_prompt: str | None
+    text: str
+    tokens: int
+
+
+@dataclass(frozen=True)
+class ComposedInstructions:
+    """Instructions of one session and their estimated token counts"""
+
+    text: str
+    prefix_tokens: int
+    context_tokens: int
+    cacheable_tokens: int
+
+    @property
+    def tokens(self) -> int:
+        """Estimated tokens of the whole instructions"""
+        return self.prefix_tokens + self.context_tokens
+
+
+def prompt_digest(system_prompt: str | None) -> str:
+    """Return the memo key part of a system prompt."""
+    return hashlib.sha256((system_prompt or "").encode("utf-8")).hexdigest()
+
+
+def cacheable_prefix_tokens(
+    prefix_tokens: int, min_tokens: int, increment_tokens: int
+) -> int:
+    """
+    Return how many tokens of a prompt prefix a provider cache can serve.
+
+    Args:
+        prefix_tokens: Tokens of the static prefix
+        min_tokens: Shortest prefix the provider caches
+        increment_tokens: Steps in which cached prefixes grow beyond the minimum
+
+    Returns:
+        Cache-eligible prefix tokens (0 below the minimum)
+    """
+    if prefix_tokens < min_tokens:
+        return 0
+    steps = (prefix_tokens - min_tokens) // increment_tokens
+    return min_tokens + steps * increment_tokens
+
+
+class InstructionComposer:
+    """Composes session instructions around a memoized static prefix"""
+
+    def __init__(self, settings: FancallModelSettings):
+        """
+        Initialize the composer.
+
+        Args:
+            settings: Fancall model settings (prompt budget, provider cache)
+        """
+        self.settings = settings
+        # (persona key, version, prompt digest) -> static prefix, in LRU order
+        self._prefixes: OrderedDict[tuple[str, int | None, str], StaticPrefix] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def prefix(
+        self, persona_key: str, version: int | None, system_prompt: str | None
+    ) -> StaticPrefix:
+        """
+        Return the static prefix of a persona version, composing it on first use.
+
+        Args:
+            persona_key: Registered persona ID, or the default persona key
+            version: Registered persona version (None for unversioned prompts)
+            system_prompt: Merged system prompt of the job. Prompts that differ
+                (e.g. a dispatch override) are memoized side by side.
+
+        Returns:
+            Static prefix
+        """
+        key = (persona_key, version, prompt_digest(system_prompt))
+        entry = self._prefixes.get(key)
+        if entry is not None:
+            self._prefixes.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        text = compose_instructions(system_prompt, include_role_playing=True)
+        entry = StaticPrefix(system_prompt, text, estimate_tokens(text))
+        if entry.tokens > self.settings.prompt_max_tokens:
+            logger.warning(
+                "Static instructions of persona %s exceed the prompt budget "
+                "(%d > %d tokens); per-call context is dropped",
+                persona_key,
+                entry.tokens,
+                self.settings.prompt_max_tokens,
+            )
+        self._prefixes[key] = entry
+        self._prefixes.move_to_end(key)
+        if len(self._prefixes) > PREFIX_MEMO_SIZE:
+            self._prefixes.popitem(last=False)
+        return entry
+
+    def compose(
+        self,
+        persona_key: str,
+        version: int | None,
+        system_prompt: str | None,
+        context: Sequence[str] = (),
+    ) -> ComposedInstructions:
+        """
+        Compose a session's instructions: static prefix first, then context.
+
+        Args:
+            persona_key: Registered persona ID, or the default persona key
+            version: Registered persona version (None for unversioned prompts)
+            system_prompt: Merged system prompt of the job
+            context: Per-call context blocks, in order of priority. The first
+                block that does not fit is trimmed and the rest are dropped, to
+                stay within ``prompt_max_tokens``.
+
+        Returns:
+            Composed instructions
+        """
+        prefix = self.prefix(persona_key, version, system_prompt)
+        parts = [prefix.text]
+        remaining = self.settings.prompt_max_tokens - prefix.tokens
+        for block in context:
+            available = remaining - estimate_tokens(CONTEXT_SEPARATOR)
+            if available <= 0:
+                logger.info("Instruction context dropped: prompt budget exhausted")
+                break
+            trimmed = truncate_to_tokens(block, available)
+            parts.append(trimmed)
+            if trimmed != block:
+                # Lower-priority blocks do not get the slack a trimmed block leaves
+                logger.info("Instruction context trimmed to %d tokens", available)
+                break
+            remaining -= estimate_tokens(CONTEXT_SEPARATOR + trimmed)
+
+        text = CONTEXT_SEPARATOR.join(parts)
+        composed = ComposedInstructions(
+            text=text,
+            prefix_tokens=prefix.tokens,
+            context_tokens=estimate_tokens(text) - prefix.tokens,
+            cacheable_tokens=cacheable_prefix_tokens(
+                prefix.tokens,
+                self.settings.prompt_cache_min_tokens,
+                self.settings.prompt_cache_increment_tokens,
+            ),
+        )
+        PROMPT_TOKENS.labels("prefix").observe(composed.prefix_tokens)
+        PROMPT_TOKENS.labels("context").observe(composed.context_tokens)
+        PROMPT_TOKENS.labels("cacheable").observe(composed.cacheable_tokens)
+        return composed
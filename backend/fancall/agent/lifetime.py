@@ -0,0 +1,152 @@
+"""
+Session lifetime policy for the Fancall agent worker.
+
+A job holds its worker slot (LLM, TTS and Hedra avatar sessions) until it shuts
+down, so ``SessionReaper`` ends the session as soon as it no longer serves a
+caller, at the first of:
+
+- the last caller left and did not rejoin within ``rejoin_grace_seconds``
+  (or no caller joined within ``join_timeout_seconds``),
+- silence: LiveKit marks the user ``away`` once neither the user nor the agent
+  has spoken for ``idle_timeout_seconds``,
+- the ``max_duration_seconds`` limit of the dispatch's tier.
+
+Every job end is counted by tier and reason, so freed slots and the time
+sessions held them show up next to the worker's capacity numbers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+
+from livekit import rtc
+from livekit.agents.types import ATTRIBUTE_PUBLISH_ON_BEHALF
+from prometheus_client import Counter, Histogram
+
+from fancall.settings import SessionLifetimeSettings
+
+logger = logging.getLogger(__name__)
+
+REASON_MAX_DURATION = "max_duration"
+REASON_IDLE = "idle"
+REASON_CALLER_LEFT = "caller_left"
+REASON_NO_CALLER = "no_caller"
+# Jobs ended by anything else (room closed, startup failure, worker shutdown)
+REASON_OTHER = "other"
+
+LIFETIME_BUCKETS = (5, 10, 30, 60, 75, 120, 300, 600, 1200, 1800, 3600)
+
+SESSION_LIFETIME = Histogram(
+    "fancall_agent_session_lifetime_seconds",
+    "Time agent sessions held a worker job slot",
+    ["tier", "reason"],
+    buckets=LIFETIME_BUCKETS,
+)
+JOB_SLOTS_FREED = Counter(
+    "fancall_agent_job_slots_freed_total",
+    "Worker job slots freed by ended agent sessions",
+    ["tier", "reason"],
+)
+
+
+def is_caller(participant: rtc.RemoteParticipant) -> bool:
+    """Whether a participant is a caller (not an agent or an avatar worker)."""
+    return (
+        participant.kind != rtc.ParticipantKind.PARTICIPANT_KIND_AGENT
+        and ATTRIBUTE_PUBLISH_ON_BEHALF not in participant.attributes
+    )
+
+
+class SessionReaper:
+    """Decides when an agent session stops serving its caller"""
+
+    def __init__(self, settings: SessionLifetimeSettings, tier: str | None):
+        """
+        Start tracking a job's callers.
+
+        Args:
+            settings: Session lifetime policy
+            tier: Tier stamped on the dispatch (None for the guest limit)
+        """
+        self.settings = settings
+        self.tier = tier or "guest"
+        self.max_duration = settings.max_duration_for(tier)
+        self.created_at = time.monotonic()
+        # Set by run(): the duration limit counts from the session start
+        self.session_started_at: float | None = None
+        self.reason: str | None = None
+        self._callers: set[str] = set()
+        self._has_joined = False
+        self._empty_since: float | None = self.created_at
+        self._away = False
+        self._changed = asyncio.Event()
+
+    def participant_connected(self, participant: rtc.RemoteParticipant) -> None:
+        """Room event handler: a caller joined (or rejoined)."""
+        if not is_caller(participant):
+            return
+        self._callers.add(participant.identity)
+        self._has_joined = True
+        self._empty_since = None
+        self._changed.set()
+
+    def participant_disconnected(self, participant: rtc.RemoteParticipant) -> None:
+        """Room event handler: the session ends shortly after the last caller leaves."""
+        self._callers.discard(participant.identity)
+        if not self._callers and self._empty_since is None:
+            self._empty_since = time.monotonic()
+        self._changed.set()
+
+    def user_state_changed(self, state: str) -> None:
+        """Session event handler: ``away`` means the silence timeout has passed."""
+        self._away = state == "away"
+        self._changed.set()
+
+    def _next_deadline(self) -> tuple[str, float]:
+        """Return the earliest reason to end the session and when it is due."""
+        assert self.session_started_at is not None, "run() sets the session start"
+        deadlines = [(REASON_MAX_DURATION, self.session_started_at + self.max_duration)]
+        if self._away:
+            deadlines.append((REASON_IDLE, 0.0))
+        if self._empty_since is not None:
+            if self._has_joined:
+                grace = (REASON_CALLER_LEFT, self.settings.rejoin_grace_seconds)
+            else:
+                grace = (REASON_NO_CALLER, self.settings.join_timeout_seconds)
+            deadlines.append((grace[0], self._empty_since + grace[1]))
+        return min(deadlines, key=lambda deadline: deadline[1])
+
+    async def run(self) -> str:
+        """
+        Wait until the session should end.
+
+        Returns:
+            Reason the session ends (``max_duration``, ``idle``, ``caller_left``
+            or ``no_caller``)
+        """
+        self.session_started_at = time.monotonic()
+        while True:
+            reason, deadline = self._next_deadline()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.reason = reason
+                return reason
+            self._changed.clear()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._changed.wait(), remaining)
+
+    async def report(self) -> None:
+        """Shutdown callback: record the freed job slot and how long it was held."""
+        reason = self.reason or REASON_OTHER
+        lifetime = time.monotonic() - self.created_at
+        SESSION_LIFETIME.labels(self.tier, reason).observe(lifetime)
+        JOB_SLOTS_FREED.labels(self.tier, reason).inc()
+        logger.info(
+            "Job slot freed after %.1fs (tier=%s, reason=%s)",
+            lifetime,
+            self.tier,
+            reason,
+        )
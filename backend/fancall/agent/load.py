@@ -0,0 +1,234 @@
+"""
+Load reporting and job admission for the Fancall agent worker.
+
+LiveKit assigns jobs to workers by the load they report, and stops assigning
+to a worker whose load reaches ``load_threshold``. By default that load is CPU
+alone, which reacts late for this worker: audio quality collapses on a host
+whose job event loops fall behind (Hedra avatar sessions, image decoding) well
+before CPU reads as saturated.
+
+``WorkerLoadMonitor`` is the worker's ``load_fnc``. It scores each resource from
+0 (idle) to 1 (full) and reports the highest, so whichever resource runs out
+first closes admission:
+
+- jobs: active jobs over ``max_jobs``
+- cpu: CPU utilization (cgroup-aware), averaged over recent samples
+- memory: system memory utilization
+- loop_lag: worst recent event-loop lag reported by job processes, over
+  ``max_loop_lag_ms``
+
+Job processes measure their own loop lag with ``LoopLagProbe`` and report it
+through one small file per job in a shared directory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+import psutil
+from livekit.agents import Worker
+from livekit.agents.utils.hw import CPUMonitor, get_cpu_monitor
+from prometheus_client import Gauge
+
+from fancall.settings import WorkerLoadSettings
+
+logger = logging.getLogger(__name__)
+
+LOAD_COMPONENTS = ("jobs", "cpu", "memory", "loop_lag")
+
+WORKER_LOAD = Gauge(
+    "fancall_agent_worker_load",
+    "Load score reported to LiveKit (component=score) and its components",
+    ["component"],
+    multiprocess_mode="livemostrecent",
+)
+
+# CPU samples averaged into the cpu component (2.5 s at the default window)
+CPU_SAMPLES = 5
+# Lag reports older than this belong to ended or stuck jobs and are ignored
+LAG_REPORT_TTL = 5.0
+LAG_SUFFIX = ".lag"
+
+
+def read_loop_lag(lag_dir: str, now: float | None = None) -> float:
+    """
+    Return the worst event-loop lag (seconds) recently reported by job processes.
+
+    Args:
+        lag_dir: Directory of per-job lag reports
+        now: Current wall-clock time (injectable for tests)
+
+    Returns:
+        Highest fresh reported lag, 0.0 if there is none
+    """
+    now = time.time() if now is None else now
+    worst = 0.0
+    try:
+        entries = list(os.scandir(lag_dir))
+    except FileNotFoundError:
+        return worst
+    for entry in entries:
+        if not entry.name.endswith(LAG_SUFFIX):
+            continue
+        try:
+            if now - entry.stat().st_mtime > LAG_REPORT_TTL:
+                continue
+            with open(entry.path, encoding="utf-8") as lag_file:
+                worst = max(worst, float(lag_file.read()))
+        except (OSError, ValueError):
+            # Removed by its job, or replaced mid-read
+            continue
+    return worst
+
+
+class LoopLagProbe:
+    """Measures a job process's event-loop lag and reports it to the worker"""
+
+    def __init__(
+        self, lag_dir: str, job_id: str, interval: float = 0.1, report_every: int = 10
+    ):
+        """
+        Initialize the probe (started by ``start``).
+
+        Args:
+            lag_dir: Directory of per-job lag reports
+            job_id: LiveKit job ID, naming the report file
+            interval: Seconds between wake-ups whose lateness is measured
+            report_every: Wake-ups per report; each report is the worst lag
+                since the previous one
+        """
+        self.path = os.path.join(lag_dir, f"{job_id}{LAG_SUFFIX}")
+        self.interval = interval
+        self.report_every = report_every
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start measuring on the running event loop."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._task = asyncio.create_task(self._run(), name="loop-lag-probe")
+
+    async def _run(self) -> None:
+        worst = 0.0
+        wakeups = 0
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            worst = max(worst, time.monotonic() - expected)
+            wakeups += 1
+            if wakeups == self.report_every:
+                self._report(worst)
+                worst = 0.0
+                wakeups = 0
+
+    def _report(self, lag: float) -> None:
+        # A few bytes on local disk; replaced atomically so readers see whole values
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as lag_file:
+                lag_file.write(f"{lag:.6f}")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Failed to report event-loop lag: %s", e)
+
+    async def aclose(self) -> None:
+        """Stop measuring and withdraw this job's report (shutdown callback)."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
+
+
+class WorkerLoadMonitor:
+    """Load function of the worker: the highest of its resource load scores"""
+
+    def __init__(
+        self,
+        settings: WorkerLoadSettings,
+        lag_dir: str,
+        cpu_monitor: CPUMonitor | None = None,
+    ):
+        """
+        Initialize the monitor (CPU sampling starts on the first load report).
+
+        Args:
+            settings: Worker load settings (threshold, job and lag limits)
+            lag_dir: Directory of per-job lag reports
+            cpu_monitor: CPU utilization source (defaults to LiveKit's
+                cgroup-aware monitor)
+        """
+        self.settings = settings
+        self.lag_dir = lag_dir
+        self._cpu_monitor = cpu_monitor
+        self._cpu_samples: deque[float] = deque(maxlen=CPU_SAMPLES)
+        self._lock = threading.Lock()
+        self._sampler: threading.Thread | None = None
+
+    def _sample_cpu(self) -> None:
+        cpu_monitor = self._cpu_monitor or get_cpu_monitor()
+        while True:
+            # Blocks for the sample window
+            utilization = cpu_monitor.cpu_percent(self.settings.cpu_sample_seconds)
+            with self._lock:
+                self._cpu_samples.append(utilization)
+
+    def _cpu_load(self) -> float:
+        if self._sampler is None:
+            self._sampler = threading.Thread(
+                target=self._sample_cpu, daemon=True, name="fancall-cpu-sampler"
+            )
+            self._sampler.start()
+        with self._lock:
+            if not self._cpu_samples:
+                return 0.0
+            return sum(self._cpu_samples) / len(self._cpu_samples)
+
+    def components(self, active_jobs: int) -> dict[str, float]:
+        """
+        Score each resource from 0 (idle) to 1 (full).
+
+        Args:
+            active_jobs: Jobs currently running on the worker
+
+        Returns:
+            Component name -> load score
+        """
+        max_lag = self.settings.max_loop_lag_ms / 1000
+        scores = {
+            "jobs": active_jobs / self.settings.max_jobs,
+            "cpu": self._cpu_load(),
+            "memory": psutil.virtual_memory().percent / 100,
+            "loop_lag": read_loop_lag(self.lag_dir) / max_lag,
+        }
+        return {name: min(score, 1.0) for name, score in scores.items()}
+
+    def __call__(self, worker: Worker) -> float:
+        """
+        Return the worker load reported to LiveKit (called every status update).
+
+        Args:
+            worker: LiveKit worker
+
+        Returns:
+            Highest component score
+        """
+        scores = self.components(len(worker.active_jobs))
+        load = max(scores.values())
+        for name, score in scores.items():
+            WORKER_LOAD.labels(name).set(score)
+        WORKER_LOAD.labels("score").set(load)
+        if load >= self.settings.load_threshold:
+            logger.info(
+                "Worker at capacity (load %.2f >= %.2f): %s",
+                load,
+                self.settings.load_threshold,
+                ", ".join(f"{name}={score:.2f}" for name, score in scores.items()),
+            )
+        return load
@@ -0,0 +1,78 @@
+"""
+Thread-safe LRU bounded by the total size of its entries.
+
+Memory tier of the worker's asset caches (avatar images, synthesized speech).
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Generic, Protocol, TypeVar
+
+
+class Sized(Protocol):
+    """Entry reporting the bytes it holds"""
+
+    # Stub bodies keep type checkers from expecting a return value
+    # pylint: disable=unnecessary-ellipsis
+
+    @property
+    def size_bytes(self) -> int:
+        """Bytes held by the entry"""
+        ...
+
+
+EntryT = TypeVar("EntryT", bound=Sized)
+
+
+class ByteBudgetLRU(Generic[EntryT]):
+    """Least-recently-used entries whose total ``size_bytes`` stays within a budget"""
+
+    def __init__(self, budget_bytes: int):
+        """
+        Initialize an empty LRU.
+
+        Args:
+            budget_bytes: Maximum total size of the entries
+        """
+        self.budget_bytes = budget_bytes
+        self.size_bytes = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, EntryT] = OrderedDict()
+        # Jobs may run on separate threads/event loops (thread executor in dev mode)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> EntryT | None:
+        """Return an entry and mark it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: EntryT) -> None:
+        """
+        Store an entry, evicting least recently used ones beyond the budget.
+
+        Entries larger than the whole budget are not stored.
+
+        Args:
+            key: Entry key
+            entry: Entry to store
+        """
+        if entry.size_bytes > self.budget_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= previous.size_bytes
+            self._entries[key] = entry
+            self.size_bytes += entry.size_bytes
+
+            while self.size_bytes > self.budget_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size_bytes -= evicted.size_bytes
+                self.evictions += 1
@@ -0,0 +1,240 @@
+"""
+Long-term conversation memory for the Fancall agent worker.
+
+Every job used to start from an empty chat context. Replaying past transcripts
+instead would grow the prompt, and with it time to first token, without bound.
+Memory is therefore one rolling summary per (user, persona):
+
+- At job start the summary is loaded with one query, concurrently with the
+  rest of the session setup, and added to the instructions as per-call context
+  (after the persona's static prompt prefix).
+- After the session ends (a job shutdown callback, off the call's hot path),
+  the previous summary and the session transcript are compacted by the LLM into
+  a new summary within ``summary_max_tokens``.
+
+Only signed-in callers have memory: the API stamps their ``user_id`` on the
+dispatch. Memory is best effort; database or LLM failures are logged and the
+session continues (or ends) without it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from aioia_core.settings import DatabaseSettings
+from livekit.agents.llm import LLM, ChatContext
+
+from fancall.database import short_lived_async_session
+from fancall.prompts import estimate_tokens, truncate_to_tokens
+from fancall.repositories.conversation_memory_repository import (
+    AsyncDatabaseConversationMemoryRepository,
+)
+from fancall.schemas import ConversationMemory
+from fancall.settings import ConversationMemorySettings
+
+logger = logging.getLogger(__name__)
+
+# Memory key of sessions with the default (unregistered) persona
+DEFAULT_PERSONA_KEY = "default"
+
+SPEAKER_LABELS = {"user": "User", "assistant": "You"}
+
+SUMMARY_INSTRUCTIONS = """You maintain the long-term memory a companion character keeps about one user.
+Merge the previous memory and the latest conversation into an updated memory.
+Keep what matters for future conversations: facts about the user (name, \
+preferences, plans, feelings), promises made, and shared references. Drop small talk.
+Write short bullet points in the language of the conversation, most important \
+first, in at most {max_tokens} tokens. Reply with the memory only."""
+
+MEMORY_HEADER = "What you remember about this user from previous conversations:"
+
+
+def format_transcript(chat_ctx: ChatContext, max_tokens: int) -> tuple[str, int]:
+    """
+    Format the most recent user and agent messages within a token budget.
+
+    Args:
+        chat_ctx: Session chat history
+        max_tokens: Token budget of the transcript (older messages are dropped)
+
+    Returns:
+        Transcript, and the number of user turns in the whole history
+    """
+    lines: list[str] = []
+    user_turns = 0
+    for item in chat_ctx.items:
+        if item.type != "message" or item.role not in SPEAKER_LABELS:
+            continue
+        text = item.text_content
+        if not text:
+            continue
+        user_turns += item.role == "user"
+        lines.append(f"{SPEAKER_LABELS[item.role]}: {text}")
+
+    kept: list[str] = []
+    used = 0
+    for line in reversed(lines):
+        used += estimate_tokens(line) + 1
+        if used > max_tokens:
+            break
+        kept.append(line)
+    return "\n".join(reversed(kept)), user_turns
+
+
+async def summarize(
+    llm: LLM, previous_summary: str, transcript: str, max_tokens: int
+) -> str:
+    """
+    Compact the previous summary and a session transcript into a new summary.
+
+    Args:
+        llm: LLM to summarize with
+        previous_summary: Current rolling summary ("" for a first session)
+        transcript: Transcript of the session that ended
+        max_tokens: Token budget of the new summary
+
+    Returns:
+        New summary, cut to the budget if the LLM exceeded it
+    """
+    chat_ctx = ChatContext.empty()
+    chat_ctx.add_message(
+        role="system", content=SUMMARY_INSTRUCTIONS.format(max_tokens=max_tokens)
+    )
+    chat_ctx.add_message(
+        role="user",
+        content=f"Previous memory:\n{previous_summary or '(none)'}\n\n"
+        f"Latest conversation:\n{transcript}",
+    )
+    parts = [part async for part in llm.chat(chat_ctx=chat_ctx).to_str_iterable()]
+    return truncate_to_tokens("".join(parts).strip(), max_tokens)
+
+
+def memory_context(summary: str) -> str:
+    """Format a memory summary as instruction context."""
+    return f"{MEMORY_HEADER}\n{summary}"
+
+
+class ConversationMemoryStore:
+    """Loads and saves rolling summaries with a short-lived database engine"""
+
+    def __init__(self, db_settings: DatabaseSettings):
+        """
+        Initialize the store (no connection is opened until memory is used).
+
+        Args:
+            db_settings: Database settings (DATABASE_URL)
+        """
+        self.db_settings = db_settings
+
+    async def load(self, user_id: str, persona_key: str) -> ConversationMemory | None:
+        """Load a user's memory of a persona (None if there is none)."""
+        async with short_lived_async_session(self.db_settings) as db_session:
+            repository = AsyncDatabaseConversationMemoryRepository(db_session)
+            return await repository.get(user_id, persona_key)
+
+    async def save(
+        self, user_id: str, persona_key: str, summary: str
+    ) -> ConversationMemory:
+        """Replace a user's memory of a persona with a new summary."""
+        async with short_lived_async_session(self.db_settings) as db_session:
+            repository = AsyncDatabaseConversationMemoryRepository(db_session)
+            return await repository.save(
+                user_id, persona_key, summary, estimate_tokens(summary)
+            )
+
+
+class SessionMemory:
+    """Memory of one job's caller: loaded at job start, updated at shutdown"""
+
+    def __init__(
+        self,
+        store: ConversationMemoryStore,
+        settings: ConversationMemorySettings,
+        user_id: str,
+        persona_key: str,
+    ):
+        """
+        Initialize the job's memory (``start_loading`` starts the query).
+
+        Args:
+            store: Conversation memory store
+            settings: Conversation memory settings (budgets)
+            user_id: Signed-in caller
+            persona_key: Registered persona ID, or ``DEFAULT_PERSONA_KEY``
+        """
+        self.store = store
+        self.settings = settings
+        self.user_id = user_id
+        self.persona_key = persona_key
+        self.memory: ConversationMemory | None = None
+        self._load_task: asyncio.Task[ConversationMemory | None] | None = None
+        self._loaded = False  # The stored memory (or its absence) is known
+
+    def start_loading(self) -> None:
+        """Start loading the memory in the background."""
+        self._load_task = asyncio.create_task(self._load())
+
+    async def _load(self) -> ConversationMemory | None:
+        try:
+            memory = await self.store.load(self.user_id, self.persona_key)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Best effort: the session starts without memory
+            logger.warning("Failed to load conversation memory: %s", e)
+            return None
+        self._loaded = True
+        return memory
+
+    async def context(self) -> str | None:
+        """
+        Wait for the memory and format it as instruction context.
+
+        Returns:
+            Memory context, None if the caller has no memory of the persona
+        """
+        assert self._load_task is not None, "start_loading() was not called"
+        self.memory = await self._load_task
+        if self.memory is None or not self.memory.summary:
+            return None
+        logger.info(
+            "Loaded conversation memory (%d tokens, %d sessions)",
+            self.memory.summary_tokens,
+            self.memory.session_count,
+        )
+        return memory_context(self.memory.summary)
+
+    async def remember(self, chat_ctx: ChatContext, llm: LLM) -> None:
+        """
+        Fold a finished session into the memory (job shutdown callback).
+
+        Args:
+            chat_ctx: Chat history of the session
+            llm: LLM to summarize with
+        """
+        transcript, user_turns = format_transcript(
+            chat_ctx, self.settings.transcript_max_tokens
+        )
+        if user_turns < self.settings.min_user_turns:
+            return
+        if self._load_task is None or not self._load_task.done() or not self._loaded:
+            # Summarizing from nothing would overwrite the stored summary
+            logger.warning("Conversation memory was not loaded; not updating it")
+            return
+        loaded = self._load_task.result()
+        previous = loaded.summary if loaded else ""
+        try:
+            summary = await summarize(
+                llm, previous, transcript, self.settings.summary_max_tokens
+            )
+            if not summary:
+                return
+            saved = await self.store.save(self.user_id, self.persona_key, summary)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # The call is over; a lost update only costs this session's memory
+            logger.warning("Failed to update conversation memory: %s", e)
+            return
+        logger.info(
+            "Updated conversation memory (%d tokens, %d sessions)",
+            saved.summary_tokens,
+            saved.session_count,
+        )
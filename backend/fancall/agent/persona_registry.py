@@ -0,0 +1,169 @@
+"""
+Worker-side cache of registered personas.
+
+Dispatch metadata refers to a registered persona by ``persona_id`` and the
+``persona_version`` the API saw at dispatch time, instead of carrying its system
+prompt and (possibly base64) profile picture. The worker resolves the reference
+through this cache, and loads the persona from the database only when that
+version is not cached yet.
+
+Tiers:
+    - Memory: LRU of personas bounded by ``max_entries``.
+    - Disk (optional): one JSON file per persona version. In process-per-job
+      mode this is the tier that carries personas across jobs.
+
+Entries are keyed by version, so an update is picked up by the next dispatch
+without any invalidation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import glob
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from aioia_core.settings import DatabaseSettings
+from pydantic import ValidationError
+
+from fancall.database import short_lived_async_session
+from fancall.repositories.persona_repository import AsyncDatabasePersonaRepository
+from fancall.schemas import RegisteredPersona
+from fancall.settings import PersonaCacheSettings
+
+logger = logging.getLogger(__name__)
+
+# Loads the current version of a persona (None if it does not exist)
+PersonaLoader = Callable[[str], Awaitable[RegisteredPersona | None]]
+
+
+class DatabasePersonaLoader:
+    """Loads registered personas from the database with a short-lived engine"""
+
+    def __init__(self, db_settings: DatabaseSettings):
+        """
+        Initialize the loader (no connection is opened until a persona is loaded).
+
+        Args:
+            db_settings: Database settings (DATABASE_URL)
+        """
+        self.db_settings = db_settings
+
+    async def __call__(self, persona_id: str) -> RegisteredPersona | None:
+        async with short_lived_async_session(self.db_settings) as db_session:
+            return await AsyncDatabasePersonaRepository(db_session).get_by_id(
+                persona_id
+            )
+
+
+class PersonaRegistry:
+    """Versioned cache of registered personas in front of a loader"""
+
+    def __init__(self, settings: PersonaCacheSettings, loader: PersonaLoader):
+        """
+        Initialize the persona cache.
+
+        Args:
+            settings: Persona cache settings (capacity, disk tier)
+            loader: Loads the current version of a persona on a cache miss
+        """
+        self.settings = settings
+        self.loader = loader
+        # persona_id -> latest cached version, in LRU order
+        self._memory: OrderedDict[str, RegisteredPersona] = OrderedDict()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    async def resolve(
+        self, persona_id: str, version: int | None
+    ) -> RegisteredPersona | None:
+        """
+        Return a registered persona, loading it only if the version is not cached.
+
+        Args:
+            persona_id: Registered persona ID
+            version: Version stamped on the dispatch. Without one the cache
+                cannot tell whether an entry is current, so the persona is loaded.
+
+        Returns:
+            Registered persona, or None if it does not exist
+        """
+        entry = self._memory.get(persona_id)
+        if entry is not None and version is not None and entry.version == version:
+            self._memory.move_to_end(persona_id)
+            self.memory_hits += 1
+            return entry
+
+        if version is not None and self.settings.disk_dir:
+            entry = await asyncio.to_thread(self._load_from_disk, persona_id, version)
+            if entry is not None:
+                self.disk_hits += 1
+                self._remember(entry)
+                return entry
+
+        self.misses += 1
+        entry = await self.loader(persona_id)
+        if entry is None:
+            return None
+        if version is not None and entry.version < version:
+            # e.g. a lagging read replica; the next dispatch loads it again
+            logger.warning(
+                "Loaded persona %s version %d, dispatch expected %d",
+                persona_id,
+                entry.version,
+                version,
+            )
+        self._remember(entry)
+        if self.settings.disk_dir:
+            await asyncio.to_thread(self._save_to_disk, entry)
+        return entry
+
+    def _remember(self, entry: RegisteredPersona) -> None:
+        self._memory[entry.id] = entry
+        self._memory.move_to_end(entry.id)
+        while len(self._memory) > self.settings.max_entries:
+            self._memory.popitem(last=False)
+
+    # Disk tier
+
+    def _disk_prefix(self, persona_id: str) -> str:
+        assert self.settings.disk_dir, "disk tier is disabled"
+        digest = hashlib.sha256(persona_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.settings.disk_dir, digest)
+
+    def _load_from_disk(
+        self, persona_id: str, version: int
+    ) -> RegisteredPersona | None:
+        path = f"{self._disk_prefix(persona_id)}.v{version}.json"
+        try:
+            with open(path, encoding="utf-8") as persona_file:
+                return RegisteredPersona.model_validate_json(persona_file.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError) as e:
+            logger.warning("Ignoring unreadable persona cache entry %s: %s", path, e)
+            return None
+
+    def _save_to_disk(self, entry: RegisteredPersona) -> None:
+        assert self.settings.disk_dir, "disk tier is disabled"
+        prefix = self._disk_prefix(entry.id)
+        path = f"{prefix}.v{entry.version}.json"
+        try:
+            os.makedirs(self.settings.disk_dir, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as persona_file:
+                persona_file.write(entry.model_dump_json())
+            os.replace(tmp_path, path)
+            # Older versions are never requested again
+            for old_path in glob.glob(f"{glob.escape(prefix)}.v*.json"):
+                if old_path != path:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(old_path)
+        except OSError as e:
+            logger.warning("Failed to persist persona cache entry %s: %s", path, e)
@@ -0,0 +1,296 @@
+"""
+Per-process worker resources built in the prewarm stage.
+
+LiveKit prewarms idle job processes before any job is assigned. Everything that
+does not depend on the room (LLM client, default-voice TTS, the default persona's
+static instructions prefix, avatar cache with the default avatar loaded, synthesized default
+greetings, registered persona cache) is built there once, so a dispatched job only does room-specific work.
+
+Default greetings are synthesized only with the TTS cache's disk tier: the first
+process of a worker pays for them and later processes read them from disk,
+instead of every process calling the TTS provider.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Coroutine, Sequence
+from typing import Any
+
+import httpx
+from aioia_core.settings import DatabaseSettings, FishAudioSettings, HedraSettings
+from livekit.agents import JobProcess, tts
+from livekit.agents.types import NOT_GIVEN
+from livekit.plugins import fishaudio, openai
+
+from fancall.agent.avatar_cache import AvatarImageCache
+from fancall.agent.greetings import presynthesize_greetings
+from fancall.agent.http_client import AssetHttpClient
+from fancall.agent.instructions import ComposedInstructions, InstructionComposer
+from fancall.agent.memory import DEFAULT_PERSONA_KEY, ConversationMemoryStore
+from fancall.agent.persona_registry import DatabasePersonaLoader, PersonaRegistry
+from fancall.agent.segmentation import create_sentence_tokenizer
+from fancall.agent.tts_cache import CachedTTS, TtsAudioCache
+from fancall.persona import Persona
+from fancall.settings import (
+    AssetHttpSettings,
+    AvatarCacheSettings,
+    FancallModelSettings,
+    PersonaCacheSettings,
+    TtsCacheSettings,
+    TtsSegmentationSettings,
+)
+
+logger = logging.getLogger(__name__)
+
+WORKER_RESOURCES_KEY = "fancall.worker_resources"
+
+
+class WorkerResources:  # pylint: disable=too-many-instance-attributes
+    """Room-independent resources shared by the jobs of one worker process"""
+
+    def __init__(
+        self,
+        default_persona: Persona,
+        fish_settings: FishAudioSettings,
+        model_settings: FancallModelSettings,
+        avatar_cache_settings: AvatarCacheSettings,
+        asset_http_settings: AssetHttpSettings,
+        tts_cache_settings: TtsCacheSettings,
+        segmentation_settings: TtsSegmentationSettings,
+        persona_cache_settings: PersonaCacheSettings,
+        database_settings: DatabaseSettings,
+    ):
+        """
+        Initialize worker resources (cheap; heavy work happens in ``warm_up``).
+
+        Args:
+            default_persona: Default persona whose voice and prompt are prepared
+            fish_settings: Fish Audio TTS settings
+            model_settings: Fancall LLM model settings
+            avatar_cache_settings: Avatar image cache settings
+            asset_http_settings: Asset HTTP client settings
+            tts_cache_settings: Synthesized speech cache settings
+            segmentation_settings: LLM-to-TTS text segmentation settings
+            persona_cache_settings: Registered persona cache settings
+            database_settings: Database settings for registered personas and
+                conversation memory
+        """
+        self.default_persona = default_persona
+        self.fish_settings = fish_settings
+        self.model_settings = model_settings
+        self.avatar_cache = AvatarImageCache(avatar_cache_settings)
+        self.asset_http_client = AssetHttpClient(asset_http_settings)
+        self.tts_cache = (
+            TtsAudioCache(tts_cache_settings) if tts_cache_settings.enabled else None
+        )
+        self.sentence_tokenizer = create_sentence_tokenizer(segmentation_settings)
+        self.memory_store = ConversationMemoryStore(database_settings)
+        self.persona_registry = PersonaRegistry(
+            persona_cache_settings, DatabasePersonaLoader(database_settings)
+        )
+        self.instruction_composer = InstructionComposer(model_settings)
+        # Composed here, so the default persona's prefix is memoized for every job
+        self.instruction_composer.prefix(
+            DEFAULT_PERSONA_KEY, None, default_persona.system_prompt
+        )
+        self._llm: openai.LLM | None = None
+        self._default_tts: tts.TTS | None = None
+
+    def warm_up(self) -> None:
+        """Construct the LLM and default-voice TTS clients ahead of any job."""
+        try:
+            self._llm = self.create_llm()
+            self._default_tts = self.create_tts(self.default_persona.voice_id)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Missing API keys etc. surface again (and fail) inside the job
+            logger.warning("Failed to prewarm LLM/TTS clients: %s", e)
+
+    async def preload_avatar(self, url: str) -> None:
+        """
+        Load an avatar image into the cache, then release this loop's HTTP pool.
+
+        Args:
+            url: HTTP(S) URL or data URL of the avatar image
+        """
+        try:
+            await self.avatar_cache.get_image(url, self.asset_http_client)
+        except (ValueError, httpx.HTTPError) as e:
+            logger.warning("Failed to preload default avatar image: %s", e)
+        finally:
+            await self.asset_http_client.aclose()
+
+    async def presynthesize_greetings(self) -> None:
+        """Synthesize the default persona's greetings into the TTS cache."""
+        try:
+            # A temporary client, so no TTS connection outlives this event loop
+            greeting_tts = self.create_tts(self.default_persona.voice_id)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Failed to create TTS client for greetings: %s", e)
+            return
+
+        try:
+            await presynthesize_greetings(
+                greeting_tts, self.default_persona.greetings or []
+            )
+        finally:
+            await greeting_tts.aclose()
+
+    def create_llm(self) -> openai.LLM:
+        """Create a new LLM client for the configured model."""
+        return openai.LLM(model=self.model_settings.openai_model)
+
+    def create_tts(self, voice_id: str | None) -> tts.TTS:
+        """
+        Create a new Fish Audio TTS client, wrapped by the speech cache if enabled.
+
+        Args:
+            voice_id: Fish Audio reference voice ID (provider default if None)
+
+        Returns:
+            TTS instance
+        """
+        return self.wrap_tts(
+            fishaudio.TTS(
+                api_key=self.fish_settings.api_key or NOT_GIVEN,
+                reference_id=voice_id or NOT_GIVEN,
+            ),
+            voice_id,
+        )
+
+    def wrap_tts(self, provider_tts: tts.TTS, voice_id: str | None) -> tts.TTS:
+        """
+        Wrap a provider TTS with the process-wide speech cache, if enabled.
+
+        Args:
+            provider_tts: TTS speaking with ``voice_id``
+            voice_id: Voice ID the cache entries are keyed by
+
+        Returns:
+            CachedTTS, or ``provider_tts`` when caching is disabled
+        """
+        if self.tts_cache is None:
+            return provider_tts
+        return CachedTTS(provider_tts, self.tts_cache, voice_id)
+
+    def get_llm(self) -> openai.LLM:
+        """Return the prewarmed LLM client, creating it if prewarm could not."""
+        if self._llm is None:
+            self._llm = self.create_llm()
+        return self._llm
+
+    def get_tts(self, voice_id: str | None) -> tts.TTS:
+        """
+        Return a TTS client for a voice, reusing the prewarmed default voice.
+
+        Args:
+            voice_id: Fish Audio reference voice ID requested for the job
+
+        Returns:
+            TTS instance
+        """
+        if voice_id == self.default_persona.voice_id and self._default_tts:
+            return self._default_tts
+        return self.create_tts(voice_id)
+
+    def get_instructions(
+        self,
+        system_prompt: str | None,
+        persona_key: str = DEFAULT_PERSONA_KEY,
+        version: int | None = None,
+        context: Sequence[str] = (),
+    ) -> ComposedInstructions:
+        """
+        Return composed instructions around the persona version's memoized prefix.
+
+        Args:
+            system_prompt: Merged system prompt for the job
+            persona_key: Registered persona ID, or the default persona key
+            version: Registered persona version (None for unversioned prompts)
+            context: Per-call context blocks appended after the static prefix
+
+        Returns:
+            Composed instructions
+        """
+        return self.instruction_composer.compose(
+            persona_key, version, system_prompt, context
+        )
+
+
+async def _run_concurrently(coroutines: list[Coroutine[Any, Any, None]]) -> None:
+    await asyncio.gather(*coroutines)
+
+
+def prewarm(  # pylint: disable=too-many-arguments
+    proc: JobProcess,
+    default_persona: Persona,
+    *,
+    fish_settings: FishAudioSettings,
+    hedra_settings: HedraSettings,
+    model_settings: FancallModelSettings,
+    avatar_cache_settings: AvatarCacheSettings,
+    asset_http_settings: AssetHttpSettings,
+    tts_cache_settings: TtsCacheSettings,
+    segmentation_settings: TtsSegmentationSettings,
+    persona_cache_settings: PersonaCacheSettings,
+    database_settings: DatabaseSettings,
+) -> None:
+    """
+    Prewarm a worker process (``WorkerOptions.prewarm_fnc``).
+
+    Args:
+        proc: LiveKit job process being initialized
+        default_persona: Default persona for agent configuration
+        fish_settings: Fish Audio TTS settings
+        hedra_settings: Hedra avatar settings
+        model_settings: Fancall LLM model settings
+        avatar_cache_settings: Avatar image cache settings
+        asset_http_settings: Asset HTTP client settings
+        tts_cache_settings: Synthesized speech cache settings
+        segmentation_settings: LLM-to-TTS text segmentation settings
+        persona_cache_settings: Registered persona cache settings
+        database_settings: Database settings for loading registered personas
+    """
+    resources = WorkerResources(
+        default_persona=default_persona,
+        fish_settings=fish_settings,
+        model_settings=model_settings,
+        avatar_cache_settings=avatar_cache_settings,
+        asset_http_settings=asset_http_settings,
+        tts_cache_settings=tts_cache_settings,
+        segmentation_settings=segmentation_settings,
+        persona_cache_settings=persona_cache_settings,
+        database_settings=database_settings,
+    )
+    resources.warm_up()
+
+    preloads: list[Coroutine[Any, Any, None]] = []
+    url = default_persona.profile_picture_url
+    if hedra_settings.enabled and not default_persona.avatar_id and url:
+        preloads.append(resources.preload_avatar(url))
+
+    # Only the disk tier keeps greeting audio beyond this process
+    if (
+        resources.tts_cache is not None
+        and tts_cache_settings.disk_dir
+        and default_persona.greetings
+    ):
+        preloads.append(resources.presynthesize_greetings())
+
+    if preloads:
+        # prewarm runs before the job event loop exists; the preloads run
+        # concurrently to stay within the process initialization timeout
+        asyncio.run(_run_concurrently(preloads))
+
+    proc.userdata[WORKER_RESOURCES_KEY] = resources
+    logger.info("Worker process prewarmed (pid=%s)", proc.pid)
+
+
+def get_worker_resources(proc: JobProcess) -> WorkerResources:
+    """Return the resources built by ``prewarm`` for this process."""
+    resources = proc.userdata.get(WORKER_RESOURCES_KEY)
+    assert isinstance(
+        resources, WorkerResources
+    ), "Worker resources missing (prewarm_fnc not configured)"
+    return resources
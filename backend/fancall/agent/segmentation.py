@@ -0,0 +1,277 @@
+"""
+Streaming segmentation of LLM text into TTS requests.
+
+Fish Audio's streaming API buffers text server-side until a chunk of about 200
+characters (or the end of the reply) is available, which delays the first audio
+of short persona replies until the whole reply is generated. ``MixedSentenceTokenizer``
+segments the LLM stream itself, tuned for mixed Korean/English replies, and
+``tts.StreamAdapter`` synthesizes the segments one by one:
+
+- Sentences end at ``. ! ? … ~`` (and full-width forms) or newlines; common
+  English abbreviations and decimals do not end sentences.
+- The first segment may also end at a clause boundary once it reaches
+  ``first_min_length``, and is released at a word boundary when no boundary
+  arrived within ``first_chunk_budget`` seconds.
+- Later sentences shorter than ``min_length`` are merged with the next one, so
+  the voice is not broken into fragments.
+- ``*action*`` markup is removed: it is shown in the transcript, not spoken.
+
+Lengths are spoken lengths (``spoken_length``), so the same policy fits Korean
+and English text.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from typing import Literal
+
+from livekit.agents import tokenize, tts, utils
+
+from fancall.settings import TtsSegmentationSettings
+
+# Text transforms left to AgentSession when segmenting: the segmenter handles
+# markup itself (filter_markdown would speak "*smiles*" as "smiles")
+SEGMENTED_TEXT_TRANSFORMS: tuple[Literal["filter_emoji"], ...] = ("filter_emoji",)
+
+_SENTENCE_END = re.compile(r"(?:[.!?…~。！？]+[\"'”’)\]」』]*(?=\s)|\n)")
+_CLAUSE_END = re.compile(r"[,;:，、](?=\s)")
+_WORD_END = re.compile(r"\S(?=\s)")
+_ACTION = re.compile(r"\*[^*]*\*")
+_MARKUP = re.compile(r"[*#`]+")
+_WHITESPACE = re.compile(r"[ \t]+")
+_ABBREVIATIONS = frozenset({"mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs"})
+
+
+def _is_wide(char: str) -> bool:
+    return (
+        "가" <= char <= "힣"  # Hangul syllables
+        or "぀" <= char <= "ヿ"  # Kana
+        or "一" <= char <= "鿿"  # CJK ideographs
+    )
+
+
+def spoken_length(text: str) -> int:
+    """Approximate spoken length: Hangul/CJK characters count as two."""
+    return sum(2 if _is_wide(char) else 1 for char in text if not char.isspace())
+
+
+def strip_markup(text: str) -> str:
+    """Remove ``*action*`` spans and stray markup symbols."""
+    text = _MARKUP.sub("", _ACTION.sub(" ", text))
+    return _WHITESPACE.sub(" ", text)
+
+
+def _is_sentence_end(text: str, match: re.Match[str]) -> bool:
+    if match.group() != ".":
+        return True
+    words = text[: match.start()].split()
+    word = words[-1] if words else ""
+    # "Dr. Kim", "J. Park" and "3. " (list numbers) continue the sentence
+    return not (
+        word.lower() in _ABBREVIATIONS
+        or (len(word) == 1 and word.isascii() and word.isupper())
+        or word.isdigit()
+    )
+
+
+def find_segment_end(text: str, min_length: int, clauses: bool = False) -> int | None:
+    """
+    Return where the next segment of ``text`` ends, or None to wait for more text.
+
+    A boundary only counts once whitespace follows it, so a streamed "3." is not
+    cut before its "5".
+
+    Args:
+        text: Buffered speakable text
+        min_length: Minimum spoken length of the segment
+        clauses: Whether clause boundaries (commas) also end the segment
+
+    Returns:
+        End index of the segment, or None
+    """
+    boundaries = [m for m in _SENTENCE_END.finditer(text) if _is_sentence_end(text, m)]
+    if clauses:
+        boundaries += list(_CLAUSE_END.finditer(text))
+    for end in sorted(m.end() for m in boundaries):
+        if spoken_length(text[:end]) >= min_length:
+            return end
+    return None
+
+
+def find_split(text: str, max_length: int) -> int | None:
+    """
+    Return where to split text longer than ``max_length``, preferring clauses.
+
+    Args:
+        text: Buffered speakable text
+        max_length: Maximum spoken length of a segment
+
+    Returns:
+        End index of the segment, or None if the text is short enough
+    """
+    if spoken_length(text) <= max_length:
+        return None
+    for pattern in (_CLAUSE_END, _WORD_END):
+        ends = [
+            m.end()
+            for m in pattern.finditer(text)
+            if spoken_length(text[: m.end()]) <= max_length
+        ]
+        if ends:
+            return ends[-1]
+    return None
+
+
+class MixedSentenceTokenizer(tokenize.SentenceTokenizer):
+    """Latency-tuned sentence tokenizer for mixed Korean/English replies"""
+
+    def __init__(self, settings: TtsSegmentationSettings):
+        """
+        Initialize the tokenizer.
+
+        Args:
+            settings: Segment length and first-chunk policy
+        """
+        self.settings = settings
+
+    def tokenize(self, text: str, *, language: str | None = None) -> list[str]:
+        segments: list[str] = []
+        rest = strip_markup(text)
+        while True:
+            end = find_segment_end(rest, self.settings.min_length) or find_split(
+                rest, self.settings.max_length
+            )
+            if end is None:
+                break
+            segments.append(rest[:end].strip())
+            rest = rest[end:]
+        if rest.strip():
+            segments.append(rest.strip())
+        return [segment for segment in segments if segment]
+
+    def stream(self, *, language: str | None = None) -> MixedSentenceStream:
+        return MixedSentenceStream(self.settings)
+
+
+class MixedSentenceStream(tokenize.SentenceStream):
+    """Incremental segmentation of one reply"""
+
+    def __init__(self, settings: TtsSegmentationSettings):
+        super().__init__()
+        self.settings = settings
+        self._pending = ""  # Raw text from an unclosed "*" onwards
+        self._text = ""  # Speakable text not yet released
+        self._first_released = False
+        self._budget_expired = False
+        self._budget_timer: asyncio.TimerHandle | None = None
+        self._segment_id = utils.shortuuid()
+
+    def push_text(self, text: str) -> None:
+        self._check_not_closed()
+        if not (self._first_released or self._budget_expired or self._budget_timer):
+            self._budget_timer = asyncio.get_running_loop().call_later(
+                self.settings.first_chunk_budget, self._release_on_budget
+            )
+        self._pending += text
+        self._take_speakable()
+        self._release(final=False)
+
+    def flush(self) -> None:
+        self._check_not_closed()
+        # An action left open at a flush was emphasis after all
+        self._text += _MARKUP.sub("", self._pending)
+        self._pending = ""
+        self._release(final=True)
+        self._segment_id = utils.shortuuid()
+
+    def end_input(self) -> None:
+        self.flush()
+        self._cancel_budget()
+        self._do_close()
+
+    async def aclose(self) -> None:
+        self._cancel_budget()
+        self._do_close()
+
+    def _take_speakable(self) -> None:
+        # Complete actions are dropped; text from an unclosed "*" waits
+        self._pending = _ACTION.sub(" ", self._pending)
+        start = self._pending.find("*")
+        if start == -1:
+            start = len(self._pending)
+        self._text = _WHITESPACE.sub(
+            " ", self._text + _MARKUP.sub("", self._pending[:start])
+        )
+        self._pending = self._pending[start:]
+
+    def _release(self, final: bool) -> None:
+        while True:
+            if self._first_released:
+                end = find_segment_end(self._text, self.settings.min_length)
+            else:
+                end = find_segment_end(
+                    self._text, self.settings.first_min_length, clauses=True
+                )
+            if end is None:
+                end = find_split(self._text, self.settings.max_length)
+            if end is None and self._budget_expired and not self._first_released:
+                end = self._last_word_end()
+            if end is None:
+                break
+            self._send(end)
+        if final and self._text.strip():
+            self._send(len(self._text))
+
+    def _release_on_budget(self) -> None:
+        # Out of budget: release the first words as soon as one is complete
+        self._budget_timer = None
+        self._budget_expired = True
+        if not self.closed:
+            self._release(final=False)
+
+    def _last_word_end(self) -> int | None:
+        ends = [m.end() for m in _WORD_END.finditer(self._text)]
+        return ends[-1] if ends else None
+
+    def _send(self, end: int) -> None:
+        segment, self._text = self._text[:end].strip(), self._text[end:].lstrip()
+        if not segment:
+            return
+        self._first_released = True
+        self._cancel_budget()
+        self._event_ch.send_nowait(
+            tokenize.TokenData(segment_id=self._segment_id, token=segment)
+        )
+
+    def _cancel_budget(self) -> None:
+        if self._budget_timer is not None:
+            self._budget_timer.cancel()
+            self._budget_timer = None
+
+
+def create_sentence_tokenizer(
+    settings: TtsSegmentationSettings,
+) -> tokenize.SentenceTokenizer | None:
+    """Return the configured segmenter, or None to stream raw text to the TTS."""
+    if settings.segmenter == "provider":
+        return None
+    return MixedSentenceTokenizer(settings)
+
+
+def segment_tts(
+    provider_tts: tts.TTS, tokenizer: tokenize.SentenceTokenizer | None
+) -> tts.TTS:
+    """
+    Put a segmentation stage in front of a TTS.
+
+    Args:
+        provider_tts: TTS synthesizing each segment
+        tokenizer: Segmenter (None streams the raw text to ``provider_tts``)
+
+    Returns:
+        ``tts.StreamAdapter`` synthesizing segment by segment, or ``provider_tts``
+    """
+    if tokenizer is None:
+        return provider_tts
+    return tts.StreamAdapter(tts=provider_tts, sentence_tokenizer=tokenizer)
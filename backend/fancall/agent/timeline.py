@@ -0,0 +1,159 @@
+"""
+Per-session startup timeline for the Fancall agent worker.
+
+Each job records when its startup stages (room connect, metadata parsing,
+avatar image, avatar start, session start) begin and end, and when the first
+LLM token and first TTS audio frame are produced, all on the monotonic clock
+relative to job entry. At job shutdown the timeline is observed into
+Prometheus histograms and emitted as one JSON record.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from prometheus_client import Histogram
+
+logger = logging.getLogger(__name__)
+
+# Stages take from milliseconds (metadata) to seconds (avatar start, first audio)
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+SESSION_STAGE_DURATION = Histogram(
+    "fancall_agent_session_stage_seconds",
+    "Duration of agent session startup stages",
+    ["stage"],
+    buckets=STAGE_BUCKETS,
+)
+SESSION_EVENT_OFFSET = Histogram(
+    "fancall_agent_session_event_offset_seconds",
+    "Time from job entry to session events (first LLM token, first TTS audio)",
+    ["event"],
+    buckets=STAGE_BUCKETS,
+)
+
+
+class SessionTimeline:
+    """Monotonic timeline of one agent session's startup"""
+
+    def __init__(
+        self,
+        room_name: str,
+        job_id: str,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Start a timeline at job entry.
+
+        Args:
+            room_name: LiveKit room of the job
+            job_id: LiveKit job ID
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.room_name = room_name
+        self.job_id = job_id
+        self._clock = clock
+        self._origin = clock()
+        self.started_at = time.time()
+        # stage -> (start offset, duration) in seconds, in completion order
+        self.stages: dict[str, tuple[float, float]] = {}
+        # event -> offset in seconds (first occurrence only)
+        self.events: dict[str, float] = {}
+        # stage -> sub-stage -> seconds (e.g. the avatar image pipeline)
+        self.breakdowns: dict[str, dict[str, float]] = {}
+        self._exported = False
+
+    def _offset(self) -> float:
+        return self._clock() - self._origin
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Record a stage's start offset and duration.
+
+        Args:
+            name: Stage name (e.g. ``connect``)
+        """
+        start = self._offset()
+        try:
+            yield
+        finally:
+            self.stages[name] = (start, self._offset() - start)
+
+    def mark(self, name: str) -> None:
+        """
+        Record the first occurrence of an event; later occurrences are ignored.
+
+        Args:
+            name: Event name (e.g. ``first_llm_token``)
+        """
+        if name not in self.events:
+            self.events[name] = self._offset()
+
+    def breakdown(self, stage: str, durations: dict[str, float]) -> None:
+        """
+        Record the sub-stage durations of a stage (included in the record only).
+
+        Args:
+            stage: Stage name (e.g. ``avatar_image``)
+            durations: Sub-stage name -> seconds
+        """
+        self.breakdowns[stage] = dict(durations)
+
+    def to_record(self) -> dict[str, Any]:
+        """Return the timeline as a JSON-serializable record."""
+        return {
+            "room": self.room_name,
+            "job_id": self.job_id,
+            "started_at": self.started_at,
+            "stages": {
+                name: {"start": round(start, 4), "duration": round(duration, 4)}
+                for name, (start, duration) in self.stages.items()
+            },
+            "events": {name: round(offset, 4) for name, offset in self.events.items()},
+            "breakdowns": {
+                stage: {name: round(seconds, 4) for name, seconds in parts.items()}
+                for stage, parts in self.breakdowns.items()
+            },
+            "elapsed": round(self._offset(), 4),
+        }
+
+    def export(
+        self, timeline_path: str | None = None, shutdown_reason: str = ""
+    ) -> dict[str, Any]:
+        """
+        Observe the timeline into histograms and emit its JSON record (once).
+
+        Args:
+            timeline_path: Optional JSON Lines file to append the record to
+            shutdown_reason: Reason the job ended, included in the record
+
+        Returns:
+            The exported record
+        """
+        record = self.to_record()
+        record["shutdown_reason"] = shutdown_reason
+        if self._exported:
+            return record
+        self._exported = True
+
+        for name, (_, duration) in self.stages.items():
+            SESSION_STAGE_DURATION.labels(name).observe(duration)
+        for name, offset in self.events.items():
+            SESSION_EVENT_OFFSET.labels(name).observe(offset)
+
+        line = json.dumps(record, ensure_ascii=False)
+        logger.info("Session timeline: %s", line)
+        if timeline_path:
+            try:
+                with Path(timeline_path).open("a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            except OSError as e:
+                logger.warning("Failed to write session timeline: %s", e)
+        return record
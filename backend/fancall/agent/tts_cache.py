@@ -0,0 +1,412 @@
+"""
+Synthesized speech cache for the Fancall agent worker.
+
+Personas often answer with short, repeated phrases. ``CachedTTS`` wraps the
+configured TTS (Fish Audio) and caches the synthesized PCM of short utterances,
+keyed by the digest of voice ID, model, sample rate and normalized text, so a
+repeated phrase is played back immediately instead of being synthesized again.
+
+Tiers:
+    - Memory: LRU bounded by a byte budget of PCM audio.
+    - Disk (optional): WAV files, evicted least-recently-used (by mtime) beyond a
+      byte budget. In process-per-job mode this is the tier that carries audio
+      across jobs.
+
+Streaming input is buffered while it is short enough to be cached; once a
+turn outgrows ``max_text_chars`` the rest of it is passed through one wrapped
+TTS stream unchanged, so long replies keep their streaming latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import threading
+import unicodedata
+import wave
+from dataclasses import dataclass
+from typing import Any
+
+from livekit.agents import DEFAULT_API_CONNECT_OPTIONS, APIConnectOptions, tts, utils
+from prometheus_client import Counter
+
+from fancall.agent.lru import ByteBudgetLRU
+from fancall.settings import TtsCacheSettings
+
+logger = logging.getLogger(__name__)
+
+TTS_CACHE_LOOKUPS = Counter(
+    "fancall_tts_cache_lookups_total",
+    "TTS cache lookups by result (memory_hit, disk_hit, miss)",
+    ["result"],
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_tts_text(text: str) -> str:
+    """Normalize text for cache keys (Unicode NFKC, collapsed whitespace)."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def tts_cache_key(voice_id: str | None, model: str, sample_rate: int, text: str) -> str:
+    """Return the cache key of an utterance synthesized with a voice."""
+    material = "\0".join(
+        [voice_id or "", model, str(sample_rate), normalize_tts_text(text)]
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedAudio:
+    """16-bit PCM audio of one utterance"""
+
+    pcm: bytes
+    sample_rate: int
+    num_channels: int
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the PCM data"""
+        return len(self.pcm)
+
+
+class TtsAudioCache:
+    """Process-wide cache of synthesized utterances"""
+
+    def __init__(self, settings: TtsCacheSettings):
+        """
+        Initialize the TTS audio cache.
+
+        Args:
+            settings: TTS cache settings (memory and disk budgets, cacheable length)
+        """
+        self.settings = settings
+        self._memory: ByteBudgetLRU[CachedAudio] = ByteBudgetLRU(
+            settings.memory_budget_bytes
+        )
+        self._disk_bytes: int | None = None  # Scanned on first write
+        self._disk_lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.disk_evictions = 0
+
+    def is_cacheable(self, text: str) -> bool:
+        """Whether an utterance is short enough to be cached."""
+        normalized = normalize_tts_text(text)
+        return 0 < len(normalized) <= self.settings.max_text_chars
+
+    async def get(self, key: str) -> CachedAudio | None:
+        """
+        Return cached audio, promoting disk hits to memory.
+
+        Args:
+            key: Cache key from ``tts_cache_key``
+
+        Returns:
+            Cached audio, or None on a miss
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self.memory_hits += 1
+            TTS_CACHE_LOOKUPS.labels("memory_hit").inc()
+            return entry
+
+        if self.settings.disk_dir:
+            entry = await asyncio.to_thread(self._load_from_disk, key)
+            if entry is not None:
+                self.disk_hits += 1
+                TTS_CACHE_LOOKUPS.labels("disk_hit").inc()
+                self._memory.put(key, entry)
+                return entry
+
+        self.misses += 1
+        TTS_CACHE_LOOKUPS.labels("miss").inc()
+        return None
+
+    async def put(self, key: str, entry: CachedAudio) -> None:
+        """
+        Store synthesized audio in both tiers.
+
+        Args:
+            key: Cache key from ``tts_cache_key``
+            entry: Synthesized audio
+        """
+        self._memory.put(key, entry)
+        if self.settings.disk_dir:
+            await asyncio.to_thread(self._save_to_disk, key, entry)
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters, hit rate and tier sizes."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (
+                (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+            ),
+            "memory_evictions": self._memory.evictions,
+            "disk_evictions": self.disk_evictions,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory.size_bytes,
+            "disk_bytes": self._disk_bytes,
+        }
+
+    # Disk tier
+
+    def _disk_path(self, key: str) -> str:
+        assert self.settings.disk_dir, "disk tier is disabled"
+        return os.path.join(self.settings.disk_dir, f"{key}.wav")
+
+    def _load_from_disk(self, key: str) -> CachedAudio | None:
+        path = self._disk_path(key)
+        try:
+            with wave.open(path, "rb") as wav_file:
+                entry = CachedAudio(
+                    pcm=wav_file.readframes(wav_file.getnframes()),
+                    sample_rate=wav_file.getframerate(),
+                    num_channels=wav_file.getnchannels(),
+                )
+            # mtime is the recency used by disk eviction
+            os.utime(path)
+            return entry
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, wave.Error) as e:
+            logger.warning("Ignoring unreadable TTS cache entry %s: %s", key, e)
+            return None
+
+    def _save_to_disk(self, key: str, entry: CachedAudio) -> None:
+        assert self.settings.disk_dir, "disk tier is disabled"
+        path = self._disk_path(key)
+        try:
+            os.makedirs(self.settings.disk_dir, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with wave.Wave_write(tmp_path) as wav_file:
+                wav_file.setnchannels(entry.num_channels)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(entry.sample_rate)
+                wav_file.writeframes(entry.pcm)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Failed to persist TTS cache entry %s: %s", key, e)
+            return
+
+        with self._disk_lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_bytes()
+            else:
+                self._disk_bytes += size
+            if self._disk_bytes > self.settings.disk_budget_bytes:
+                self._evict_disk()
+
+    def _wav_files(self) -> list[os.DirEntry]:
+        assert self.settings.disk_dir, "disk tier is disabled"
+        with os.scandir(self.settings.disk_dir) as entries:
+            return [e for e in entries if e.is_file() and e.name.endswith(".wav")]
+
+    def _scan_disk_bytes(self) -> int:
+        return sum(e.stat().st_size for e in self._wav_files())
+
+    def _evict_disk(self) -> None:
+        assert self._disk_bytes is not None
+        # Other processes share the directory, so evict from a fresh listing
+        files = sorted(self._wav_files(), key=lambda e: e.stat().st_mtime)
+        self._disk_bytes = sum(e.stat().st_size for e in files)
+        for file in files:
+            if self._disk_bytes <= self.settings.disk_budget_bytes:
+                break
+            try:
+                size = file.stat().st_size
+                os.remove(file.path)
+            except OSError:
+                continue
+            self._disk_bytes -= size
+            self.disk_evictions += 1
+
+
+class CachedTTS(tts.TTS):
+    """TTS wrapper serving repeated short utterances from a TtsAudioCache"""
+
+    def __init__(self, wrapped: tts.TTS, cache: TtsAudioCache, voice_id: str | None):
+        """
+        Wrap a TTS for one voice.
+
+        Args:
+            wrapped: TTS used on cache misses and for long utterances
+            cache: Shared audio cache
+            voice_id: Voice the wrapped TTS speaks with (part of the cache key)
+        """
+        super().__init__(
+            capabilities=wrapped.capabilities,
+            sample_rate=wrapped.sample_rate,
+            num_channels=wrapped.num_channels,
+        )
+        self.wrapped = wrapped
+        self.cache = cache
+        self.voice_id = voice_id
+
+    @property
+    def model(self) -> str:
+        return self.wrapped.model
+
+    @property
+    def provider(self) -> str:
+        return self.wrapped.provider
+
+    def cache_key(self, text: str) -> str:
+        """Return the cache key of an utterance in this voice."""
+        return tts_cache_key(self.voice_id, self.model, self.sample_rate, text)
+
+    def synthesize(
+        self,
+        text: str,
+        *,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+    ) -> CachedChunkedStream:
+        return CachedChunkedStream(tts=self, input_text=text, conn_options=conn_options)
+
+    def stream(
+        self, *, conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS
+    ) -> CachedSynthesizeStream:
+        return CachedSynthesizeStream(tts=self, conn_options=conn_options)
+
+    def prewarm(self) -> None:
+        self.wrapped.prewarm()
+
+    async def aclose(self) -> None:
+        await self.wrapped.aclose()
+
+    async def speak(
+        self,
+        text: str,
+        output_emitter: tts.AudioEmitter,
+        conn_options: APIConnectOptions,
+    ) -> None:
+        """
+        Push an utterance's audio, from the cache or synthesized (and cached).
+
+        Args:
+            text: Complete utterance
+            output_emitter: Emitter initialized with this TTS's PCM format
+            conn_options: Connection options for the wrapped TTS
+        """
+        cacheable = self.cache.is_cacheable(text)
+        key = self.cache_key(text)
+        if cacheable:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                output_emitter.push(cached.pcm)
+                return
+
+        pcm = bytearray()
+        async with self.wrapped.stream(conn_options=conn_options) as stream:
+            stream.push_text(text)
+            stream.end_input()
+            async for audio in stream:
+                data = audio.frame.data.tobytes()
+                output_emitter.push(data)
+                pcm.extend(data)
+
+        if cacheable and pcm:
+            await self.cache.put(
+                key, CachedAudio(bytes(pcm), self.sample_rate, self.num_channels)
+            )
+
+
+def _initialize_pcm(output_emitter: tts.AudioEmitter, cached_tts: CachedTTS, **kwargs):
+    output_emitter.initialize(
+        request_id=utils.shortuuid(),
+        sample_rate=cached_tts.sample_rate,
+        num_channels=cached_tts.num_channels,
+        mime_type="audio/pcm",
+        **kwargs,
+    )
+
+
+class CachedChunkedStream(tts.ChunkedStream):
+    """Non-streaming synthesis of CachedTTS"""
+
+    _tts: CachedTTS
+
+    async def _run(self, output_emitter: tts.AudioEmitter) -> None:
+        _initialize_pcm(output_emitter, self._tts)
+        await self._tts.speak(self._input_text, output_emitter, self._conn_options)
+        output_emitter.flush()
+
+
+class CachedSynthesizeStream(tts.SynthesizeStream):
+    """Streaming synthesis of CachedTTS
+
+    Text is buffered while the turn could still be a cacheable utterance; each
+    flush (or the end of input) completes an utterance. Once the turn's text
+    grows past the cacheable length, one wrapped TTS stream is opened and the
+    rest of the turn is streamed through it as it arrives.
+    """
+
+    _tts: CachedTTS
+
+    async def _run(self, output_emitter: tts.AudioEmitter) -> None:
+        _initialize_pcm(output_emitter, self._tts, stream=True)
+        output_emitter.start_segment(segment_id=utils.shortuuid())
+        max_chars = self._tts.cache.settings.max_text_chars
+        buffered = ""
+        spoken_chars = 0  # Normalized characters of the utterances already spoken
+        passthrough: tts.SynthesizeStream | None = None
+        forward_task: asyncio.Task | None = None
+
+        try:
+            async for data in self._input_ch:
+                if passthrough is not None:
+                    if isinstance(data, self._FlushSentinel):
+                        passthrough.flush()
+                    else:
+                        passthrough.push_text(data)
+                    continue
+
+                if isinstance(data, self._FlushSentinel):
+                    if buffered.strip():
+                        await self._speak(buffered, output_emitter)
+                        spoken_chars += len(normalize_tts_text(buffered))
+                    buffered = ""
+                    continue
+
+                buffered += data
+                if spoken_chars + len(normalize_tts_text(buffered)) > max_chars:
+                    passthrough = self._tts.wrapped.stream(
+                        conn_options=self._conn_options
+                    )
+                    forward_task = asyncio.create_task(
+                        self._forward(passthrough, output_emitter)
+                    )
+                    passthrough.push_text(buffered)
+
+            if passthrough is not None and forward_task is not None:
+                passthrough.end_input()
+                await forward_task
+            elif buffered.strip():
+                await self._speak(buffered, output_emitter)
+        finally:
+            if forward_task is not None and not forward_task.done():
+                forward_task.cancel()
+            if passthrough is not None:
+                await passthrough.aclose()
+            output_emitter.end_segment()
+
+    async def _speak(self, text: str, output_emitter: tts.AudioEmitter) -> None:
+        await self._tts.speak(text, output_emitter, self._conn_options)
+        self._mark_started()
+
+    async def _forward(
+        self, stream: tts.SynthesizeStream, output_emitter: tts.AudioEmitter
+    ) -> None:
+        async for audio in stream:
+            output_emitter.push(audio.frame.data.tobytes())
+            self._mark_started()
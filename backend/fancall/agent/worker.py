@@ -7,25 +7,64 @@ a Hedra avatar.
 """
 
 import asyncio
-import base64
-import io
 import logging
-import re
+import tempfile
+from collections.abc import AsyncIterable, AsyncIterator
 from functools import partial
 
 import httpx
-from aioia_core.settings import FishAudioSettings, HedraSettings, OpenAIAPISettings
-from livekit import agents
-from livekit.agents import Agent, AgentSession, JobContext, WorkerOptions, cli
-from livekit.agents.types import NOT_GIVEN
-from livekit.plugins import fishaudio, hedra, openai
-from PIL import Image
+from aioia_core.settings import (
+    DatabaseSettings,
+    FishAudioSettings,
+    HedraSettings,
+    OpenAIAPISettings,
+)
+from livekit import agents, rtc
+from livekit.agents import (
+    NOT_GIVEN,
+    Agent,
+    AgentSession,
+    JobContext,
+    ModelSettings,
+    WorkerOptions,
+    cli,
+)
+from livekit.agents.llm import (
+    LLM,
+    ChatChunk,
+    ChatContext,
+    FunctionTool,
+    RawFunctionTool,
+)
+from livekit.plugins import hedra
 from pydantic import ValidationError
 
-from fancall.persona import DEFAULT_PERSONA, Persona
-from fancall.prompts import compose_instructions
+from fancall.agent.greetings import PendingGreeting, pick_greeting, replay
+from fancall.agent.lifetime import SessionReaper
+from fancall.agent.load import LoopLagProbe, WorkerLoadMonitor
+from fancall.agent.memory import (
+    DEFAULT_PERSONA_KEY,
+    ConversationMemoryStore,
+    SessionMemory,
+)
+from fancall.agent.prewarm import WorkerResources, get_worker_resources, prewarm
+from fancall.agent.segmentation import SEGMENTED_TEXT_TRANSFORMS, segment_tts
+from fancall.agent.timeline import SessionTimeline
+from fancall.persona import DEFAULT_PERSONA, Persona, resolve_persona
 from fancall.schemas import AgentDispatchRequest
-from fancall.settings import FancallModelSettings, LiveKitSettings
+from fancall.settings import (
+    AgentTelemetrySettings,
+    AssetHttpSettings,
+    AvatarCacheSettings,
+    ConversationMemorySettings,
+    FancallModelSettings,
+    LiveKitSettings,
+    PersonaCacheSettings,
+    SessionLifetimeSettings,
+    TtsCacheSettings,
+    TtsSegmentationSettings,
+    WorkerLoadSettings,
+)
 
 # Basic logging configuration
 logging.basicConfig(
@@ -43,12 +82,110 @@ class CompanionAgent(Agent):
     Processes user input and generates conversational responses using LLM and TTS.
     """
 
-    def __init__(self, instructions: str = DEFAULT_SYSTEM_PROMPT, **kwargs):
+    def __init__(
+        self,
+        instructions: str = DEFAULT_SYSTEM_PROMPT,
+        timeline: SessionTimeline | None = None,
+        greeting: PendingGreeting | None = None,
+        **kwargs,
+    ):
         super().__init__(instructions=instructions, **kwargs)
+        self.timeline = timeline
+        self.greeting = greeting
 
     async def on_enter(self) -> None:
-        """Called when agent becomes active in the session."""
-        # Initial greeting could be generated here if needed
+        """Called when agent becomes active in the session: play the greeting."""
+        # Let the LLM open its connection while the greeting plays
+        if isinstance(self.session.llm, LLM):
+            self.session.llm.prewarm()
+
+        if self.greeting is None:
+            return
+
+        frames = await self.greeting.frames()
+        if self.timeline:
+            self.timeline.mark("greeting")
+        # Without pre-synthesized audio the greeting goes through the TTS
+        self.session.say(
+            self.greeting.text, audio=replay(frames) if frames else NOT_GIVEN
+        )
+
+    # Nodes may be overridden as async generators (see livekit Agent.llm_node)
+    async def llm_node(  # pylint: disable=invalid-overridden-method
+        self,
+        chat_ctx: ChatContext,
+        tools: list[FunctionTool | RawFunctionTool],
+        model_settings: ModelSettings,
+    ) -> AsyncIterator[ChatChunk | str]:
+        """Default LLM node, marking the first token on the session timeline."""
+        async for chunk in Agent.default.llm_node(
+            self, chat_ctx, tools, model_settings
+        ):
+            if self.timeline:
+                self.timeline.mark("first_llm_token")
+            yield chunk
+
+    async def tts_node(  # pylint: disable=invalid-overridden-method
+        self, text: AsyncIterable[str], model_settings: ModelSettings
+    ) -> AsyncIterator[rtc.AudioFrame]:
+        """Default TTS node, marking the first audio frame on the session timeline."""
+        async for frame in Agent.default.tts_node(self, text, model_settings):
+            if self.timeline:
+                self.timeline.mark("first_tts_audio")
+            yield frame
+
+
+def _watch_callers(ctx: JobContext, reaper: SessionReaper) -> SessionReaper:
+    """Feed the room's callers to a session reaper and report the job's end."""
+    ctx.add_shutdown_callback(reaper.report)
+    for participant in ctx.room.remote_participants.values():
+        reaper.participant_connected(participant)
+    ctx.room.on("participant_connected", reaper.participant_connected)
+    ctx.room.on("participant_disconnected", reaper.participant_disconnected)
+    return reaper
+
+
+def _start_loading_memory(
+    store: ConversationMemoryStore,
+    settings: ConversationMemorySettings,
+    metadata: AgentDispatchRequest,
+) -> SessionMemory | None:
+    """Start loading the caller's memory of the persona (None without a signed-in caller)."""
+    if not (settings.enabled and metadata.user_id):
+        return None
+    memory = SessionMemory(
+        store, settings, metadata.user_id, metadata.persona_id or DEFAULT_PERSONA_KEY
+    )
+    memory.start_loading()
+    return memory
+
+
+async def _compose_instructions(
+    resources: WorkerResources,
+    timeline: SessionTimeline,
+    memory: SessionMemory | None,
+    system_prompt: str | None,
+    persona_key: str,
+    persona_version: int | None,
+) -> str:
+    """Compose the session's instructions: memoized static prefix, then memory."""
+    context = []
+    if memory:
+        with timeline.stage("load_memory"):
+            memory_context = await memory.context()
+        if memory_context:
+            context.append(memory_context)
+    composed = resources.get_instructions(
+        system_prompt, persona_key, persona_version, context
+    )
+    logger.info(
+        "Using instructions (%d tokens, %d-token static prefix, %d cache-eligible): %s",
+        composed.tokens,
+        composed.prefix_tokens,
+        composed.cacheable_tokens,
+        composed.text[:100] + "..." if len(composed.text) > 100 else composed.text,
+    )
+    return composed.text
 
 
 async def entrypoint(  # pylint: disable=too-many-locals
@@ -56,9 +193,11 @@ async def entrypoint(  # pylint: disable=too-many-locals
     default_persona: Persona,
     livekit_settings: LiveKitSettings,  # pylint: disable=unused-argument
     openai_settings: OpenAIAPISettings,  # pylint: disable=unused-argument
-    fish_settings: FishAudioSettings,
     hedra_settings: HedraSettings,
-    model_settings: FancallModelSettings,
+    telemetry_settings: AgentTelemetrySettings,
+    lifetime_settings: SessionLifetimeSettings,
+    memory_settings: ConversationMemorySettings,
+    loop_lag_dir: str | None = None,
 ) -> None:
     """
     Agent entrypoint. Initializes AgentSession for text-to-speech tasks.
@@ -68,32 +207,76 @@ async def entrypoint(  # pylint: disable=too-many-locals
         default_persona: Default persona for fallback configuration
         livekit_settings: LiveKit settings with API credentials (reserved for future use)
         openai_settings: OpenAI API settings (현재 미사용: livekit.plugins.openai가 환경변수 직접 사용)
-        fish_settings: Fish Audio TTS settings
         hedra_settings: Hedra avatar settings
-        model_settings: Fancall LLM model settings
+        telemetry_settings: Session timeline export settings
+        lifetime_settings: Session lifetime policy (per-tier limit, timeouts)
+        memory_settings: Conversation memory settings
+        loop_lag_dir: Directory this job reports its event-loop lag to, for the
+            worker's load score (not reported if unset)
     """
     logger.info("Agent entrypoint called for room: %s", ctx.room.name)
+    # Startup stages are timed from here; the timeline is exported at shutdown
+    timeline = SessionTimeline(ctx.room.name, ctx.job.id)
 
-    await ctx.connect()
+    async def export_timeline(reason: str) -> None:
+        timeline.export(telemetry_settings.timeline_path, shutdown_reason=reason)
+
+    ctx.add_shutdown_callback(export_timeline)
+
+    if loop_lag_dir:
+        lag_probe = LoopLagProbe(loop_lag_dir, ctx.job.id)
+        lag_probe.start()
+        ctx.add_shutdown_callback(lag_probe.aclose)
+
+    # LLM/TTS clients, default instructions and avatar cache come from prewarm
+    resources = get_worker_resources(ctx.proc)
+    # Job processes exit after their job, so job shutdown is process shutdown
+    ctx.add_shutdown_callback(resources.asset_http_client.aclose)
+
+    with timeline.stage("connect"):
+        await ctx.connect()
     logger.info("Connected to LiveKit room: %s", ctx.room.name)
 
     # Parse job metadata to get dynamic configuration
     metadata = AgentDispatchRequest()
     if ctx.job.metadata:
         try:
-            metadata = AgentDispatchRequest.model_validate_json(ctx.job.metadata)
+            with timeline.stage("parse_metadata"):
+                metadata = AgentDispatchRequest.model_validate_json(ctx.job.metadata)
         except ValidationError as e:
             logger.error("Failed to parse job metadata: %s", e)
             ctx.shutdown(reason="Invalid job metadata format")
             return
 
-    # Merge metadata with default_persona (metadata takes precedence)
-    avatar_id = metadata.avatar_id or default_persona.avatar_id
-    profile_picture_url = (
-        metadata.profile_picture_url or default_persona.profile_picture_url
+    # The job slot is held only while the session serves a caller
+    reaper = _watch_callers(
+        ctx, SessionReaper(lifetime_settings, metadata.session_tier)
     )
-    voice_id = metadata.voice_id or default_persona.voice_id
-    system_prompt = metadata.system_prompt or default_persona.system_prompt
+
+    # Signed-in callers' memory loads while the rest of the session starts
+    memory = _start_loading_memory(resources.memory_store, memory_settings, metadata)
+
+    # Registered personas are referenced by ID and served from the persona cache
+    registered_persona: Persona | None = None
+    persona_version: int | None = None
+    if metadata.persona_id:
+        with timeline.stage("resolve_persona"):
+            resolved = await resources.persona_registry.resolve(
+                metadata.persona_id, metadata.persona_version
+            )
+        if resolved is None:
+            logger.error("Registered persona not found: %s", metadata.persona_id)
+            ctx.shutdown(reason=f"Persona not found: {metadata.persona_id}")
+            return
+        registered_persona = resolved
+        persona_version = resolved.version
+
+    # Merge metadata, registered persona and default_persona (in that precedence)
+    persona = resolve_persona(metadata, registered_persona, default_persona)
+    avatar_id = persona.avatar_id
+    profile_picture_url = persona.profile_picture_url
+    voice_id = persona.voice_id
+    system_prompt = persona.system_prompt
 
     logger.info(
         "Agent configuration: avatar_id=%s, voice_id=%s",
@@ -101,17 +284,43 @@ async def entrypoint(  # pylint: disable=too-many-locals
         voice_id,
     )
 
-    # Initialize components
-    llm = openai.LLM(model=model_settings.openai_model)
+    # Initialize components (prewarmed clients are reused when possible)
+    llm = resources.get_llm()
     if voice_id:
         logger.info("Using Fish Audio voice_id: %s", voice_id)
 
-    tts = fishaudio.TTS(
-        api_key=fish_settings.api_key or NOT_GIVEN,
-        reference_id=voice_id or NOT_GIVEN,
-    )
+    tts = resources.get_tts(voice_id)
+
+    # The user turns "away" after idle_timeout_seconds of silence on both sides
+    user_away_timeout = lifetime_settings.idle_timeout_seconds or None
 
-    session: AgentSession = AgentSession(llm=llm, tts=tts)
+    # LLM text is segmented here and synthesized segment by segment (if enabled)
+    if resources.sentence_tokenizer:
+        session_tts = segment_tts(tts, resources.sentence_tokenizer)
+        ctx.add_shutdown_callback(session_tts.aclose)
+        session: AgentSession = AgentSession(
+            llm=llm,
+            tts=session_tts,
+            tts_text_transforms=SEGMENTED_TEXT_TRANSFORMS,
+            user_away_timeout=user_away_timeout,
+        )
+    else:
+        session = AgentSession(llm=llm, tts=tts, user_away_timeout=user_away_timeout)
+    session.on("user_state_changed", lambda ev: reaper.user_state_changed(ev.new_state))
+
+    if memory:
+        # Summarized after the call, so the caller never waits for it
+        async def remember_session() -> None:
+            assert memory is not None
+            await memory.remember(session.history, llm)
+
+        ctx.add_shutdown_callback(remember_session)
+
+    # The greeting is synthesized (or read from the TTS cache) during avatar start
+    greeting_text = pick_greeting(persona.greetings)
+    greeting = PendingGreeting(tts, greeting_text) if greeting_text else None
+    if greeting:
+        ctx.add_shutdown_callback(greeting.aclose)
 
     # Initialize Hedra avatar if enabled
     avatar_session = None
@@ -137,28 +346,19 @@ async def entrypoint(  # pylint: disable=too-many-locals
                 url[:100] + "..." if len(url) > 100 else url,
             )
 
-            # Handle both data URLs and HTTP(S) URLs
-            if url.startswith("data:"):
-                # Extract base64 data from data URL
-                match = re.match(r"data:image/[^;]+;base64,(.+)", url)
-                if match:
-                    base64_data = match.group(1)
-                    image_bytes = base64.b64decode(base64_data)
-                    avatar_image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
-                else:
-                    logger.error("Invalid data URL format")
-                    ctx.shutdown(
-                        reason="Invalid data URL format for profile_picture_url"
-                    )
-                    return
-            else:
-                # Regular HTTP(S) URL
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    avatar_image = Image.open(io.BytesIO(response.content)).convert(
-                        "RGB"
+            # Data URLs are decoded, HTTP(S) URLs fetched; both are served from cache
+            image_timings: dict[str, float] = {}
+            try:
+                with timeline.stage("avatar_image"):
+                    avatar_image = await resources.avatar_cache.get_image(
+                        url, resources.asset_http_client, image_timings
                     )
+            except (ValueError, httpx.HTTPError) as e:
+                logger.error("Failed to load profile picture: %s", e)
+                ctx.shutdown(reason=f"Failed to load profile_picture_url: {e}")
+                return
+            finally:
+                timeline.breakdown("avatar_image", image_timings)
 
             avatar_session = hedra.AvatarSession(
                 avatar_image=avatar_image,
@@ -173,40 +373,58 @@ async def entrypoint(  # pylint: disable=too-many-locals
             )
             return
 
-        await avatar_session.start(agent_session=session, room=ctx.room)
+        with timeline.stage("avatar_start"):
+            await avatar_session.start(agent_session=session, room=ctx.room)
 
-    # Compose instructions from merged system prompt (Context Composer pattern)
-    instructions = compose_instructions(system_prompt, include_role_playing=True)
-    logger.info(
-        "Using instructions: %s",
-        instructions[:100] + "..." if len(instructions) > 100 else instructions,
+    instructions = await _compose_instructions(
+        resources,
+        timeline,
+        memory,
+        system_prompt,
+        metadata.persona_id or DEFAULT_PERSONA_KEY,
+        persona_version,
     )
 
-    agent = CompanionAgent(instructions=instructions)
-    await session.start(agent=agent, room=ctx.room)
+    agent = CompanionAgent(
+        instructions=instructions, timeline=timeline, greeting=greeting
+    )
+    with timeline.stage("session_start"):
+        await session.start(agent=agent, room=ctx.room)
     logger.info("Agent session started.")
 
-    # Free trial: auto-shutdown after 75 seconds
+    # Ends at the tier's duration limit, on silence or when the caller leaves
     try:
-        await asyncio.sleep(75)
-        logger.info("Free trial session limit (75s) reached. Shutting down.")
-        ctx.shutdown(reason="Free trial session limit reached (75 seconds)")
+        reason = await reaper.run()
+        logger.info("Session ended (%s, tier=%s). Shutting down.", reason, reaper.tier)
+        ctx.shutdown(reason=f"Session ended: {reason}")
     except asyncio.CancelledError:
-        logger.info("Agent session cancelled before trial limit.")
+        logger.info("Agent session cancelled before its lifetime policy ended it.")
 
 
-def create_worker_options(
+def create_worker_options(  # pylint: disable=too-many-arguments
     default_persona: Persona,
+    *,
     livekit_settings: LiveKitSettings,
     openai_settings: OpenAIAPISettings,
     fish_settings: FishAudioSettings,
     hedra_settings: HedraSettings,
     model_settings: FancallModelSettings,
+    avatar_cache_settings: AvatarCacheSettings,
+    asset_http_settings: AssetHttpSettings,
+    tts_cache_settings: TtsCacheSettings,
+    segmentation_settings: TtsSegmentationSettings,
+    persona_cache_settings: PersonaCacheSettings,
+    database_settings: DatabaseSettings,
+    telemetry_settings: AgentTelemetrySettings,
+    lifetime_settings: SessionLifetimeSettings,
+    memory_settings: ConversationMemorySettings,
+    load_settings: WorkerLoadSettings,
 ) -> WorkerOptions:
     """
     Create WorkerOptions for the agent with dependency injection.
 
     Uses functools.partial for pickle-safe DI (required by multiprocessing).
+    Heavy, room-independent setup runs once per process in ``prewarm``.
 
     Args:
         default_persona: Default persona for agent configuration
@@ -215,22 +433,60 @@ def create_worker_options(
         fish_settings: Fish Audio TTS settings
         hedra_settings: Hedra avatar settings
         model_settings: Fancall LLM model settings
+        avatar_cache_settings: Avatar image cache settings
+        asset_http_settings: Asset HTTP client settings
+        tts_cache_settings: Synthesized speech cache settings
+        segmentation_settings: LLM-to-TTS text segmentation settings
+        persona_cache_settings: Registered persona cache settings
+        database_settings: Database settings for loading registered personas
+        telemetry_settings: Agent telemetry settings (Prometheus, session timelines)
+        lifetime_settings: Session lifetime policy (per-tier limit, timeouts)
+        memory_settings: Conversation memory settings
+        load_settings: Worker load score and job admission threshold
 
     Returns:
         WorkerOptions configured with the agent entrypoint
     """
+    loop_lag_dir = load_settings.loop_lag_dir or tempfile.mkdtemp(
+        prefix="fancall-loop-lag-"
+    )
     return WorkerOptions(
         entrypoint_fnc=partial(
             entrypoint,
             default_persona=default_persona,
             livekit_settings=livekit_settings,
             openai_settings=openai_settings,
+            hedra_settings=hedra_settings,
+            telemetry_settings=telemetry_settings,
+            lifetime_settings=lifetime_settings,
+            memory_settings=memory_settings,
+            loop_lag_dir=loop_lag_dir,
+        ),
+        prewarm_fnc=partial(
+            prewarm,
+            default_persona=default_persona,
             fish_settings=fish_settings,
             hedra_settings=hedra_settings,
+            database_settings=database_settings,
+            persona_cache_settings=persona_cache_settings,
             model_settings=model_settings,
+            avatar_cache_settings=avatar_cache_settings,
+            asset_http_settings=asset_http_settings,
+            tts_cache_settings=tts_cache_settings,
+            segmentation_settings=segmentation_settings,
         ),
         worker_type=agents.WorkerType.ROOM,
+        # Admission: LiveKit stops assigning jobs at the load threshold
+        load_fnc=WorkerLoadMonitor(load_settings, loop_lag_dir),
+        load_threshold=load_settings.load_threshold,
         agent_name=livekit_settings.agent_name,
+        # Stage histograms recorded in job processes are served from here
+        prometheus_port=(
+            telemetry_settings.prometheus_port
+            if telemetry_settings.prometheus_port is not None
+            else NOT_GIVEN
+        ),
+        prometheus_multiproc_dir=telemetry_settings.prometheus_multiproc_dir,
     )
 
 
@@ -241,14 +497,34 @@ def main() -> None:
     fish_settings = FishAudioSettings()
     hedra_settings = HedraSettings()
     model_settings = FancallModelSettings()
+    avatar_cache_settings = AvatarCacheSettings()
+    asset_http_settings = AssetHttpSettings()
+    tts_cache_settings = TtsCacheSettings()
+    segmentation_settings = TtsSegmentationSettings()
+    persona_cache_settings = PersonaCacheSettings()
+    database_settings = DatabaseSettings()
+    telemetry_settings = AgentTelemetrySettings()
+    lifetime_settings = SessionLifetimeSettings()
+    memory_settings = ConversationMemorySettings()
+    load_settings = WorkerLoadSettings()
     cli.run_app(
         create_worker_options(
             DEFAULT_PERSONA,
-            livekit_settings,
-            openai_settings,
-            fish_settings,
-            hedra_settings,
-            model_settings,
+            livekit_settings=livekit_settings,
+            openai_settings=openai_settings,
+            fish_settings=fish_settings,
+            hedra_settings=hedra_settings,
+            database_settings=database_settings,
+            persona_cache_settings=persona_cache_settings,
+            model_settings=model_settings,
+            avatar_cache_settings=avatar_cache_settings,
+            asset_http_settings=asset_http_settings,
+            tts_cache_settings=tts_cache_settings,
+            segmentation_settings=segmentation_settings,
+            telemetry_settings=telemetry_settings,
+            lifetime_settings=lifetime_settings,
+            memory_settings=memory_settings,
+            load_settings=load_settings,
         )
     )
 
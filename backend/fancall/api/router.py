@@ -2,7 +2,10 @@
 Fancall API router
 """
 
+import asyncio
+import logging
 import uuid
+from collections.abc import AsyncIterator
 
 from aioia_core.auth import UserInfoProvider
 from aioia_core.errors import (
@@ -14,22 +17,58 @@ from aioia_core.errors import (
 )
 from aioia_core.fastapi import BaseCrudRouter
 from aioia_core.settings import JWTSettings
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 from pydantic import BaseModel
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
 
-from fancall.factories import LiveRoomRepositoryFactory
-from fancall.repositories.live_room_repository import DatabaseLiveRoomRepository
+from fancall.factories import (
+    AsyncLiveRoomRepositoryFactory,
+    AsyncPersonaRepositoryFactory,
+    LiveRoomRepositoryFactory,
+    PersonaRepositoryFactory,
+)
+from fancall.metrics import DB_OPERATION_DURATION, MetricsRoute
+from fancall.repositories.agent_dispatch_repository import (
+    AsyncAgentDispatchRepository,
+    AsyncDatabaseAgentDispatchRepository,
+    DatabaseAgentDispatchRepository,
+    ThreadedAgentDispatchRepository,
+)
+from fancall.repositories.live_room_repository import (
+    AsyncLiveRoomRepository,
+    DatabaseLiveRoomRepository,
+    ThreadedLiveRoomRepository,
+)
+from fancall.repositories.persona_repository import (
+    AsyncPersonaRepository,
+    DatabasePersonaRepository,
+    ThreadedPersonaRepository,
+)
 from fancall.schemas import (
     AgentDispatchRequest,
+    BatchTokenRequest,
+    BatchTokenResponse,
     DispatchResponse,
     LiveRoom,
     LiveRoomCreate,
     LiveRoomUpdate,
+    PersonaCreate,
+    PersonaUpdate,
+    RegisteredPersona,
+    StartCallResponse,
     TokenResponse,
 )
-from fancall.services.livekit_service import LiveKitService
-from fancall.settings import LiveKitSettings
+from fancall.services.dispatch_guard import DispatchConflictError, DispatchGuard
+from fancall.services.livekit_service import LiveKitDispatchResponse, LiveKitService
+from fancall.services.room_cache import RoomExistenceCache
+from fancall.services.token_signer import TokenGrant
+from fancall.settings import DispatchGuardSettings, LiveKitSettings, RoomCacheSettings
+
+logger = logging.getLogger(__name__)
+
+# Error code of 409 responses (aioia_core has no conflict code)
+DISPATCH_CONFLICT = "DISPATCH_CONFLICT"
 
 
 class LiveRoomSingleItemResponse(BaseModel):
@@ -46,16 +85,209 @@ class LiveRoomRouter(
     def __init__(
         self,
         livekit_settings: LiveKitSettings,
+        livekit_service: LiveKitService | None = None,
+        async_repository_factory: AsyncLiveRoomRepositoryFactory | None = None,
+        room_cache: RoomExistenceCache | None = None,
+        persona_repository_factory: PersonaRepositoryFactory | None = None,
+        async_persona_repository_factory: AsyncPersonaRepositoryFactory | None = None,
+        dispatch_guard: DispatchGuard | None = None,
         **kwargs,
     ):
+        # Needed by _register_routes, which runs inside BaseCrudRouter.__init__
+        self.async_repository_factory = async_repository_factory
+        self.persona_repository_factory = (
+            persona_repository_factory
+            or PersonaRepositoryFactory(kwargs["db_session_factory"])
+        )
+        self.async_persona_repository_factory = async_persona_repository_factory
         super().__init__(**kwargs)
         self.livekit_settings = livekit_settings
+        # Shared by all routes so LiveKit API connections are pooled
+        self.livekit_service = livekit_service or LiveKitService(livekit_settings)
+        self.room_cache = room_cache or RoomExistenceCache(RoomCacheSettings())
+        self.dispatch_guard = dispatch_guard or DispatchGuard(DispatchGuardSettings())
+
+    async def _room_exists(
+        self, repository: AsyncLiveRoomRepository, room_id: str
+    ) -> bool:
+        """Check that a live room exists, consulting the room cache first"""
+        exists = self.room_cache.get(room_id)
+        if exists is None:
+            with DB_OPERATION_DURATION.labels("get_by_id").time():
+                exists = await repository.get_by_id(room_id) is not None
+            self.room_cache.put(room_id, exists)
+        return exists
+
+    async def _stamp_dispatch(
+        self,
+        repository: AsyncPersonaRepository,
+        request: AgentDispatchRequest,
+        user_id: str | None,
+    ) -> AgentDispatchRequest:
+        """
+        Stamp a dispatch with the caller, their session tier and the persona version.
+
+        All are set by the server: client-supplied values are overwritten (the
+        persona version is cleared when no persona is referenced).
+        """
+        request = request.model_copy(
+            update={
+                "session_tier": "member" if user_id else "guest",
+                "user_id": user_id,
+                "persona_version": None,
+            }
+        )
+        if request.persona_id is None:
+            return request
+        with DB_OPERATION_DURATION.labels("get_persona_version").time():
+            version = await repository.get_version(request.persona_id)
+        if version is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "detail": f"Persona not found: {request.persona_id}",
+                    "code": RESOURCE_NOT_FOUND,
+                },
+            )
+        return request.model_copy(update={"persona_version": version})
+
+    async def _resolve_participant(
+        self, user_id: str | None, db_session: Session
+    ) -> tuple[str, str]:
+        """Determine LiveKit identity and display name based on authentication"""
+        if not user_id:
+            # Anonymous user: generate temporary identity
+            return f"guest-{uuid.uuid4()}", "Guest"
+
+        # Authenticated user (provider guaranteed by startup validation)
+        # Get user info (follows aioia-core pattern)
+        assert (
+            self.user_info_provider
+        ), "user_info_provider must be set (startup validation failed)"
+        user_info = await run_in_threadpool(
+            self.user_info_provider.get_user_info, user_id, db_session
+        )
+        if user_info is None:
+            # User not found in database - authentication/data inconsistency
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail={
+                    "detail": "User not found",
+                    "code": UNAUTHORIZED,
+                },
+            )
+
+        # Use nickname if available, otherwise username, otherwise user_id
+        return user_id, user_info.nickname or user_info.username or user_id
+
+    def _issue_token(
+        self, identity: str, display_name: str, room_id: str
+    ) -> TokenResponse:
+        """Mint a participant token for a room"""
+        token_response = self.livekit_service.generate_token(
+            user_id=identity,
+            name=display_name,
+            room_name=room_id,
+        )
+        if not token_response:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "detail": "Failed to generate token",
+                    "code": INTERNAL_SERVER_ERROR,
+                },
+            )
+
+        return TokenResponse(
+            token=token_response.token,
+            room_name=token_response.room_name,
+            identity=token_response.identity,
+        )
+
+    def _create_async_repository_dependency(self) -> None:
+        """Create the dependency yielding an event-loop friendly repository"""
+        async_repository_factory = self.async_repository_factory
+
+        async def get_async_repository() -> AsyncIterator[AsyncLiveRoomRepository]:
+            """Repository on an AsyncSession (non-blocking DB round trips)"""
+            assert async_repository_factory is not None
+            async with async_repository_factory.db_session_factory() as db_session:
+                yield async_repository_factory.create_repository(db_session)
+
+        async def get_threaded_repository(
+            # Not shared with other dependencies: routes use it concurrently with
+            # them, from another thread, and a Session is not thread-safe
+            db_session: Session = Depends(self.get_db_dep, use_cache=False),
+        ) -> AsyncIterator[AsyncLiveRoomRepository]:
+            """Synchronous repository offloaded to the threadpool"""
+            yield ThreadedLiveRoomRepository(
+                self.repository_factory.create_repository(db_session)
+            )
+
+        self.get_async_repository_dep = (
+            get_async_repository
+            if async_repository_factory is not None
+            else get_threaded_repository
+        )
+
+        async_persona_repository_factory = self.async_persona_repository_factory
+
+        async def get_async_persona_repository() -> (
+            AsyncIterator[AsyncPersonaRepository]
+        ):
+            """Persona repository on an AsyncSession"""
+            assert async_persona_repository_factory is not None
+            async with async_persona_repository_factory.db_session_factory() as session:
+                yield async_persona_repository_factory.create_repository(session)
+
+        async def get_threaded_persona_repository(
+            # Not shared with other dependencies: it is used from another thread
+            db_session: Session = Depends(self.get_db_dep, use_cache=False),
+        ) -> AsyncIterator[AsyncPersonaRepository]:
+            """Synchronous persona repository offloaded to the threadpool"""
+            yield ThreadedPersonaRepository(
+                self.persona_repository_factory.create_repository(db_session)
+            )
+
+        self.get_async_persona_repository_dep = (
+            get_async_persona_repository
+            if async_persona_repository_factory is not None
+            else get_threaded_persona_repository
+        )
+
+        async def get_async_dispatch_repository() -> (
+            AsyncIterator[AsyncAgentDispatchRepository]
+        ):
+            """Agent dispatch claims on an AsyncSession"""
+            assert async_repository_factory is not None
+            async with async_repository_factory.db_session_factory() as db_session:
+                yield AsyncDatabaseAgentDispatchRepository(db_session)
+
+        async def get_threaded_dispatch_repository(
+            # Not shared with other dependencies: it is used from another thread
+            db_session: Session = Depends(self.get_db_dep, use_cache=False),
+        ) -> AsyncIterator[AsyncAgentDispatchRepository]:
+            """Synchronous agent dispatch claims offloaded to the threadpool"""
+            yield ThreadedAgentDispatchRepository(
+                DatabaseAgentDispatchRepository(db_session)
+            )
+
+        self.get_async_dispatch_repository_dep = (
+            get_async_dispatch_repository
+            if async_repository_factory is not None
+            else get_threaded_dispatch_repository
+        )
 
     def _register_routes(self) -> None:
         """Register routes for LiveRoom CRUD and LiveKit integration"""
+        # Per-route latency and in-flight metrics (see fancall.metrics)
+        self.router.route_class = MetricsRoute
+        self._create_async_repository_dependency()
         self._register_public_create_route()  # POST /live-rooms (public)
         self._register_token_route()  # POST /live-rooms/{id}/token
+        self._register_batch_token_route()  # POST /live-rooms/tokens (admin)
         self._register_dispatch_route()  # POST /live-rooms/{id}/dispatch
+        self._register_start_call_route()  # POST /live-rooms/start-call
 
     def _register_public_create_route(self) -> None:
         """POST /live-rooms - Public endpoint for creating live rooms"""
@@ -72,9 +304,12 @@ class LiveRoomRouter(
             },
         )
         async def create_room(
-            repository: DatabaseLiveRoomRepository = Depends(self.get_repository_dep),
+            repository: AsyncLiveRoomRepository = Depends(
+                self.get_async_repository_dep
+            ),
         ):
-            created_room = repository.create(LiveRoomCreate())
+            with DB_OPERATION_DURATION.labels("create").time():
+                created_room = await repository.create(LiveRoomCreate())
             if not created_room:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -83,6 +318,8 @@ class LiveRoomRouter(
                         "code": RESOURCE_CREATION_FAILED,
                     },
                 )
+            # The token and dispatch calls that follow skip the DB lookup
+            self.room_cache.put(created_room.id, True)
             return LiveRoomSingleItemResponse(data=created_room)
 
     def _register_token_route(self) -> None:
@@ -102,11 +339,12 @@ class LiveRoomRouter(
             room_id: str,
             user_id: str | None = Depends(self.get_current_user_id_dep),
             db_session=Depends(self.get_db_dep),
-            repository: DatabaseLiveRoomRepository = Depends(self.get_repository_dep),
+            repository: AsyncLiveRoomRepository = Depends(
+                self.get_async_repository_dep
+            ),
         ):
             # Verify room exists
-            live_room = repository.get_by_id(room_id)
-            if not live_room:
+            if not await self._room_exists(repository, room_id):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail={
@@ -115,56 +353,73 @@ class LiveRoomRouter(
                     },
                 )
 
-            # Determine identity and display name based on authentication
-            identity: str
-            display_name: str
-
-            if user_id:
-                # Authenticated user (provider guaranteed by startup validation)
-                identity = user_id
-
-                # Get user info (follows aioia-core pattern)
-                assert (
-                    self.user_info_provider
-                ), "user_info_provider must be set (startup validation failed)"
-                user_info = self.user_info_provider.get_user_info(user_id, db_session)
-                if user_info is None:
-                    # User not found in database - authentication/data inconsistency
+            identity, display_name = await self._resolve_participant(
+                user_id, db_session
+            )
+            return self._issue_token(identity, display_name, room_id)
+
+    def _register_batch_token_route(self) -> None:
+        """POST /live-rooms/tokens - Issue tokens for many participants (admin only)"""
+
+        @self.router.post(
+            f"/{self.resource_name}/tokens",
+            response_model=BatchTokenResponse,
+            summary="Generate Access Tokens in Batch (Admin Only)",
+            description="Issue access tokens for many identities and rooms at once, "
+            "e.g. for group fan-meet events. Requires admin privileges.",
+            responses={
+                401: {"model": ErrorResponse},
+                403: {"model": ErrorResponse},
+                404: {"model": ErrorResponse},
+                500: {"model": ErrorResponse},
+            },
+        )
+        async def generate_tokens(
+            request: BatchTokenRequest,
+            _admin_user: str = Depends(self.get_admin_user_dep),
+            repository: AsyncLiveRoomRepository = Depends(
+                self.get_async_repository_dep
+            ),
+        ):
+            # Verify every distinct room exists
+            for room_id in dict.fromkeys(item.room_id for item in request.items):
+                if not await self._room_exists(repository, room_id):
                     raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        status_code=status.HTTP_404_NOT_FOUND,
                         detail={
-                            "detail": "User not found",
-                            "code": UNAUTHORIZED,
+                            "detail": f"Live room not found: {room_id}",
+                            "code": RESOURCE_NOT_FOUND,
                         },
                     )
 
-                # Use nickname if available, otherwise username, otherwise user_id
-                display_name = user_info.nickname or user_info.username or user_id
-            else:
-                # Anonymous user: generate temporary identity
-                identity = f"guest-{uuid.uuid4()}"
-                display_name = "Guest"
-
-            # Generate token
-            livekit_service = LiveKitService(self.livekit_settings)
-            token_response = livekit_service.generate_token(
-                user_id=identity,
-                name=display_name,
-                room_name=room_id,
+            token_responses = self.livekit_service.generate_tokens(
+                [
+                    TokenGrant(
+                        identity=item.identity,
+                        name=item.name or item.identity,
+                        room_name=item.room_id,
+                    )
+                    for item in request.items
+                ]
             )
-            if not token_response:
+            if token_responses is None:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail={
-                        "detail": "Failed to generate token",
+                        "detail": "Failed to generate tokens",
                         "code": INTERNAL_SERVER_ERROR,
                     },
                 )
 
-            return TokenResponse(
-                token=token_response.token,
-                room_name=token_response.room_name,
-                identity=token_response.identity,
+            return BatchTokenResponse(
+                data=[
+                    TokenResponse(
+                        token=token_response.token,
+                        room_name=token_response.room_name,
+                        identity=token_response.identity,
+                    )
+                    for token_response in token_responses
+                ]
             )
 
     def _register_dispatch_route(self) -> None:
@@ -174,19 +429,34 @@ class LiveRoomRouter(
             f"/{self.resource_name}/{{room_id}}/dispatch",
             response_model=DispatchResponse,
             summary="Dispatch Agent",
+            description="Dispatch the agent to a room. A room gets one agent: "
+            "repeated requests for the room, or with the same Idempotency-Key, "
+            "return its existing dispatch.",
             responses={
                 404: {"model": ErrorResponse},
+                409: {"model": ErrorResponse},
                 500: {"model": ErrorResponse},
             },
         )
         async def dispatch_agent(
             room_id: str,
             request: AgentDispatchRequest,
-            repository: DatabaseLiveRoomRepository = Depends(self.get_repository_dep),
+            user_id: str | None = Depends(self.get_current_user_id_dep),
+            idempotency_key: str | None = Header(
+                default=None, alias="Idempotency-Key", max_length=255
+            ),
+            repository: AsyncLiveRoomRepository = Depends(
+                self.get_async_repository_dep
+            ),
+            persona_repository: AsyncPersonaRepository = Depends(
+                self.get_async_persona_repository_dep
+            ),
+            dispatch_repository: AsyncAgentDispatchRepository = Depends(
+                self.get_async_dispatch_repository_dep
+            ),
         ):
             # Verify room exists
-            live_room = repository.get_by_id(room_id)
-            if not live_room:
+            if not await self._room_exists(repository, room_id):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail={
@@ -195,9 +465,22 @@ class LiveRoomRouter(
                     },
                 )
 
-            # Dispatch agent
-            livekit_service = LiveKitService(self.livekit_settings)
-            dispatch_response = await livekit_service.dispatch_agent(request, room_id)
+            async def create_dispatch() -> LiveKitDispatchResponse | None:
+                return await self.livekit_service.dispatch_agent(
+                    await self._stamp_dispatch(persona_repository, request, user_id),
+                    room_id,
+                )
+
+            # Dispatch agent (only if the room has none yet)
+            try:
+                dispatch_response = await self.dispatch_guard.dispatch(
+                    dispatch_repository, room_id, idempotency_key, create_dispatch
+                )
+            except DispatchConflictError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail={"detail": str(e), "code": DISPATCH_CONFLICT},
+                ) from e
             if not dispatch_response:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -213,8 +496,107 @@ class LiveRoomRouter(
                 agent_name=dispatch_response.agent_name,
             )
 
+    def _register_start_call_route(self) -> None:
+        """POST /live-rooms/start-call - Create room, issue token and dispatch agent"""
+
+        @self.router.post(
+            f"/{self.resource_name}/start-call",
+            response_model=StartCallResponse,
+            status_code=status.HTTP_201_CREATED,
+            summary="Start Call",
+            description="Create a live room, issue the caller's access token and "
+            "dispatch the agent in one request. Available to all users "
+            "(authenticated or anonymous).",
+            responses={
+                401: {"model": ErrorResponse},
+                404: {"model": ErrorResponse},
+                500: {"model": ErrorResponse},
+            },
+        )
+        async def start_call(
+            request: AgentDispatchRequest,
+            user_id: str | None = Depends(self.get_current_user_id_dep),
+            db_session=Depends(self.get_db_dep),
+            repository: AsyncLiveRoomRepository = Depends(
+                self.get_async_repository_dep
+            ),
+            persona_repository: AsyncPersonaRepository = Depends(
+                self.get_async_persona_repository_dep
+            ),
+            dispatch_repository: AsyncAgentDispatchRepository = Depends(
+                self.get_async_dispatch_repository_dep
+            ),
+        ):
+            # Checked first, so an unknown persona or caller leaves nothing behind
+            stamped_request, participant = await asyncio.gather(
+                self._stamp_dispatch(persona_repository, request, user_id),
+                self._resolve_participant(user_id, db_session),
+                return_exceptions=True,
+            )
+            for outcome in (stamped_request, participant):
+                if isinstance(outcome, BaseException):
+                    raise outcome
+            assert isinstance(stamped_request, AgentDispatchRequest)
+            assert isinstance(participant, tuple)
+
+            # The room ID doubles as the LiveKit room name, so assigning it up
+            # front lets the insert and dispatch run concurrently. The token is
+            # issued first: a signer error then has nothing to clean up
+            room_id = str(uuid.uuid4())
+            identity, display_name = participant
+            token = self._issue_token(identity, display_name, room_id)
+
+            async def create_room() -> LiveRoom:
+                with DB_OPERATION_DURATION.labels("create").time():
+                    return await repository.create(LiveRoomCreate(id=room_id))
 
-def create_fancall_router(
+            async def create_dispatch() -> LiveKitDispatchResponse | None:
+                return await self.livekit_service.dispatch_agent(
+                    stamped_request, room_id
+                )
+
+            async def dispatch() -> LiveKitDispatchResponse | None:
+                # Recorded, so a later dispatch request for the room returns it
+                return await self.dispatch_guard.dispatch_new_room(
+                    dispatch_repository, room_id, create_dispatch
+                )
+
+            created_room, dispatch_response = await asyncio.gather(
+                create_room(), dispatch(), return_exceptions=True
+            )
+
+            if isinstance(created_room, BaseException):
+                if isinstance(dispatch_response, LiveKitDispatchResponse):
+                    # Nobody can join the room, so the agent would only hold a slot
+                    await self.livekit_service.delete_dispatch(
+                        dispatch_response.dispatch_id, room_id
+                    )
+                raise created_room
+            self.room_cache.put(created_room.id, True)
+
+            if isinstance(dispatch_response, BaseException):
+                raise dispatch_response
+            if not dispatch_response:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail={
+                        "detail": "Failed to dispatch agent",
+                        "code": INTERNAL_SERVER_ERROR,
+                    },
+                )
+
+            return StartCallResponse(
+                room=created_room,
+                token=token,
+                dispatch=DispatchResponse(
+                    dispatch_id=dispatch_response.dispatch_id,
+                    room_name=dispatch_response.room_name,
+                    agent_name=dispatch_response.agent_name,
+                ),
+            )
+
+
+def create_fancall_router(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     livekit_settings: LiveKitSettings,
     jwt_settings: JWTSettings,
     db_session_factory: sessionmaker,
@@ -222,6 +604,12 @@ def create_fancall_router(
     user_info_provider: UserInfoProvider | None = None,
     resource_name: str = "live-rooms",
     tags: list[str] | None = None,
+    livekit_service: LiveKitService | None = None,
+    async_repository_factory: AsyncLiveRoomRepositoryFactory | None = None,
+    room_cache: RoomExistenceCache | None = None,
+    persona_repository_factory: PersonaRepositoryFactory | None = None,
+    async_persona_repository_factory: AsyncPersonaRepositoryFactory | None = None,
+    dispatch_guard: DispatchGuard | None = None,
 ) -> APIRouter:
     """
     Create fancall router with Settings-only injection pattern.
@@ -234,12 +622,35 @@ def create_fancall_router(
         user_info_provider: Optional user info provider
         resource_name: Resource name for routes (default: "live-rooms")
         tags: Optional OpenAPI tags
+        livekit_service: Optional shared LiveKit service. Pass the instance owned
+            by the app lifespan so it can be closed on shutdown.
+        async_repository_factory: Optional async LiveRoom repository factory.
+            When set, room lookups and creation use SQLAlchemy's asyncio engine;
+            otherwise the synchronous repository runs in the threadpool.
+        room_cache: Optional room existence cache. Pass a shared instance to read
+            its stats, and call ``invalidate`` on it when deleting rooms.
+        persona_repository_factory: Optional persona registry repository factory
+            (default: one on ``db_session_factory``). Serves the admin-only
+            ``/personas`` CRUD routes.
+        async_persona_repository_factory: Optional async persona registry
+            repository factory, used for persona lookups on dispatch.
+        dispatch_guard: Optional per-room agent dispatch guard (default: one
+            with ``DispatchGuardSettings`` from the environment).
 
     Returns:
         FastAPI APIRouter instance
     """
+    persona_repository_factory = persona_repository_factory or PersonaRepositoryFactory(
+        db_session_factory
+    )
     router = LiveRoomRouter(
         livekit_settings=livekit_settings,
+        livekit_service=livekit_service,
+        async_repository_factory=async_repository_factory,
+        room_cache=room_cache,
+        persona_repository_factory=persona_repository_factory,
+        async_persona_repository_factory=async_persona_repository_factory,
+        dispatch_guard=dispatch_guard,
         model_class=LiveRoom,
         create_schema=LiveRoomCreate,
         update_schema=LiveRoomUpdate,
@@ -250,4 +661,20 @@ def create_fancall_router(
         resource_name=resource_name,
         tags=tags or ["Fancall"],
     )
-    return router.get_router()
+    # Registered personas, referenced by persona_id in dispatch requests
+    persona_router = BaseCrudRouter[
+        RegisteredPersona, PersonaCreate, PersonaUpdate, DatabasePersonaRepository
+    ](
+        model_class=RegisteredPersona,
+        create_schema=PersonaCreate,
+        update_schema=PersonaUpdate,
+        db_session_factory=db_session_factory,
+        repository_factory=persona_repository_factory,
+        user_info_provider=user_info_provider,
+        jwt_secret_key=jwt_settings.secret_key,
+        resource_name="personas",
+        tags=tags or ["Fancall"],
+    )
+    api_router = router.get_router()
+    api_router.include_router(persona_router.get_router())
+    return api_router
@@ -0,0 +1,328 @@
+"""
+Fancall database helpers
+"""
+
+import bisect
+import threading
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from aioia_core.settings import DatabaseSettings
+from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, Connection, Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from fancall.settings import DatabasePoolSettings
+
+# Async DBAPI driver used for each backend of a synchronous DATABASE_URL
+ASYNC_DRIVERS: dict[str, str] = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+
+def to_async_database_url(url: str) -> str:
+    """
+    Convert a synchronous database URL to its asyncio driver equivalent.
+
+    ``postgresql://`` and ``postgresql+psycopg2://`` become ``postgresql+asyncpg://``,
+    ``sqlite://`` becomes ``sqlite+aiosqlite://``. URLs that already name an async
+    driver are returned unchanged.
+
+    Args:
+        url: Database URL (e.g. DATABASE_URL)
+
+    Returns:
+        Database URL for SQLAlchemy's asyncio engine
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        raise ValueError(f"No async driver configured for database backend: {backend}")
+    if parsed.get_driver_name() == driver:
+        return url
+    return parsed.set(drivername=f"{backend}+{driver}").render_as_string(
+        hide_password=False
+    )
+
+
+class PoolMetrics:
+    """
+    Checkout telemetry of a connection pool.
+
+    Records how long ``Pool.connect()`` takes (waiting for a free connection,
+    opening an overflow connection, pre-ping) in a cumulative histogram, counts
+    checkout timeouts, and reports the live occupancy of the pool.
+    """
+
+    def __init__(self, wait_buckets_ms: list[float]):
+        """
+        Initialize pool metrics.
+
+        Args:
+            wait_buckets_ms: Sorted upper bounds of the wait histogram in milliseconds
+        """
+        self.wait_buckets_ms = sorted(wait_buckets_ms)
+        # One count per bucket plus the +Inf bucket, non-cumulative
+        self._bucket_counts = [0] * (len(self.wait_buckets_ms) + 1)
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.timeouts = 0
+        # Set by the instrumented pool (and its replacement after dispose())
+        self.pool: Pool | None = None
+        # Sync sessions check out connections from threadpool threads
+        self._lock = threading.Lock()
+
+    def observe_checkout(self, seconds: float, timed_out: bool = False) -> None:
+        """Record one checkout and its duration."""
+        index = bisect.bisect_left(self.wait_buckets_ms, seconds * 1000)
+        with self._lock:
+            self._bucket_counts[index] += 1
+            self.checkouts += 1
+            self.wait_seconds_total += seconds
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return pool occupancy and checkout statistics.
+
+        Returns:
+            dict with ``size``, ``checked_out``, ``checked_in``, ``overflow``,
+            ``checkouts``, ``timeouts``, ``wait_seconds_total`` and the cumulative
+            ``wait_histogram_ms`` (upper bound -> count, ``+Inf`` last)
+        """
+        with self._lock:
+            bucket_counts = list(self._bucket_counts)
+            checkouts = self.checkouts
+            wait_seconds_total = self.wait_seconds_total
+            timeouts = self.timeouts
+
+        histogram: dict[str, int] = {}
+        cumulative = 0
+        for bound, count in zip([*self.wait_buckets_ms, "+Inf"], bucket_counts):
+            cumulative += count
+            histogram[str(bound)] = cumulative
+
+        pool = self.pool
+        occupancy: dict[str, int | None] = dict.fromkeys(
+            ("size", "checked_out", "checked_in", "overflow")
+        )
+        if isinstance(pool, QueuePool):
+            occupancy = {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                # SQLAlchemy reports unopened pool slots as negative overflow
+                "overflow": max(pool.overflow(), 0),
+            }
+        return {
+            **occupancy,
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "wait_seconds_total": wait_seconds_total,
+            "wait_histogram_ms": histogram,
+        }
+
+
+class _CheckoutTimingMixin:
+    """Pool mixin timing ``connect()``; ``metrics`` is bound per engine"""
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.metrics.pool = self  # type: ignore[assignment]
+
+    def connect(self) -> Any:
+        """Check out a connection, recording the time it took."""
+        start = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]  # pylint: disable=no-member
+        except PoolTimeoutError:
+            self.metrics.observe_checkout(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.observe_checkout(time.perf_counter() - start)
+        return connection
+
+
+def _is_memory_database(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in {None, "", ":memory:"}
+
+
+def _engine_options(
+    url: URL,
+    db_settings: DatabaseSettings,
+    pool_settings: DatabasePoolSettings,
+    pool_class: type[QueuePool],
+    metrics: PoolMetrics | None,
+) -> dict[str, Any]:
+    """Build create_engine keyword arguments for the configured pool"""
+    options: dict[str, Any] = {
+        "echo": False,
+        "pool_pre_ping": pool_settings.pre_ping,
+        "pool_recycle": db_settings.pool_recycle,
+    }
+    # In-memory SQLite keeps the dialect's single-connection pool
+    if not _is_memory_database(url):
+        if metrics is not None:
+            pool_class = type(
+                f"Instrumented{pool_class.__name__}",
+                (_CheckoutTimingMixin, pool_class),
+                {"metrics": metrics},
+            )
+        options.update(
+            poolclass=pool_class,
+            pool_size=db_settings.pool_size,
+            max_overflow=db_settings.max_overflow,
+            pool_timeout=db_settings.pool_timeout,
+            pool_use_lifo=pool_settings.use_lifo,
+        )
+
+    driver = url.get_driver_name()
+    if driver == "psycopg2":
+        options["connect_args"] = {
+            "connect_timeout": db_settings.connection_timeout,
+            "options": f"-c statement_timeout={db_settings.statement_timeout}",
+        }
+    elif driver == "asyncpg":
+        options["connect_args"] = {
+            "timeout": db_settings.connection_timeout,
+            "server_settings": {
+                "statement_timeout": str(db_settings.statement_timeout)
+            },
+        }
+    return options
+
+
+def create_db_engine(
+    db_settings: DatabaseSettings,
+    pool_settings: DatabasePoolSettings | None = None,
+    metrics: PoolMetrics | None = None,
+) -> Engine:
+    """
+    Create the synchronous engine with the configured connection pool.
+
+    Args:
+        db_settings: Database settings (DATABASE_URL, DATABASE_POOL_*)
+        pool_settings: Additional pool settings (FANCALL_DB_POOL_*)
+        metrics: Optional pool metrics to record checkouts into
+
+    Returns:
+        SQLAlchemy Engine
+    """
+    url = make_url(db_settings.url)
+    return create_engine(
+        url,
+        **_engine_options(
+            url,
+            db_settings,
+            pool_settings or DatabasePoolSettings(),
+            QueuePool,
+            metrics,
+        ),
+    )
+
+
+def create_async_db_engine(
+    db_settings: DatabaseSettings,
+    pool_settings: DatabasePoolSettings | None = None,
+    metrics: PoolMetrics | None = None,
+) -> AsyncEngine:
+    """
+    Create an asyncio engine for the configured database.
+
+    Args:
+        db_settings: Database settings (DATABASE_URL, DATABASE_POOL_*)
+        pool_settings: Additional pool settings (FANCALL_DB_POOL_*)
+        metrics: Optional pool metrics to record checkouts into
+
+    Returns:
+        SQLAlchemy AsyncEngine
+    """
+    url = make_url(to_async_database_url(db_settings.url))
+    return create_async_engine(
+        url,
+        **_engine_options(
+            url,
+            db_settings,
+            pool_settings or DatabasePoolSettings(),
+            AsyncAdaptedQueuePool,
+            metrics,
+        ),
+    )
+
+
+def schema_is_current(connection: Connection, script_location: str) -> bool:
+    """
+    Check that the database is stamped with every Alembic head revision.
+
+    Alembic is imported here, so only callers that opt into the check pay for it.
+
+    Args:
+        connection: Open database connection
+        script_location: Path of the Alembic migration environment
+
+    Returns:
+        True if the database is up to date with the migration scripts
+    """
+    # pylint: disable=import-outside-toplevel
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    heads = set(ScriptDirectory(script_location).get_heads())
+    current = set(MigrationContext.configure(connection).get_current_heads())
+    return current == heads
+
+
+def create_async_session_factory(
+    engine: AsyncEngine | None = None,
+) -> async_sessionmaker:
+    """
+    Create an AsyncSession factory, optionally bound to an engine.
+
+    Objects are not expired on commit, so models stay readable after
+    ``commit()`` without an implicit (and in asyncio, illegal) lazy refresh.
+
+    Args:
+        engine: SQLAlchemy AsyncEngine. May be bound later with
+            ``configure(bind=engine)``, e.g. once the app lifespan created it.
+
+    Returns:
+        async_sessionmaker producing AsyncSession instances
+    """
+    return async_sessionmaker(bind=engine, expire_on_commit=False)
+
+
+@asynccontextmanager
+async def short_lived_async_session(
+    db_settings: DatabaseSettings,
+) -> AsyncIterator[AsyncSession]:
+    """
+    Open an AsyncSession on a dedicated engine that is disposed on exit.
+
+    Meant for agent job processes, which touch the database once or twice per
+    job, so no connection pool outlives the lookup.
+
+    Args:
+        db_settings: Database settings (DATABASE_URL)
+
+    Yields:
+        AsyncSession
+    """
+    engine = create_async_db_engine(db_settings)
+    try:
+        async with create_async_session_factory(engine)() as db_session:
+            yield db_session
+    finally:
+        await engine.dispose()
@@ -5,9 +5,17 @@ Fancall factories
 from __future__ import annotations
 
 from aioia_core.factories import BaseRepositoryFactory
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 
-from fancall.repositories.live_room_repository import DatabaseLiveRoomRepository
+from fancall.repositories.live_room_repository import (
+    AsyncDatabaseLiveRoomRepository,
+    DatabaseLiveRoomRepository,
+)
+from fancall.repositories.persona_repository import (
+    AsyncDatabasePersonaRepository,
+    DatabasePersonaRepository,
+)
 
 
 class LiveRoomRepositoryFactory(BaseRepositoryFactory[DatabaseLiveRoomRepository]):
@@ -18,3 +26,55 @@ class LiveRoomRepositoryFactory(BaseRepositoryFactory[DatabaseLiveRoomRepository
             db_session_factory=db_session_factory,
             repository_class=DatabaseLiveRoomRepository,
         )
+
+
+class AsyncLiveRoomRepositoryFactory:
+    """Async LiveRoom repository factory (SQLAlchemy asyncio sessions)"""
+
+    def __init__(self, db_session_factory: async_sessionmaker):
+        self.db_session_factory = db_session_factory
+
+    def create_repository(
+        self, db_session: AsyncSession
+    ) -> AsyncDatabaseLiveRoomRepository:
+        """
+        Create a repository bound to a session.
+
+        Args:
+            db_session: AsyncSession owned by the caller (e.g. a request dependency)
+
+        Returns:
+            AsyncDatabaseLiveRoomRepository instance
+        """
+        return AsyncDatabaseLiveRoomRepository(db_session)
+
+
+class PersonaRepositoryFactory(BaseRepositoryFactory[DatabasePersonaRepository]):
+    """Persona registry repository factory"""
+
+    def __init__(self, db_session_factory: sessionmaker):
+        super().__init__(
+            db_session_factory=db_session_factory,
+            repository_class=DatabasePersonaRepository,
+        )
+
+
+class AsyncPersonaRepositoryFactory:
+    """Async persona registry repository factory (SQLAlchemy asyncio sessions)"""
+
+    def __init__(self, db_session_factory: async_sessionmaker):
+        self.db_session_factory = db_session_factory
+
+    def create_repository(
+        self, db_session: AsyncSession
+    ) -> AsyncDatabasePersonaRepository:
+        """
+        Create a repository bound to a session.
+
+        Args:
+            db_session: AsyncSession owned by the caller (e.g. a request dependency)
+
+        Returns:
+            AsyncDatabasePersonaRepository instance
+        """
+        return AsyncDatabasePersonaRepository(db_session)
@@ -0,0 +1,80 @@
+"""
+Prometheus metrics for the Fancall API
+
+Metrics are registered in the default prometheus_client registry and served by
+the application's ``/metrics`` endpoint.
+"""
+
+import time
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi import HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from prometheus_client import Counter, Gauge, Histogram
+
+# Token signing is pure CPU work in the tens of microseconds
+SIGNING_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.005)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "fancall_http_request_duration_seconds",
+    "Latency of Fancall API requests by route template",
+    ["method", "route", "status"],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "fancall_http_requests_in_progress",
+    "Fancall API requests currently being handled",
+    ["method", "route"],
+)
+DB_OPERATION_DURATION = Histogram(
+    "fancall_db_operation_duration_seconds",
+    "Latency of live room database operations",
+    ["operation"],
+)
+TOKEN_SIGNING_DURATION = Histogram(
+    "fancall_token_signing_duration_seconds",
+    "Time to sign one batch of LiveKit access tokens",
+    buckets=SIGNING_BUCKETS,
+)
+LIVEKIT_DISPATCH_DURATION = Histogram(
+    "fancall_livekit_create_dispatch_duration_seconds",
+    "Latency of LiveKit CreateDispatch calls, including the reconnect retry",
+    ["outcome"],
+)
+API_ERRORS = Counter(
+    "fancall_api_errors_total",
+    "Error responses by aioia error code",
+    ["code", "status"],
+)
+
+
+class MetricsRoute(APIRoute):
+    """APIRoute recording latency and in-flight requests under the route template"""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        methods = ",".join(sorted(self.methods or ()))
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(methods, self.path)
+
+        async def timed_handler(request: Request) -> Response:
+            status = 500
+            start = time.perf_counter()
+            in_progress.inc()
+            try:
+                response = await handler(request)
+                status = response.status_code
+                return response
+            except HTTPException as e:
+                status = e.status_code
+                raise
+            except RequestValidationError:
+                status = 422
+                raise
+            finally:
+                in_progress.dec()
+                HTTP_REQUEST_DURATION.labels(methods, self.path, str(status)).observe(
+                    time.perf_counter() - start
+                )
+
+        return timed_handler
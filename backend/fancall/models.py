@@ -3,6 +3,8 @@ Fancall SQLAlchemy models
 """
 
 from aioia_core.models import BaseModel
+from sqlalchemy import JSON, Integer, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy_mixins import SerializeMixin  # type: ignore
 
 
@@ -10,3 +12,47 @@ class DBLiveRoom(BaseModel, SerializeMixin):
     """LiveRoom database model"""
 
     __tablename__ = "live_rooms"
+
+
+class DBPersona(BaseModel, SerializeMixin):
+    """Registered persona database model, referenced by ID in dispatches"""
+
+    __tablename__ = "personas"
+
+    avatar_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    profile_picture_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    voice_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    system_prompt: Mapped[str | None] = mapped_column(Text, nullable=True)
+    greetings: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
+    # Incremented on every update; workers cache personas per version
+    version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+
+
+class DBConversationMemory(BaseModel, SerializeMixin):
+    """Rolling summary of a user's past conversations with one persona"""
+
+    __tablename__ = "conversation_memories"
+    __table_args__ = (UniqueConstraint("user_id", "persona_key"),)
+
+    user_id: Mapped[str] = mapped_column(String, nullable=False)
+    # Registered persona ID, or "default" for the default persona
+    persona_key: Mapped[str] = mapped_column(String, nullable=False)
+    summary: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    summary_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    session_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class DBAgentDispatch(BaseModel, SerializeMixin):
+    """Agent dispatch of a live room, shared by all API replicas"""
+
+    __tablename__ = "agent_dispatches"
+
+    # Unique: a room has at most one agent dispatch
+    room_id: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+    idempotency_key: Mapped[str | None] = mapped_column(
+        String, nullable=True, unique=True
+    )
+    # "pending" while the claiming request dispatches, then "dispatched"
+    status: Mapped[str] = mapped_column(String, nullable=False)
+    dispatch_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    agent_name: Mapped[str | None] = mapped_column(String, nullable=True)
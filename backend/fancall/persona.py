@@ -28,6 +28,53 @@ class Persona(BaseModel):
         default=None,
         description="System prompt for the agent",
     )
+    greetings: list[str] | None = Field(
+        default=None,
+        description="Greetings, one of which is played (pre-synthesized) on join",
+    )
+
+
+def merge_personas(*personas: Persona) -> Persona:
+    """
+    Merge personas field by field; the first persona setting a field wins.
+
+    Args:
+        personas: Personas in order of precedence (e.g. dispatch metadata,
+            registered persona, default persona)
+
+    Returns:
+        Merged persona
+    """
+    return Persona(
+        **{
+            name: next((getattr(p, name) for p in personas if getattr(p, name)), None)
+            for name in Persona.model_fields.keys()
+        }
+    )
+
+
+def resolve_persona(
+    overrides: Persona, registered: Persona | None, default: Persona
+) -> Persona:
+    """
+    Merge a job's persona: dispatch overrides, registered persona, then default.
+
+    Greetings are a persona's own words, so a registered persona without
+    greetings does not inherit the default persona's.
+
+    Args:
+        overrides: Inline persona fields of the dispatch
+        registered: Registered persona the dispatch refers to, if any
+        default: Default persona
+
+    Returns:
+        Merged persona
+    """
+    if registered is None:
+        return merge_personas(overrides, default)
+    return merge_personas(
+        overrides, registered, default.model_copy(update={"greetings": None})
+    )
 
 
 EUNWOO_SYSTEM_PROMPT = """You are chatting 1:1 with the user.
@@ -90,4 +137,9 @@ DEFAULT_PERSONA = Persona(
     voice_id="c5274be32cac4aa4bd7b69f51a8a4b83",
     profile_picture_url="https://storage.googleapis.com/buppy/profile-pictures/017433aa-748f-400a-9f16-e326b0e5b02d.png",
     system_prompt=EUNWOO_SYSTEM_PROMPT,
+    greetings=[
+        "Oh, hi. You came.",
+        "Hello. Nice to see you.",
+        "Hi... welcome.",
+    ],
 )
@@ -1,5 +1,10 @@
 """
 Common prompts for Fancall agents.
+
+Instructions start with their static content (role playing guidelines, then
+the persona's system prompt) so that every job of a persona sends the same
+prompt prefix; per-call context goes after it. Token counts are estimates:
+no tokenizer is a dependency of the agent.
 """
 
 ROLE_PLAYING_GUIDELINES = """대부분의 텍스트는 사용자의 관점에서 본 대화여야 합니다.
@@ -36,3 +41,29 @@ def compose_instructions(
         parts.append(system_prompt)
 
     return "\n\n".join(parts)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of a text without a tokenizer.
+
+    About 4 ASCII characters per token; other characters (e.g. Hangul) are
+    counted as one token each, which errs on the side of a smaller prompt.
+    """
+    ascii_chars = sum(1 for char in text if char.isascii())
+    return (ascii_chars + 3) // 4 + len(text) - ascii_chars
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut a text to at most ``max_tokens`` (estimated), at a line break if possible."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    lines: list[str] = []
+    used = 0
+    for line in text.splitlines():
+        used += estimate_tokens(line) + 1
+        if used > max_tokens:
+            break
+        lines.append(line)
+    # A single over-long line is cut by characters
+    return "\n".join(lines) if lines else text[:max_tokens]
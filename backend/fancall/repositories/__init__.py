@@ -2,6 +2,40 @@
 Fancall repositories
 """
 
-from fancall.repositories.live_room_repository import DatabaseLiveRoomRepository
+from fancall.repositories.agent_dispatch_repository import (
+    AsyncAgentDispatchRepository,
+    AsyncDatabaseAgentDispatchRepository,
+    DatabaseAgentDispatchRepository,
+    ThreadedAgentDispatchRepository,
+)
+from fancall.repositories.conversation_memory_repository import (
+    AsyncDatabaseConversationMemoryRepository,
+)
+from fancall.repositories.live_room_repository import (
+    AsyncDatabaseLiveRoomRepository,
+    AsyncLiveRoomRepository,
+    DatabaseLiveRoomRepository,
+    ThreadedLiveRoomRepository,
+)
+from fancall.repositories.persona_repository import (
+    AsyncDatabasePersonaRepository,
+    AsyncPersonaRepository,
+    DatabasePersonaRepository,
+    ThreadedPersonaRepository,
+)
 
-__all__ = ["DatabaseLiveRoomRepository"]
+__all__ = [
+    "AsyncAgentDispatchRepository",
+    "AsyncDatabaseAgentDispatchRepository",
+    "AsyncDatabaseConversationMemoryRepository",
+    "AsyncDatabaseLiveRoomRepository",
+    "AsyncDatabasePersonaRepository",
+    "AsyncLiveRoomRepository",
+    "AsyncPersonaRepository",
+    "DatabaseAgentDispatchRepository",
+    "DatabaseLiveRoomRepository",
+    "DatabasePersonaRepository",
+    "ThreadedAgentDispatchRepository",
+    "ThreadedLiveRoomRepository",
+    "ThreadedPersonaRepository",
+]
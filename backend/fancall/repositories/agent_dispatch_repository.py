@@ -0,0 +1,304 @@
+"""
+Fancall agent dispatch repositories
+
+A room's dispatch is one row, claimed by inserting it as pending before the
+agent is dispatched. Room IDs and idempotency keys are unique, so of concurrent
+claims (on any API replica) exactly one succeeds; the others get the row they
+conflicted with.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Protocol
+
+from sqlalchemy import Delete, Select, Update, delete, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from fancall.models import DBAgentDispatch
+from fancall.schemas import AgentDispatchRecord
+
+DISPATCH_PENDING = "pending"
+DISPATCH_DISPATCHED = "dispatched"
+
+
+def _convert_db_dispatch_to_model(db_dispatch: DBAgentDispatch) -> AgentDispatchRecord:
+    """Convert DBAgentDispatch to AgentDispatchRecord model"""
+    return AgentDispatchRecord.model_validate(db_dispatch.to_dict())
+
+
+def _conflicting_dispatches(
+    room_id: str, idempotency_key: str | None
+) -> Select[tuple[DBAgentDispatch]]:
+    """Query the dispatches of a room or of an idempotency key"""
+    conditions = [DBAgentDispatch.room_id == room_id]
+    if idempotency_key:
+        conditions.append(DBAgentDispatch.idempotency_key == idempotency_key)
+    # Re-read rows already in the session, so polls see other replicas' updates
+    return (
+        select(DBAgentDispatch)
+        .where(or_(*conditions))
+        .execution_options(populate_existing=True)
+    )
+
+
+def _pick_conflict(
+    rows: Sequence[DBAgentDispatch], idempotency_key: str | None
+) -> AgentDispatchRecord | None:
+    """Pick the matching dispatch, preferring the one with the idempotency key"""
+    for row in rows:
+        if idempotency_key and row.idempotency_key == idempotency_key:
+            return _convert_db_dispatch_to_model(row)
+    return _convert_db_dispatch_to_model(rows[0]) if rows else None
+
+
+def _completion(claim_id: str, dispatch_id: str, agent_name: str) -> Update:
+    return (
+        update(DBAgentDispatch)
+        .where(DBAgentDispatch.id == claim_id)
+        .values(
+            status=DISPATCH_DISPATCHED, dispatch_id=dispatch_id, agent_name=agent_name
+        )
+    )
+
+
+def _dispatched(room_id: str, dispatch_id: str, agent_name: str) -> DBAgentDispatch:
+    return DBAgentDispatch(
+        room_id=room_id,
+        status=DISPATCH_DISPATCHED,
+        dispatch_id=dispatch_id,
+        agent_name=agent_name,
+    )
+
+
+def _release(claim_id: str) -> Delete:
+    return delete(DBAgentDispatch).where(
+        DBAgentDispatch.id == claim_id, DBAgentDispatch.status == DISPATCH_PENDING
+    )
+
+
+class AsyncAgentDispatchRepository(Protocol):
+    """Agent dispatch claims used by the dispatch routes, awaitable on the event loop"""
+
+    # Stub bodies keep type checkers from expecting a return value
+    # pylint: disable=unnecessary-ellipsis
+
+    async def claim(
+        self, room_id: str, idempotency_key: str | None
+    ) -> tuple[AgentDispatchRecord | None, bool]:
+        """Claim a room's dispatch"""
+        ...
+
+    async def find(
+        self, room_id: str, idempotency_key: str | None
+    ) -> AgentDispatchRecord | None:
+        """Find the dispatch of a room or of an idempotency key"""
+        ...
+
+    async def complete(self, claim_id: str, dispatch_id: str, agent_name: str) -> None:
+        """Record the agent dispatch of a claim"""
+        ...
+
+    async def release(self, claim_id: str) -> None:
+        """Remove a pending claim"""
+        ...
+
+    async def record(self, room_id: str, dispatch_id: str, agent_name: str) -> bool:
+        """Record the agent dispatch of a room that was not claimed"""
+        ...
+
+
+class DatabaseAgentDispatchRepository:
+    """Database implementation of agent dispatch claims"""
+
+    def __init__(self, db_session: Session):
+        """
+        Initialize DatabaseAgentDispatchRepository.
+
+        Args:
+            db_session: SQLAlchemy session
+        """
+        self.db_session = db_session
+
+    def claim(
+        self, room_id: str, idempotency_key: str | None
+    ) -> tuple[AgentDispatchRecord | None, bool]:
+        """
+        Claim a room's dispatch by inserting it as pending.
+
+        Args:
+            room_id: Live room ID
+            idempotency_key: Client-supplied idempotency key, if any
+
+        Returns:
+            (the new claim, True), or (the conflicting dispatch, False). The
+            conflicting dispatch is None if it was released in the meantime.
+        """
+        db_dispatch = DBAgentDispatch(
+            room_id=room_id, idempotency_key=idempotency_key, status=DISPATCH_PENDING
+        )
+        self.db_session.add(db_dispatch)
+        try:
+            self.db_session.commit()
+        except IntegrityError:
+            self.db_session.rollback()
+            rows = self.db_session.scalars(
+                _conflicting_dispatches(room_id, idempotency_key)
+            ).all()
+            return _pick_conflict(rows, idempotency_key), False
+        return _convert_db_dispatch_to_model(db_dispatch), True
+
+    def find(
+        self, room_id: str, idempotency_key: str | None
+    ) -> AgentDispatchRecord | None:
+        """
+        Find the dispatch of a room or of an idempotency key (read only).
+
+        Ends the read transaction, so later polls see other replicas' commits.
+        """
+        rows = self.db_session.scalars(
+            _conflicting_dispatches(room_id, idempotency_key)
+        ).all()
+        self.db_session.commit()
+        return _pick_conflict(rows, idempotency_key)
+
+    def complete(self, claim_id: str, dispatch_id: str, agent_name: str) -> None:
+        """Record the agent dispatch of a claim"""
+        self.db_session.execute(_completion(claim_id, dispatch_id, agent_name))
+        self.db_session.commit()
+
+    def release(self, claim_id: str) -> None:
+        """Remove a pending claim, so the room can be claimed again"""
+        self.db_session.execute(_release(claim_id))
+        self.db_session.commit()
+
+    def record(self, room_id: str, dispatch_id: str, agent_name: str) -> bool:
+        """
+        Record the agent dispatch of a room that was not claimed, in one write.
+
+        Args:
+            room_id: Live room ID
+            dispatch_id: LiveKit dispatch ID
+            agent_name: Dispatched agent name
+
+        Returns:
+            False if the room already had a dispatch
+        """
+        self.db_session.add(_dispatched(room_id, dispatch_id, agent_name))
+        try:
+            self.db_session.commit()
+        except IntegrityError:
+            self.db_session.rollback()
+            return False
+        return True
+
+
+class AsyncDatabaseAgentDispatchRepository:
+    """Async database implementation of agent dispatch claims (SQLAlchemy asyncio)"""
+
+    def __init__(self, db_session: AsyncSession):
+        """
+        Initialize AsyncDatabaseAgentDispatchRepository.
+
+        Args:
+            db_session: SQLAlchemy AsyncSession
+        """
+        self.db_session = db_session
+
+    async def claim(
+        self, room_id: str, idempotency_key: str | None
+    ) -> tuple[AgentDispatchRecord | None, bool]:
+        """Claim a room's dispatch (see ``DatabaseAgentDispatchRepository.claim``)"""
+        db_dispatch = DBAgentDispatch(
+            room_id=room_id, idempotency_key=idempotency_key, status=DISPATCH_PENDING
+        )
+        self.db_session.add(db_dispatch)
+        try:
+            await self.db_session.commit()
+        except IntegrityError:
+            await self.db_session.rollback()
+            result = await self.db_session.scalars(
+                _conflicting_dispatches(room_id, idempotency_key)
+            )
+            return _pick_conflict(result.all(), idempotency_key), False
+        return _convert_db_dispatch_to_model(db_dispatch), True
+
+    async def find(
+        self, room_id: str, idempotency_key: str | None
+    ) -> AgentDispatchRecord | None:
+        """Find the dispatch of a room or of an idempotency key (read only)"""
+        result = await self.db_session.scalars(
+            _conflicting_dispatches(room_id, idempotency_key)
+        )
+        rows = result.all()
+        await self.db_session.commit()
+        return _pick_conflict(rows, idempotency_key)
+
+    async def complete(self, claim_id: str, dispatch_id: str, agent_name: str) -> None:
+        """Record the agent dispatch of a claim"""
+        await self.db_session.execute(_completion(claim_id, dispatch_id, agent_name))
+        await self.db_session.commit()
+
+    async def release(self, claim_id: str) -> None:
+        """Remove a pending claim, so the room can be claimed again"""
+        await self.db_session.execute(_release(claim_id))
+        await self.db_session.commit()
+
+    async def record(self, room_id: str, dispatch_id: str, agent_name: str) -> bool:
+        """Record the agent dispatch of an unclaimed room (False if it had one)"""
+        self.db_session.add(_dispatched(room_id, dispatch_id, agent_name))
+        try:
+            await self.db_session.commit()
+        except IntegrityError:
+            await self.db_session.rollback()
+            return False
+        return True
+
+
+class ThreadedAgentDispatchRepository:
+    """
+    Async facade over DatabaseAgentDispatchRepository.
+
+    Used when no async database is configured: the synchronous calls run in the
+    threadpool so they do not block the event loop.
+    """
+
+    def __init__(self, repository: DatabaseAgentDispatchRepository):
+        """
+        Initialize ThreadedAgentDispatchRepository.
+
+        Args:
+            repository: Synchronous agent dispatch repository
+        """
+        self.repository = repository
+
+    async def claim(
+        self, room_id: str, idempotency_key: str | None
+    ) -> tuple[AgentDispatchRecord | None, bool]:
+        """Claim a room's dispatch"""
+        return await run_in_threadpool(self.repository.claim, room_id, idempotency_key)
+
+    async def find(
+        self, room_id: str, idempotency_key: str | None
+    ) -> AgentDispatchRecord | None:
+        """Find the dispatch of a room or of an idempotency key"""
+        return await run_in_threadpool(self.repository.find, room_id, idempotency_key)
+
+    async def complete(self, claim_id: str, dispatch_id: str, agent_name: str) -> None:
+        """Record the agent dispatch of a claim"""
+        await run_in_threadpool(
+            self.repository.complete, claim_id, dispatch_id, agent_name
+        )
+
+    async def release(self, claim_id: str) -> None:
+        """Remove a pending claim"""
+        await run_in_threadpool(self.repository.release, claim_id)
+
+    async def record(self, room_id: str, dispatch_id: str, agent_name: str) -> bool:
+        """Record the agent dispatch of a room that was not claimed"""
+        return await run_in_threadpool(
+            self.repository.record, room_id, dispatch_id, agent_name
+        )
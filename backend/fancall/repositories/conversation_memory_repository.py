@@ -0,0 +1,82 @@
+"""
+Fancall conversation memory repository
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fancall.models import DBConversationMemory
+from fancall.schemas import ConversationMemory
+
+
+def _convert_db_memory_to_model(db_memory: DBConversationMemory) -> ConversationMemory:
+    """Convert DBConversationMemory to ConversationMemory model"""
+    return ConversationMemory.model_validate(db_memory.to_dict())
+
+
+class AsyncDatabaseConversationMemoryRepository:
+    """Async database implementation of conversation memory (SQLAlchemy asyncio)"""
+
+    def __init__(self, db_session: AsyncSession):
+        """
+        Initialize AsyncDatabaseConversationMemoryRepository.
+
+        Args:
+            db_session: SQLAlchemy AsyncSession
+        """
+        self.db_session = db_session
+
+    async def _get_db_memory(
+        self, user_id: str, persona_key: str
+    ) -> DBConversationMemory | None:
+        return await self.db_session.scalar(
+            select(DBConversationMemory).where(
+                DBConversationMemory.user_id == user_id,
+                DBConversationMemory.persona_key == persona_key,
+            )
+        )
+
+    async def get(self, user_id: str, persona_key: str) -> ConversationMemory | None:
+        """Get a user's memory of a persona"""
+        db_memory = await self._get_db_memory(user_id, persona_key)
+        return _convert_db_memory_to_model(db_memory) if db_memory else None
+
+    async def save(
+        self, user_id: str, persona_key: str, summary: str, summary_tokens: int
+    ) -> ConversationMemory:
+        """
+        Replace a user's memory of a persona with a new summary, counting the session.
+
+        Args:
+            user_id: User ID
+            persona_key: Registered persona ID, or "default"
+            summary: New rolling summary
+            summary_tokens: Estimated token count of the summary
+
+        Returns:
+            Saved memory
+        """
+        try:
+            return await self._save(user_id, persona_key, summary, summary_tokens)
+        except IntegrityError:
+            # Another session of the same user inserted the row first
+            await self.db_session.rollback()
+            return await self._save(user_id, persona_key, summary, summary_tokens)
+
+    async def _save(
+        self, user_id: str, persona_key: str, summary: str, summary_tokens: int
+    ) -> ConversationMemory:
+        db_memory = await self._get_db_memory(user_id, persona_key)
+        if db_memory is None:
+            db_memory = DBConversationMemory(
+                user_id=user_id, persona_key=persona_key, session_count=0
+            )
+            self.db_session.add(db_memory)
+        db_memory.summary = summary
+        db_memory.summary_tokens = summary_tokens
+        db_memory.session_count += 1
+        await self.db_session.commit()
+        return _convert_db_memory_to_model(db_memory)
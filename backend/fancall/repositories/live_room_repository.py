@@ -4,10 +4,14 @@ Fancall repositories
 
 from __future__ import annotations
 
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Protocol
+from uuid import uuid4
 
 from aioia_core.repositories import BaseRepository
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from fancall.models import DBLiveRoom
 from fancall.schemas import LiveRoom, LiveRoomCreate, LiveRoomUpdate
@@ -71,3 +75,76 @@ class DatabaseLiveRoomRepository(
         if not item_id:
             raise ValueError("LiveRoom ID is required for update")
         return super().update(item_id, schema)
+
+
+class AsyncLiveRoomRepository(Protocol):
+    """LiveRoom operations used by the router, awaitable on the event loop"""
+
+    # Stub bodies keep type checkers from expecting a return value
+    # pylint: disable=unnecessary-ellipsis
+
+    async def get_by_id(self, item_id: str) -> LiveRoom | None:
+        """Get LiveRoom by ID"""
+        ...
+
+    async def create(self, schema: LiveRoomCreate) -> LiveRoom:
+        """Create new LiveRoom"""
+        ...
+
+
+class AsyncDatabaseLiveRoomRepository:
+    """Async database implementation of LiveRoomRepository (SQLAlchemy asyncio)"""
+
+    def __init__(self, db_session: AsyncSession):
+        """
+        Initialize AsyncDatabaseLiveRoomRepository.
+
+        Args:
+            db_session: SQLAlchemy AsyncSession
+        """
+        self.db_session = db_session
+
+    async def get_by_id(self, item_id: str) -> LiveRoom | None:
+        """Get LiveRoom by ID"""
+        db_live_room = await self.db_session.get(DBLiveRoom, item_id)
+        return _convert_db_live_room_to_model(db_live_room) if db_live_room else None
+
+    async def create(self, schema: LiveRoomCreate) -> LiveRoom:
+        """Create new LiveRoom (same defaults as BaseRepository.create)"""
+        create_data = _convert_live_room_to_db_model(schema)
+        now = datetime.now(timezone.utc)
+        create_data.setdefault("id", str(uuid4()))
+        create_data.setdefault("created_at", now)
+        create_data.setdefault("updated_at", now)
+
+        db_live_room = DBLiveRoom(**create_data)
+        self.db_session.add(db_live_room)
+        await self.db_session.commit()
+        await self.db_session.refresh(db_live_room)
+        return _convert_db_live_room_to_model(db_live_room)
+
+
+class ThreadedLiveRoomRepository:
+    """
+    Async facade over DatabaseLiveRoomRepository.
+
+    Used when no async database is configured: the synchronous calls run in the
+    threadpool so they do not block the event loop.
+    """
+
+    def __init__(self, repository: DatabaseLiveRoomRepository):
+        """
+        Initialize ThreadedLiveRoomRepository.
+
+        Args:
+            repository: Synchronous LiveRoom repository
+        """
+        self.repository = repository
+
+    async def get_by_id(self, item_id: str) -> LiveRoom | None:
+        """Get LiveRoom by ID"""
+        return await run_in_threadpool(self.repository.get_by_id, item_id)
+
+    async def create(self, schema: LiveRoomCreate) -> LiveRoom:
+        """Create new LiveRoom"""
+        return await run_in_threadpool(self.repository.create, schema)
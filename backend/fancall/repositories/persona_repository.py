@@ -0,0 +1,128 @@
+"""
+Fancall persona registry repositories
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Protocol
+
+from aioia_core.repositories import BaseRepository
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from fancall.models import DBPersona
+from fancall.schemas import PersonaCreate, PersonaUpdate, RegisteredPersona
+
+
+def _convert_db_persona_to_model(db_persona: DBPersona) -> RegisteredPersona:
+    """Convert DBPersona to RegisteredPersona model"""
+    return RegisteredPersona.model_validate(db_persona.to_dict())
+
+
+def _convert_persona_to_db_model(persona: PersonaCreate) -> dict:
+    """Convert PersonaCreate schema to dictionary for database storage"""
+    return persona.model_dump(exclude_unset=True)
+
+
+class DatabasePersonaRepository(
+    BaseRepository[RegisteredPersona, DBPersona, PersonaCreate, PersonaUpdate]
+):
+    """Database implementation of the persona registry"""
+
+    def __init__(self, db_session: Session):
+        """
+        Initialize DatabasePersonaRepository.
+
+        Args:
+            db_session: SQLAlchemy session
+        """
+        super().__init__(
+            db_session=db_session,
+            db_model=DBPersona,
+            convert_to_model=_convert_db_persona_to_model,
+            convert_to_db_model=_convert_persona_to_db_model,
+        )
+
+    def get_version(self, item_id: str) -> int | None:
+        """Get the current version of a persona (None if it does not exist)"""
+        return self.db_session.scalar(
+            select(DBPersona.version).where(DBPersona.id == item_id)
+        )
+
+    def update(self, item_id: str, schema: PersonaUpdate) -> RegisteredPersona | None:
+        """Update a persona, incrementing its version"""
+        if not item_id:
+            raise ValueError("Persona ID is required for update")
+        db_persona = self.db_session.get(DBPersona, item_id)
+        if db_persona is None:
+            return None
+
+        for field, value in schema.model_dump(exclude_unset=True).items():
+            setattr(db_persona, field, value)
+        # Incremented in SQL, so concurrent updates each get their own version
+        db_persona.version = DBPersona.version + 1  # type: ignore[assignment]
+        db_persona.updated_at = datetime.now(timezone.utc)
+
+        self.db_session.commit()
+        self.db_session.refresh(db_persona)
+        return _convert_db_persona_to_model(db_persona)
+
+
+class AsyncPersonaRepository(Protocol):
+    """Persona lookups used by the dispatch routes, awaitable on the event loop"""
+
+    # Stub bodies keep type checkers from expecting a return value
+    # pylint: disable=unnecessary-ellipsis
+
+    async def get_version(self, item_id: str) -> int | None:
+        """Get the current version of a persona"""
+        ...
+
+
+class AsyncDatabasePersonaRepository:
+    """Async database implementation of the persona registry (SQLAlchemy asyncio)"""
+
+    def __init__(self, db_session: AsyncSession):
+        """
+        Initialize AsyncDatabasePersonaRepository.
+
+        Args:
+            db_session: SQLAlchemy AsyncSession
+        """
+        self.db_session = db_session
+
+    async def get_by_id(self, item_id: str) -> RegisteredPersona | None:
+        """Get a registered persona by ID"""
+        db_persona = await self.db_session.get(DBPersona, item_id)
+        return _convert_db_persona_to_model(db_persona) if db_persona else None
+
+    async def get_version(self, item_id: str) -> int | None:
+        """Get the current version of a persona, without loading its content"""
+        return await self.db_session.scalar(
+            select(DBPersona.version).where(DBPersona.id == item_id)
+        )
+
+
+class ThreadedPersonaRepository:
+    """
+    Async facade over DatabasePersonaRepository.
+
+    Used when no async database is configured: the synchronous calls run in the
+    threadpool so they do not block the event loop.
+    """
+
+    def __init__(self, repository: DatabasePersonaRepository):
+        """
+        Initialize ThreadedPersonaRepository.
+
+        Args:
+            repository: Synchronous persona repository
+        """
+        self.repository = repository
+
+    async def get_version(self, item_id: str) -> int | None:
+        """Get the current version of a persona"""
+        return await run_in_threadpool(self.repository.get_version, item_id)
@@ -3,15 +3,89 @@ Fancall Pydantic schemas
 """
 
 from datetime import datetime
+from typing import Literal
 
 from humps import camelize
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from fancall.persona import Persona
 
+# Upper bound on tokens issued by one batch request
+MAX_BATCH_TOKEN_ITEMS = 500
+
+# Session lifetime policy tier of a dispatch: anonymous or signed-in caller
+SessionTier = Literal["guest", "member"]
+
 
 class AgentDispatchRequest(Persona):
-    """API dispatch 요청 스키마. Persona를 상속하여 확장 가능."""
+    """API dispatch 요청 스키마. Persona를 상속하여 확장 가능.
+
+    ``persona_id`` refers to a registered persona, so the dispatch metadata stays
+    small; inline persona fields override the registered ones.
+    """
+
+    persona_id: str | None = Field(
+        default=None, description="ID of a registered persona"
+    )
+    persona_version: int | None = Field(
+        default=None,
+        description="Version of the registered persona, set by the server on dispatch",
+    )
+    session_tier: SessionTier | None = Field(
+        default=None,
+        description="Session lifetime policy tier, set by the server on dispatch",
+    )
+    user_id: str | None = Field(
+        default=None,
+        description="Signed-in caller whose conversation memory the agent uses, "
+        "set by the server on dispatch",
+    )
+
+
+# Persona registry schemas
+class PersonaCreate(Persona):
+    """Persona registration model - used in requests"""
+
+
+class PersonaUpdate(Persona):
+    """Persona update model - used for partial update requests"""
+
+
+class RegisteredPersona(Persona):
+    """Registered persona complete model - used in responses"""
+
+    id: str
+    version: int
+    created_at: datetime
+    updated_at: datetime
+
+
+# Conversation memory schemas
+class ConversationMemory(BaseModel):
+    """Rolling summary of a user's past conversations with one persona"""
+
+    id: str
+    user_id: str
+    persona_key: str
+    summary: str
+    summary_tokens: int
+    session_count: int
+    created_at: datetime
+    updated_at: datetime
+
+
+# Agent dispatch schemas
+class AgentDispatchRecord(BaseModel):
+    """Stored agent dispatch of a live room (a pending claim until dispatched)"""
+
+    id: str
+    room_id: str
+    idempotency_key: str | None = None
+    status: str
+    dispatch_id: str | None = None
+    agent_name: str | None = None
+    created_at: datetime
+    updated_at: datetime
 
 
 # LiveRoom schemas
@@ -24,6 +98,9 @@ class LiveRoomBase(BaseModel):
 class LiveRoomCreate(LiveRoomBase):
     """LiveRoom creation model - used in requests"""
 
+    # Server-assigned ID, set when the room name is needed before the insert
+    id: str | None = None
+
 
 class LiveRoomUpdate(BaseModel):
     """LiveRoom update model - used for partial update requests"""
@@ -50,6 +127,32 @@ class TokenResponse(BaseModel):
     identity: str
 
 
+class TokenGrantRequest(BaseModel):
+    """Participant to issue a token for in a batch request"""
+
+    model_config = ConfigDict(alias_generator=camelize, populate_by_name=True)
+
+    room_id: str
+    identity: str
+    name: str | None = None
+
+
+class BatchTokenRequest(BaseModel):
+    """Request to issue tokens for many participants at once"""
+
+    model_config = ConfigDict(alias_generator=camelize, populate_by_name=True)
+
+    items: list[TokenGrantRequest] = Field(
+        min_length=1, max_length=MAX_BATCH_TOKEN_ITEMS
+    )
+
+
+class BatchTokenResponse(BaseModel):
+    """Response with generated tokens, in request order"""
+
+    data: list[TokenResponse]
+
+
 class DispatchResponse(BaseModel):
     """Response after dispatching agent"""
 
@@ -58,3 +161,13 @@ class DispatchResponse(BaseModel):
     dispatch_id: str
     room_name: str
     agent_name: str
+
+
+class StartCallResponse(BaseModel):
+    """Response of the one-shot start call endpoint"""
+
+    model_config = ConfigDict(alias_generator=camelize, populate_by_name=True)
+
+    room: LiveRoom
+    token: TokenResponse
+    dispatch: DispatchResponse
@@ -0,0 +1,228 @@
+"""
+Per-room agent dispatch guard for fancall module
+
+A double-tap or a client retry used to dispatch a second agent into the same
+room, doubling LLM, TTS and avatar cost and holding two worker slots for one
+call. ``DispatchGuard`` lets each room have one agent dispatch, across all API
+replicas, through claims stored in the database:
+
+- The first request for a room claims it (a pending row), dispatches the agent
+  and records the dispatch. A failed dispatch releases the claim.
+- Repeated requests for the room, or with the same ``Idempotency-Key``, get
+  the recorded dispatch. While it is still pending, they wait for it for up to
+  ``wait_seconds``.
+- A claim still pending after ``claim_ttl_seconds`` was abandoned (its replica
+  stopped mid-dispatch) and is taken over.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+
+from prometheus_client import Counter
+
+from fancall.repositories.agent_dispatch_repository import (
+    DISPATCH_DISPATCHED,
+    AsyncAgentDispatchRepository,
+)
+from fancall.schemas import AgentDispatchRecord
+from fancall.services.livekit_service import LiveKitDispatchResponse
+from fancall.settings import DispatchGuardSettings
+
+logger = logging.getLogger(__name__)
+
+DISPATCH_REQUESTS = Counter(
+    "fancall_dispatch_requests_total",
+    "Agent dispatch requests by guard outcome "
+    "(dispatched, replayed, waited, conflict)",
+    ["outcome"],
+)
+
+# Claims retried when the conflicting claim is released or abandoned meanwhile
+CLAIM_ATTEMPTS = 3
+
+# Creates the LiveKit dispatch once the room is claimed
+CreateDispatch = Callable[[], Awaitable[LiveKitDispatchResponse | None]]
+
+
+class DispatchConflictError(Exception):
+    """The room's dispatch cannot be returned: key reused, or still in progress"""
+
+
+def _claim_age(claim: AgentDispatchRecord) -> float:
+    """Seconds since a claim was made (timestamps are stored as naive UTC)"""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return (now - claim.created_at.replace(tzinfo=None)).total_seconds()
+
+
+def _recorded_response(claim: AgentDispatchRecord) -> LiveKitDispatchResponse:
+    """The dispatch recorded on a completed claim"""
+    assert claim.dispatch_id and claim.agent_name, "completed claims record both"
+    return LiveKitDispatchResponse(
+        dispatch_id=claim.dispatch_id,
+        room_name=claim.room_id,
+        agent_name=claim.agent_name,
+    )
+
+
+class DispatchGuard:
+    """Single-flight, idempotent agent dispatch per live room"""
+
+    def __init__(self, settings: DispatchGuardSettings):
+        """
+        Initialize the dispatch guard.
+
+        Args:
+            settings: Dispatch guard settings (wait, poll interval, claim TTL)
+        """
+        self.settings = settings
+
+    async def dispatch(
+        self,
+        repository: AsyncAgentDispatchRepository,
+        room_id: str,
+        idempotency_key: str | None,
+        create: CreateDispatch,
+    ) -> LiveKitDispatchResponse | None:
+        """
+        Dispatch an agent to a room, unless the room already has one.
+
+        Args:
+            repository: Agent dispatch claims
+            room_id: Live room ID
+            idempotency_key: Client-supplied idempotency key, if any
+            create: Dispatches the agent (called only by the claiming request)
+
+        Returns:
+            The new or the existing dispatch, or None if ``create`` returned None
+
+        Raises:
+            DispatchConflictError: If the key was used for another room, or the
+                room's dispatch is still in progress after ``wait_seconds``
+        """
+        for _ in range(CLAIM_ATTEMPTS):
+            # Repeats are read only; only a room without a dispatch is claimed
+            claim = await repository.find(room_id, idempotency_key)
+            claimed = False
+            if claim is None:
+                claim, claimed = await repository.claim(room_id, idempotency_key)
+            if claimed:
+                assert claim is not None
+                return await self._create(repository, claim, create)
+            if claim is None:
+                continue
+            if claim.room_id != room_id:
+                DISPATCH_REQUESTS.labels("conflict").inc()
+                raise DispatchConflictError(
+                    "Idempotency key was already used for another room"
+                )
+            existing = await self._wait(repository, claim)
+            if existing is not None:
+                return existing
+        DISPATCH_REQUESTS.labels("conflict").inc()
+        raise DispatchConflictError(f"Could not claim agent dispatch to room {room_id}")
+
+    async def dispatch_new_room(
+        self,
+        repository: AsyncAgentDispatchRepository,
+        room_id: str,
+        create: CreateDispatch,
+    ) -> LiveKitDispatchResponse | None:
+        """
+        Dispatch an agent to a room created by this request, and record it.
+
+        Nobody else knows the room yet, so it needs no claim: the dispatch is
+        recorded in one write once it exists.
+
+        Args:
+            repository: Agent dispatch claims
+            room_id: ID of the room being created
+            create: Dispatches the agent
+
+        Returns:
+            The dispatch, or None if ``create`` returned None
+        """
+        response = await create()
+        if response is None:
+            return None
+        try:
+            recorded = await repository.record(
+                room_id, response.dispatch_id, response.agent_name
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            # The call works; only its protection against repeats is lost
+            logger.exception("Agent dispatch to room '%s' was not recorded", room_id)
+            return response
+        if not recorded:
+            logger.warning("New room '%s' already had an agent dispatch", room_id)
+        DISPATCH_REQUESTS.labels("dispatched").inc()
+        return response
+
+    async def _create(
+        self,
+        repository: AsyncAgentDispatchRepository,
+        claim: AgentDispatchRecord,
+        create: CreateDispatch,
+    ) -> LiveKitDispatchResponse | None:
+        try:
+            response = await create()
+        except Exception:
+            # A cancelled request keeps its claim until claim_ttl_seconds
+            await repository.release(claim.id)
+            raise
+        return await self._record(repository, claim, response)
+
+    async def _record(
+        self,
+        repository: AsyncAgentDispatchRepository,
+        claim: AgentDispatchRecord,
+        response: LiveKitDispatchResponse | None,
+    ) -> LiveKitDispatchResponse | None:
+        if response is None:
+            await repository.release(claim.id)
+            return None
+        await repository.complete(claim.id, response.dispatch_id, response.agent_name)
+        DISPATCH_REQUESTS.labels("dispatched").inc()
+        return response
+
+    async def _wait(
+        self, repository: AsyncAgentDispatchRepository, claim: AgentDispatchRecord
+    ) -> LiveKitDispatchResponse | None:
+        """
+        Wait for another request's claim to be dispatched.
+
+        Returns:
+            The recorded dispatch, or None if the claim was released or
+            abandoned and the room can be claimed again
+        """
+        outcome = "replayed"
+        deadline = time.monotonic() + self.settings.wait_seconds
+        while True:
+            if claim.status == DISPATCH_DISPATCHED:
+                DISPATCH_REQUESTS.labels(outcome).inc()
+                logger.info(
+                    "Returning existing dispatch %s of room '%s'",
+                    claim.dispatch_id,
+                    claim.room_id,
+                )
+                return _recorded_response(claim)
+            if _claim_age(claim) > self.settings.claim_ttl_seconds:
+                logger.warning(
+                    "Taking over abandoned agent dispatch claim of room '%s'",
+                    claim.room_id,
+                )
+                await repository.release(claim.id)
+                return None
+            if time.monotonic() >= deadline:
+                DISPATCH_REQUESTS.labels("conflict").inc()
+                raise DispatchConflictError(
+                    f"Agent dispatch to room {claim.room_id} is still in progress"
+                )
+            outcome = "waited"
+            await asyncio.sleep(self.settings.poll_interval_seconds)
+            polled = await repository.find(claim.room_id, None)
+            if polled is None:
+                return None
+            claim = polled
@@ -3,16 +3,24 @@ LiveKit service for fancall module
 """
 
 import logging
+import time
 from dataclasses import dataclass
 
+import aiohttp
 from livekit import api
 from livekit.protocol.agent_dispatch import CreateAgentDispatchRequest
+from livekit.protocol.room import ListRoomsRequest
 
+from fancall.metrics import LIVEKIT_DISPATCH_DURATION, TOKEN_SIGNING_DURATION
 from fancall.schemas import AgentDispatchRequest
+from fancall.services.token_signer import TokenGrant, TokenSigner
 from fancall.settings import LiveKitSettings
 
 logger = logging.getLogger(__name__)
 
+# Server-stamped dispatch fields, logged by value rather than as inline fields
+DISPATCH_REFERENCES = {"session_tier", "user_id", "persona_id", "persona_version"}
+
 
 @dataclass
 class LiveKitTokenResponse:
@@ -33,7 +41,12 @@ class LiveKitDispatchResponse:
 
 
 class LiveKitService:
-    """Service for LiveKit operations including token generation and agent dispatch"""
+    """Service for LiveKit operations including token generation and agent dispatch
+
+    A single instance is meant to be shared for the lifetime of the application:
+    server API calls reuse one pooled HTTP session, created lazily on first use
+    and re-created after connection failures. Call ``aclose`` on shutdown.
+    """
 
     def __init__(self, livekit_settings: LiveKitSettings):
         """
@@ -43,6 +56,73 @@ class LiveKitService:
             livekit_settings: LiveKit settings containing required credentials
         """
         self.settings = livekit_settings
+        # Signing key and grant template are prepared once per service instance
+        self._token_signer = (
+            TokenSigner(livekit_settings.api_key, livekit_settings.api_secret)
+            if livekit_settings.api_key and livekit_settings.api_secret
+            else None
+        )
+        self._session: aiohttp.ClientSession | None = None
+        self._client: api.LiveKitAPI | None = None
+
+    def _get_client(self) -> api.LiveKitAPI:
+        """Return the pooled LiveKit API client, (re)connecting if needed."""
+        if self._client is not None and self._session and not self._session.closed:
+            return self._client
+
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.settings.pool_max_connections,
+                limit_per_host=self.settings.pool_max_connections_per_host,
+                keepalive_timeout=self.settings.pool_keepalive_seconds,
+            ),
+            timeout=aiohttp.ClientTimeout(total=self.settings.request_timeout),
+        )
+        self._client = api.LiveKitAPI(
+            url=self.settings.url,
+            api_key=self.settings.api_key,
+            api_secret=self.settings.api_secret,
+            session=self._session,
+        )
+        logger.info("Opened pooled LiveKit API session to %s", self.settings.url)
+        return self._client
+
+    async def _reset_client(self) -> None:
+        """Drop the pooled session so the next call reconnects."""
+        session, self._session, self._client = self._session, None, None
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def aclose(self) -> None:
+        """Close the pooled LiveKit API session."""
+        await self._reset_client()
+
+    async def check_health(self) -> bool:
+        """
+        Check that the LiveKit server API is reachable with the configured credentials.
+
+        Returns:
+            True if a lightweight room listing succeeds, False otherwise
+        """
+        if (
+            not self.settings.url
+            or not self.settings.api_key
+            or not self.settings.api_secret
+        ):
+            return False
+
+        try:
+            await self._get_client().room.list_rooms(
+                ListRoomsRequest(names=["fancall-healthcheck"])
+            )
+            return True
+        except aiohttp.ClientConnectionError as e:
+            logger.warning("LiveKit health check failed, reconnecting: %s", e)
+            await self._reset_client()
+            return False
+        except (aiohttp.ClientError, api.TwirpError, TimeoutError) as e:
+            logger.warning("LiveKit health check failed: %s", e)
+            return False
 
     def generate_token(
         self, user_id: str, name: str, room_name: str
@@ -62,58 +142,57 @@ class LiveKitService:
             ValueError: If required parameters are missing
             Exception: If there's an error generating the token
         """
-        if not self.settings.api_key or not self.settings.api_secret:
+        responses = self.generate_tokens([TokenGrant(user_id, name, room_name)])
+        return responses[0] if responses is not None else None
+
+    def generate_tokens(
+        self, grants: list[TokenGrant]
+    ) -> list[LiveKitTokenResponse] | None:
+        """
+        Generate LiveKit access tokens for many participants at once.
+
+        Args:
+            grants: Identity, display name and room of each participant
+
+        Returns:
+            LiveKitTokenResponse objects in input order, or None if the service is not configured.
+
+        Raises:
+            ValueError: If a grant is missing its identity or room
+            Exception: If there's an error generating the tokens
+        """
+        if self._token_signer is None:
             logger.error("LiveKit credentials are not configured")
             return None
 
-        if not user_id:
-            raise ValueError("User ID is required to generate token")
-
-        if not room_name:
-            raise ValueError("Room name is required to generate token")
+        for grant in grants:
+            if not grant.identity:
+                raise ValueError("User ID is required to generate token")
+            if not grant.room_name:
+                raise ValueError("Room name is required to generate token")
 
         try:
-            logger.info(
-                "Generating LiveKit token for user '%s' (identity: %s) to join room '%s'",
-                name,
-                user_id,
-                room_name,
-            )
-
-            # Generate access token
-            token = (
-                api.AccessToken(self.settings.api_key, self.settings.api_secret)
-                .with_identity(user_id)
-                .with_name(name)
-                .with_grants(
-                    api.VideoGrants(
-                        room_join=True,
-                        room=room_name,
-                        can_publish=True,
-                        can_subscribe=True,
-                    )
-                )
-                .to_jwt()
-            )
+            with TOKEN_SIGNING_DURATION.time():
+                tokens = self._token_signer.sign_many(grants)
+        except Exception as e:
+            logger.error("Error generating %d LiveKit token(s): %s", len(grants), e)
+            raise
 
+        if len(grants) == 1:
             logger.info(
                 "Successfully generated LiveKit token for user '%s' to join room '%s'",
-                user_id,
-                room_name,
-            )
-
-            return LiveKitTokenResponse(
-                token=token, room_name=room_name, identity=user_id
+                grants[0].identity,
+                grants[0].room_name,
             )
+        else:
+            logger.info("Successfully generated %d LiveKit tokens", len(grants))
 
-        except Exception as e:
-            logger.error(
-                "Error generating LiveKit token for user '%s' to join room '%s': %s",
-                user_id,
-                room_name,
-                e,
+        return [
+            LiveKitTokenResponse(
+                token=token, room_name=grant.room_name, identity=grant.identity
             )
-            raise
+            for grant, token in zip(grants, tokens)
+        ]
 
     async def dispatch_agent(
         self, request: AgentDispatchRequest, room_name: str
@@ -139,44 +218,86 @@ class LiveKitService:
             logger.error("LiveKit credentials are not configured")
             return None
 
-        # Create client for this request
-        async with api.LiveKitAPI(
-            url=self.settings.url,
-            api_key=self.settings.api_key,
-            api_secret=self.settings.api_secret,
-        ) as livekit_client:
+        # Prepare metadata for the agent (passed as-is)
+        metadata_json = request.model_dump_json(exclude_none=True)
+        dispatch_request = CreateAgentDispatchRequest(
+            agent_name=self.settings.agent_name,
+            room=room_name,
+            metadata=metadata_json,
+        )
+
+        # Inline prompts and data URLs can be large, so only their names are logged
+        logger.info(
+            "Dispatching agent '%s' to room '%s' (tier=%s, persona_id=%s, version=%s, "
+            "inline fields=%s, metadata %d bytes)",
+            self.settings.agent_name,
+            room_name,
+            request.session_tier,
+            request.persona_id,
+            request.persona_version,
+            sorted(request.model_dump(exclude_none=True, exclude=DISPATCH_REFERENCES)),
+            len(metadata_json),
+        )
+
+        start = time.perf_counter()
+        try:
             try:
-                # Prepare metadata for the agent (passed as-is)
-                metadata_json = request.model_dump_json(exclude_none=True)
-
-                logger.info(
-                    "Dispatching agent '%s' to room '%s' with metadata: %s",
-                    self.settings.agent_name,
-                    room_name,
-                    metadata_json,
+                dispatch = await self._get_client().agent_dispatch.create_dispatch(
+                    dispatch_request
                 )
-
-                # Create agent dispatch
-                dispatch = await livekit_client.agent_dispatch.create_dispatch(
-                    CreateAgentDispatchRequest(
-                        agent_name=self.settings.agent_name,
-                        room=room_name,
-                        metadata=metadata_json,
-                    )
+            except aiohttp.ClientConnectorError as e:
+                # Connection was never established, so retrying cannot double-dispatch
+                logger.warning("LiveKit connection failed, reconnecting: %s", e)
+                await self._reset_client()
+                dispatch = await self._get_client().agent_dispatch.create_dispatch(
+                    dispatch_request
                 )
+        except Exception as e:
+            LIVEKIT_DISPATCH_DURATION.labels("error").observe(
+                time.perf_counter() - start
+            )
+            if isinstance(e, aiohttp.ClientConnectionError):
+                await self._reset_client()
+            logger.error("Error dispatching agent to room '%s': %s", room_name, e)
+            raise
+        LIVEKIT_DISPATCH_DURATION.labels("success").observe(time.perf_counter() - start)
 
-                logger.info(
-                    "Successfully dispatched agent to room '%s' with dispatch_id: %s",
-                    room_name,
-                    dispatch.id,
-                )
+        logger.info(
+            "Successfully dispatched agent to room '%s' with dispatch_id: %s",
+            room_name,
+            dispatch.id,
+        )
 
-                return LiveKitDispatchResponse(
-                    dispatch_id=dispatch.id,
-                    room_name=room_name,
-                    agent_name=self.settings.agent_name,
-                )
+        return LiveKitDispatchResponse(
+            dispatch_id=dispatch.id,
+            room_name=room_name,
+            agent_name=self.settings.agent_name,
+        )
+
+    async def delete_dispatch(self, dispatch_id: str, room_name: str) -> bool:
+        """
+        Delete an agent dispatch, e.g. to a room that failed to be created.
+
+        Args:
+            dispatch_id: ID of the dispatch to delete
+            room_name: Name of the room the agent was dispatched to
 
-            except Exception as e:
-                logger.error("Error dispatching agent to room '%s': %s", room_name, e)
-                raise
+        Returns:
+            True if the dispatch was deleted, False if deleting it failed
+        """
+        try:
+            await self._get_client().agent_dispatch.delete_dispatch(
+                dispatch_id, room_name
+            )
+        except (aiohttp.ClientError, api.TwirpError, TimeoutError) as e:
+            if isinstance(e, aiohttp.ClientConnectionError):
+                await self._reset_client()
+            logger.error(
+                "Failed to delete dispatch %s of room '%s': %s",
+                dispatch_id,
+                room_name,
+                e,
+            )
+            return False
+        logger.info("Deleted dispatch %s of room '%s'", dispatch_id, room_name)
+        return True
@@ -0,0 +1,90 @@
+"""
+Room existence cache for fancall module
+"""
+
+import time
+from collections import OrderedDict
+
+from fancall.settings import RoomCacheSettings
+
+
+class RoomExistenceCache:
+    """
+    In-process TTL cache of live room existence.
+
+    Rooms are never mutated after creation, so a positive entry only goes stale
+    when the room is deleted; callers that delete rooms must call ``invalidate``.
+    Unknown rooms are cached briefly as negative entries so repeated lookups of
+    a bad ID do not each hit the database.
+    """
+
+    def __init__(self, settings: RoomCacheSettings):
+        """
+        Initialize the room existence cache.
+
+        Args:
+            settings: Room cache settings (TTLs, capacity)
+        """
+        self.settings = settings
+        # room_id -> (exists, expires_at), in LRU order
+        self._entries: OrderedDict[str, tuple[bool, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, room_id: str) -> bool | None:
+        """
+        Look up a room.
+
+        Args:
+            room_id: Live room ID
+
+        Returns:
+            True/False if the existence of the room is cached, None on a miss
+        """
+        entry = self._entries.get(room_id)
+        if entry is None or entry[1] <= time.monotonic():
+            if entry is not None:
+                del self._entries[room_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(room_id)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, room_id: str, exists: bool) -> None:
+        """
+        Record whether a room exists.
+
+        Args:
+            room_id: Live room ID
+            exists: Result of the database lookup (or True for a created room)
+        """
+        ttl = (
+            self.settings.ttl_seconds if exists else self.settings.negative_ttl_seconds
+        )
+        if ttl <= 0:
+            return
+
+        self._entries[room_id] = (exists, time.monotonic() + ttl)
+        self._entries.move_to_end(room_id)
+        while len(self._entries) > self.settings.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, room_id: str) -> None:
+        """Drop the entry of a room (e.g. after it was deleted)."""
+        self._entries.pop(room_id, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Return hit/miss counters and the current number of entries."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
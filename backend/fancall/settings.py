@@ -2,19 +2,348 @@
 Fancall settings
 """
 
+from typing import Literal
+
 from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
 
 class FancallModelSettings(BaseSettings):
-    """Fancall LLM model settings."""
+    """Fancall LLM model settings.
+
+    Attributes:
+        openai_model: OpenAI chat model of the agent.
+        prompt_max_tokens: Token budget of composed instructions (estimated).
+            Per-call context is trimmed to fit; the static prefix is never cut.
+        prompt_cache_min_tokens: Shortest prompt prefix the provider caches.
+        prompt_cache_increment_tokens: Steps in which cached prefixes grow
+            beyond ``prompt_cache_min_tokens``.
+    """
 
     openai_model: str = "gpt-4o-mini"
+    prompt_max_tokens: int = 4000
+    prompt_cache_min_tokens: int = 1024
+    prompt_cache_increment_tokens: int = 128
 
     class Config:
         env_prefix = "FANCALL_"
 
 
+class AvatarCacheSettings(BaseSettings):
+    """Settings for the worker-side avatar image cache and decode pipeline
+
+    Attributes:
+        memory_budget_bytes: Byte budget of the in-memory LRU tier (decoded pixels).
+        disk_dir: Directory for the on-disk tier of normalized images. Disabled if unset.
+        revalidate_after_seconds: Age after which HTTP(S) entries are revalidated
+            with ETag/Last-Modified. Data URLs are content-addressed and never expire.
+        decode_workers: Threads decoding images off the event loop (per process).
+        max_input_bytes: Largest encoded image (data URL payload or download)
+            that is decoded.
+        max_pixels: Largest image (width x height) that is decoded.
+        target_size: Longest side images are downscaled to. 0 keeps full size.
+    """
+
+    memory_budget_bytes: int = 64 * 1024 * 1024
+    disk_dir: str | None = None
+    revalidate_after_seconds: float = 300.0
+    decode_workers: int = 2
+    max_input_bytes: int = 10 * 1024 * 1024
+    max_pixels: int = 25_000_000
+    target_size: int = 1024
+
+    class Config:
+        env_prefix = "FANCALL_AVATAR_CACHE_"
+
+
+class TtsCacheSettings(BaseSettings):
+    """Settings for the worker-side synthesized speech cache
+
+    Attributes:
+        enabled: Whether TTS output of short utterances is cached.
+        memory_budget_bytes: Byte budget of the in-memory LRU tier (PCM audio).
+        disk_dir: Directory for the on-disk tier of WAV files. Disabled if unset.
+        disk_budget_bytes: Byte budget of the on-disk tier; least recently used
+            files beyond it are deleted.
+        max_text_chars: Longest utterance (normalized characters) that is cached.
+            Longer text is streamed through the TTS provider uncached.
+    """
+
+    enabled: bool = True
+    memory_budget_bytes: int = 32 * 1024 * 1024
+    disk_dir: str | None = None
+    disk_budget_bytes: int = 512 * 1024 * 1024
+    max_text_chars: int = 80
+
+    class Config:
+        env_prefix = "FANCALL_TTS_CACHE_"
+
+
+TtsSegmenter = Literal["mixed", "provider"]
+
+
+class TtsSegmentationSettings(BaseSettings):
+    """Settings for segmenting LLM text into TTS requests
+
+    Lengths are spoken lengths: a Hangul or CJK character counts as two, since a
+    syllable takes about as long to say as two Latin letters.
+
+    Attributes:
+        segmenter: ``mixed`` segments Korean/English text into sentences and
+            synthesizes them one by one; ``provider`` streams the raw text to the
+            TTS provider, which chunks it itself.
+        first_min_length: Minimum spoken length of the first segment. The first
+            segment also ends at clause boundaries (commas) once this long.
+        min_length: Minimum spoken length of later segments; shorter sentences
+            are merged with the next one.
+        max_length: Spoken length beyond which a segment is split at the last
+            clause or word boundary.
+        first_chunk_budget: Seconds after the first text within which the first
+            segment is released, cut at a word boundary if no sentence ended.
+    """
+
+    segmenter: TtsSegmenter = "mixed"
+    first_min_length: int = 8
+    min_length: int = 24
+    max_length: int = 160
+    first_chunk_budget: float = 0.4
+
+    class Config:
+        env_prefix = "FANCALL_TTS_SEGMENT_"
+
+
+class PersonaCacheSettings(BaseSettings):
+    """Settings for the worker-side cache of registered personas
+
+    Entries are keyed by persona ID and version, so an updated persona is loaded
+    again on its first dispatch and never served stale.
+
+    Attributes:
+        max_entries: Maximum number of personas kept in memory (least recently
+            used evicted).
+        disk_dir: Directory for the on-disk tier shared by the worker's job
+            processes. Disabled if unset.
+    """
+
+    max_entries: int = 128
+    disk_dir: str | None = None
+
+    class Config:
+        env_prefix = "FANCALL_PERSONA_CACHE_"
+
+
+class ConversationMemorySettings(BaseSettings):
+    """Settings for per-user, per-persona conversation memory
+
+    Signed-in callers' conversations are compacted into one rolling summary
+    per persona after each session, and the summary is loaded into the
+    instructions of their next session.
+
+    Attributes:
+        enabled: Whether memory is loaded and updated.
+        summary_max_tokens: Token budget of the rolling summary (and of the
+            prompt growth it causes).
+        transcript_max_tokens: Most recent transcript tokens of a session that
+            are summarized.
+        min_user_turns: User turns a session needs before it updates memory.
+    """
+
+    enabled: bool = True
+    summary_max_tokens: int = 300
+    transcript_max_tokens: int = 4000
+    min_user_turns: int = 1
+
+    class Config:
+        env_prefix = "FANCALL_MEMORY_"
+
+
+class SessionLifetimeSettings(BaseSettings):
+    """Settings for how long an agent session holds its worker job slot
+
+    Sessions end at the first of: the tier's duration limit, silence, or the
+    caller leaving (or never joining) the room.
+
+    Attributes:
+        max_duration_seconds: Session duration limit per tier, as stamped on the
+            dispatch by the API (``guest`` for anonymous, ``member`` for
+            signed-in callers). Tiers without a limit use the ``guest`` limit.
+        idle_timeout_seconds: Time neither the caller nor the agent speaks
+            before the session ends. 0 disables the silence timeout.
+        join_timeout_seconds: Time the agent waits for a caller to join.
+        rejoin_grace_seconds: Time the agent waits for a caller who left to
+            rejoin before the session ends.
+    """
+
+    max_duration_seconds: dict[str, float] = {"guest": 75.0, "member": 75.0}
+    idle_timeout_seconds: float = 30.0
+    join_timeout_seconds: float = 30.0
+    rejoin_grace_seconds: float = 3.0
+
+    class Config:
+        env_prefix = "FANCALL_SESSION_"
+
+    @model_validator(mode="after")
+    def check_guest_limit(self) -> "SessionLifetimeSettings":
+        """Validate that the fallback (guest) tier has a duration limit."""
+        if "guest" not in self.max_duration_seconds:
+            raise ValueError("max_duration_seconds must include the 'guest' tier")
+        return self
+
+    def max_duration_for(self, tier: str | None) -> float:
+        """Return the duration limit of a tier (the guest limit if unknown)."""
+        return self.max_duration_seconds.get(
+            tier or "guest", self.max_duration_seconds["guest"]
+        )
+
+
+class AssetHttpSettings(BaseSettings):
+    """Settings for the worker-side HTTP client used to fetch assets (avatar images)
+
+    Attributes:
+        connect_timeout: Seconds allowed to establish a connection.
+        read_timeout: Seconds allowed between received chunks.
+        max_connections: Maximum concurrent connections in the pool.
+        max_keepalive_connections: Maximum idle keep-alive connections in the pool.
+        keepalive_expiry: Seconds an idle keep-alive connection is kept open.
+        http2: Whether to negotiate HTTP/2 with servers that support it.
+        max_bytes: Maximum response body size; larger downloads are aborted.
+    """
+
+    connect_timeout: float = 3.0
+    read_timeout: float = 5.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    http2: bool = True
+    max_bytes: int = 10 * 1024 * 1024
+
+    class Config:
+        env_prefix = "FANCALL_ASSET_HTTP_"
+
+
+class WorkerLoadSettings(BaseSettings):
+    """Settings for the agent worker's load report and job admission
+
+    The worker reports one load score to LiveKit: the highest of its active
+    jobs over ``max_jobs``, CPU utilization, memory utilization and the
+    event-loop lag of its job processes over ``max_loop_lag_ms``. LiveKit stops
+    assigning jobs to the worker while the score is at or above
+    ``load_threshold``.
+
+    Attributes:
+        load_threshold: Load score (0-1) at which the worker stops accepting jobs.
+        max_jobs: Concurrent jobs at which the job count alone makes the worker full.
+        max_loop_lag_ms: Job event-loop lag (ms) at which lag alone makes the
+            worker full; audio underruns start around one 20 ms frame of lag.
+        cpu_sample_seconds: Window of each CPU utilization sample.
+        loop_lag_dir: Directory job processes report their event-loop lag
+            through. Defaults to a new temporary directory per worker.
+    """
+
+    load_threshold: float = 0.7
+    max_jobs: int = 8
+    max_loop_lag_ms: float = 50.0
+    cpu_sample_seconds: float = 0.5
+    loop_lag_dir: str | None = None
+
+    class Config:
+        env_prefix = "FANCALL_WORKER_"
+
+
+class AgentTelemetrySettings(BaseSettings):
+    """Settings for agent worker telemetry (session timelines, Prometheus)
+
+    Attributes:
+        prometheus_port: Port of the worker's Prometheus ``/metrics`` endpoint.
+            Disabled if unset.
+        prometheus_multiproc_dir: Directory for prometheus_client multiprocess
+            mode, so metrics recorded in job processes reach the endpoint.
+        timeline_path: JSON Lines file each session timeline is appended to.
+            Timelines are always logged; the file is optional.
+    """
+
+    prometheus_port: int | None = None
+    prometheus_multiproc_dir: str | None = None
+    timeline_path: str | None = None
+
+    class Config:
+        env_prefix = "FANCALL_AGENT_TELEMETRY_"
+
+
+class ApiSettings(BaseSettings):
+    """Settings for the standalone Fancall API application
+
+    Attributes:
+        create_schema: Create missing tables on startup unless the database is
+            already at the Alembic head revision. Off by default; run
+            ``alembic upgrade head`` to manage the schema instead.
+    """
+
+    create_schema: bool = False
+
+    class Config:
+        env_prefix = "FANCALL_API_"
+
+
+class DatabasePoolSettings(BaseSettings):
+    """Connection pool settings complementing aioia-core's DatabaseSettings
+
+    Pool size, overflow, checkout timeout and recycle come from
+    ``DATABASE_POOL_SIZE``, ``DATABASE_MAX_OVERFLOW``, ``DATABASE_POOL_TIMEOUT``
+    and ``DATABASE_POOL_RECYCLE``.
+
+    Attributes:
+        pre_ping: Test connections on checkout and transparently replace stale ones.
+        use_lifo: Reuse the most recently returned connection first, letting idle
+            connections time out server-side under low load.
+        wait_buckets_ms: Upper bounds (milliseconds) of the checkout wait histogram.
+    """
+
+    pre_ping: bool = True
+    use_lifo: bool = False
+    wait_buckets_ms: list[float] = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000]
+
+    class Config:
+        env_prefix = "FANCALL_DB_POOL_"
+
+
+class RoomCacheSettings(BaseSettings):
+    """Settings for the API-side room existence cache
+
+    Attributes:
+        ttl_seconds: Lifetime of a cached existing room. 0 disables positive entries.
+        negative_ttl_seconds: Lifetime of a cached unknown room ID. 0 disables
+            negative entries.
+        max_entries: Maximum number of cached room IDs (least recently used evicted).
+    """
+
+    ttl_seconds: float = 600.0
+    negative_ttl_seconds: float = 2.0
+    max_entries: int = 10_000
+
+    class Config:
+        env_prefix = "FANCALL_ROOM_CACHE_"
+
+
+class DispatchGuardSettings(BaseSettings):
+    """Settings for the per-room agent dispatch guard
+
+    Attributes:
+        wait_seconds: How long a repeated dispatch waits for the room's dispatch
+            in progress before failing with 409.
+        poll_interval_seconds: Interval of the database polls while waiting.
+        claim_ttl_seconds: Age after which a dispatch still pending is considered
+            abandoned (its API replica stopped mid-dispatch) and is taken over.
+    """
+
+    wait_seconds: float = 10.0
+    poll_interval_seconds: float = 0.1
+    claim_ttl_seconds: float = 30.0
+
+    class Config:
+        env_prefix = "FANCALL_DISPATCH_"
+
+
 class LiveKitSettings(BaseSettings):
     """Settings for LiveKit API integration
 
@@ -23,12 +352,20 @@ class LiveKitSettings(BaseSettings):
         api_key: LiveKit API key. Defaults to 'devkey' for local development.
         api_secret: LiveKit API secret. Defaults to 'secret' for local development.
         agent_name: Agent name for LiveKit dispatch. Defaults to 'fancall'.
+        pool_max_connections: Maximum pooled connections of the server API client.
+        pool_max_connections_per_host: Per-host connection limit (0 = unlimited).
+        pool_keepalive_seconds: Seconds an idle pooled connection is kept open.
+        request_timeout: Total timeout in seconds of a server API request.
     """
 
     url: str = "ws://localhost:7880"  # Local LiveKit dev server
     api_key: str = "devkey"  # Default API key for local dev
     api_secret: str = "secret"  # Default API secret for local dev
     agent_name: str = "fancall"  # Agent name for LiveKit dispatch
+    pool_max_connections: int = 100
+    pool_max_connections_per_host: int = 0
+    pool_keepalive_seconds: float = 30.0
+    request_timeout: float = 10.0
 
     class Config:
         env_prefix = "LIVEKIT_"
@@ -0,0 +1,59 @@
+"""
+Startup time reporting for the Fancall API
+"""
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class StartupReport:
+    """
+    Wall-clock breakdown of application startup.
+
+    Phases are recorded in order with ``phase()``; the report is logged once
+    startup is complete so slow imports or initialization steps stand out.
+    """
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a startup phase.
+
+        Args:
+            name: Phase name (repeated phases are accumulated)
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    @property
+    def total_seconds(self) -> float:
+        """Sum of all recorded phases"""
+        return sum(self.phases.values())
+
+    def to_dict(self) -> dict[str, float]:
+        """Return phase durations in milliseconds, plus the total."""
+        report = {
+            name: round(seconds * 1000, 2) for name, seconds in self.phases.items()
+        }
+        report["total"] = round(self.total_seconds * 1000, 2)
+        return report
+
+    def log(self, logger: logging.Logger) -> None:
+        """Log the report as a single line."""
+        logger.info(
+            "Startup finished in %.1f ms (%s)",
+            self.total_seconds * 1000,
+            ", ".join(
+                f"{name}={seconds * 1000:.1f}ms"
+                for name, seconds in self.phases.items()
+            ),
+        )
@@ -0,0 +1,5 @@
+"""Test doubles for exercising Fancall without external services"""
+
+from fancall.testing.livekit_server import FakeLiveKitServer, TwirpFault
+
+__all__ = ["FakeLiveKitServer", "TwirpFault"]
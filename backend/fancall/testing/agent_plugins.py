@@ -0,0 +1,286 @@
+"""
+Simulated LLM, TTS and avatar plugins for the agent worker.
+
+``FakeLLM``, ``FakeTTS`` and ``FakeAvatarSession`` stand in for
+``openai.LLM``, ``fishaudio.TTS`` and ``hedra.AvatarSession`` with the streaming
+timing of the real services (time to first token, token rate, time to first
+audio byte, synthesis speed, avatar start-up) but no network access, so worker
+jobs can be run and measured locally.
+
+``FakeAvatarAudioOutput`` plays audio out in real time like the avatar and
+counts underruns: frames that arrive after their playout deadline, which would
+be heard as glitches.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from livekit import rtc
+from livekit.agents import (
+    DEFAULT_API_CONNECT_OPTIONS,
+    AgentSession,
+    APIConnectOptions,
+    llm,
+    tts,
+    utils,
+)
+from livekit.agents.voice.io import AudioOutput, AudioOutputCapabilities
+
+SAMPLE_RATE = 24000
+NUM_CHANNELS = 1
+AUDIO_PIECE_SECONDS = 0.2
+DEFAULT_REPLY = (
+    "Hi! It's so good to see you again. I was just thinking about the concert "
+    "last week, and honestly it was one of the best nights ever. How have you "
+    "been? Tell me everything, I want to hear all about your day."
+)
+
+
+@dataclass
+class PluginTiming:
+    """Streaming timing of the simulated services
+
+    Attributes:
+        llm_ttft: Seconds until the first LLM token
+        llm_tokens_per_second: LLM token rate after the first token
+        tts_ttfb: Seconds from the first text until the first audio
+        tts_seconds_per_char: Seconds of speech per input character
+        tts_realtime_factor: Synthesis time per second of audio (< 1 is faster
+            than real time)
+        tts_stream_chunk_chars: Characters the streaming TTS buffers before it
+            synthesizes (the rest at end of input), like Fish Audio's server-side
+            ``chunk_length``. 0 synthesizes every pushed text chunk at once.
+        avatar_start: Seconds ``FakeAvatarSession.start`` takes
+        underrun_tolerance: Seconds a frame may be late before it counts as an
+            underrun
+    """
+
+    llm_ttft: float = 0.35
+    llm_tokens_per_second: float = 60.0
+    tts_ttfb: float = 0.25
+    tts_seconds_per_char: float = 0.06
+    tts_realtime_factor: float = 0.3
+    tts_stream_chunk_chars: int = 200
+    avatar_start: float = 0.8
+    underrun_tolerance: float = 0.02
+
+
+class FakeLLM(llm.LLM):
+    """LLM streaming a fixed reply word by word"""
+
+    def __init__(self, timing: PluginTiming, reply: str = DEFAULT_REPLY):
+        super().__init__()
+        self.timing = timing
+        self.reply = reply
+
+    @property
+    def model(self) -> str:
+        return "fake-llm"
+
+    def chat(
+        self,
+        *,
+        chat_ctx: llm.ChatContext,
+        tools: list[llm.FunctionTool | llm.RawFunctionTool] | None = None,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+        **_kwargs: Any,
+    ) -> FakeLLMStream:
+        return FakeLLMStream(
+            self, chat_ctx=chat_ctx, tools=tools or [], conn_options=conn_options
+        )
+
+
+class FakeLLMStream(llm.LLMStream):
+    """Stream of FakeLLM"""
+
+    _llm: FakeLLM
+
+    async def _run(self) -> None:
+        timing = self._llm.timing
+        request_id = utils.shortuuid()
+        await asyncio.sleep(timing.llm_ttft)
+        for i, word in enumerate(self._llm.reply.split(" ")):
+            if i:
+                await asyncio.sleep(1 / timing.llm_tokens_per_second)
+            self._event_ch.send_nowait(
+                llm.ChatChunk(
+                    id=request_id,
+                    delta=llm.ChoiceDelta(role="assistant", content=f"{word} "),
+                )
+            )
+
+
+def _silence(seconds: float) -> bytes:
+    return bytes(int(SAMPLE_RATE * seconds) * NUM_CHANNELS * 2)
+
+
+async def _push_speech(
+    output_emitter: tts.AudioEmitter, text: str, timing: PluginTiming
+) -> None:
+    """Push the audio of ``text`` piece by piece, as fast as it is synthesized."""
+    remaining = len(text) * timing.tts_seconds_per_char
+    while remaining > 0:
+        piece = min(AUDIO_PIECE_SECONDS, remaining)
+        await asyncio.sleep(piece * timing.tts_realtime_factor)
+        output_emitter.push(_silence(piece))
+        remaining -= piece
+
+
+class FakeTTS(tts.TTS):
+    """Streaming TTS producing silence at the configured synthesis speed"""
+
+    def __init__(self, timing: PluginTiming):
+        super().__init__(
+            capabilities=tts.TTSCapabilities(streaming=True),
+            sample_rate=SAMPLE_RATE,
+            num_channels=NUM_CHANNELS,
+        )
+        self.timing = timing
+
+    def synthesize(
+        self,
+        text: str,
+        *,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+    ) -> FakeChunkedStream:
+        return FakeChunkedStream(tts=self, input_text=text, conn_options=conn_options)
+
+    def stream(
+        self, *, conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS
+    ) -> FakeSynthesizeStream:
+        return FakeSynthesizeStream(tts=self, conn_options=conn_options)
+
+
+class FakeChunkedStream(tts.ChunkedStream):
+    """Non-streaming synthesis of FakeTTS"""
+
+    _tts: FakeTTS
+
+    async def _run(self, output_emitter: tts.AudioEmitter) -> None:
+        timing = self._tts.timing
+        output_emitter.initialize(
+            request_id=utils.shortuuid(),
+            sample_rate=SAMPLE_RATE,
+            num_channels=NUM_CHANNELS,
+            mime_type="audio/pcm",
+        )
+        await asyncio.sleep(timing.tts_ttfb)
+        await _push_speech(output_emitter, self._input_text, timing)
+        output_emitter.flush()
+
+
+class FakeSynthesizeStream(tts.SynthesizeStream):
+    """Streaming synthesis of FakeTTS: audio for each chunk of buffered text"""
+
+    _tts: FakeTTS
+
+    async def _run(self, output_emitter: tts.AudioEmitter) -> None:
+        timing = self._tts.timing
+        output_emitter.initialize(
+            request_id=utils.shortuuid(),
+            sample_rate=SAMPLE_RATE,
+            num_channels=NUM_CHANNELS,
+            mime_type="audio/pcm",
+            stream=True,
+        )
+        output_emitter.start_segment(segment_id=utils.shortuuid())
+        self._first = True
+        buffered = ""
+        async for data in self._input_ch:
+            # Like Fish Audio's live API, flushes do not force synthesis
+            if isinstance(data, self._FlushSentinel):
+                continue
+            buffered += data
+            if len(buffered) >= timing.tts_stream_chunk_chars:
+                await self._synthesize(buffered, output_emitter)
+                buffered = ""
+        if buffered:
+            await self._synthesize(buffered, output_emitter)
+        output_emitter.end_segment()
+
+    async def _synthesize(self, text: str, output_emitter: tts.AudioEmitter) -> None:
+        timing = self._tts.timing
+        if self._first:
+            await asyncio.sleep(timing.tts_ttfb)
+            self._first = False
+        await _push_speech(output_emitter, text, timing)
+        self._mark_started()
+
+
+class FakeAvatarAudioOutput(AudioOutput):
+    """Audio sink playing frames out in real time, counting late frames"""
+
+    def __init__(self, timing: PluginTiming):
+        super().__init__(
+            label="FakeAvatar",
+            capabilities=AudioOutputCapabilities(pause=False),
+            sample_rate=SAMPLE_RATE,
+        )
+        self.timing = timing
+        self.frames = 0
+        self.underruns = 0
+        self.first_frame_at: float | None = None
+        self._segment_start: float | None = None
+        self._segment_duration = 0.0
+        self._playout_task: asyncio.Task | None = None
+
+    async def capture_frame(self, frame: rtc.AudioFrame) -> None:
+        await super().capture_frame(frame)
+        now = time.monotonic()
+        if self.first_frame_at is None:
+            self.first_frame_at = now
+        if self._segment_start is None:
+            self._segment_start = now
+            self._segment_duration = 0.0
+        deadline = self._segment_start + self._segment_duration
+        if now > deadline + self.timing.underrun_tolerance:
+            self.underruns += 1
+            # Playback stalled until this frame arrived
+            self._segment_start = now - self._segment_duration
+        self._segment_duration += frame.duration
+        self.frames += 1
+
+    def flush(self) -> None:
+        super().flush()
+        if self._segment_start is None:
+            return
+        remaining = self._segment_start + self._segment_duration - time.monotonic()
+        duration = self._segment_duration
+        self._segment_start = None
+        self._playout_task = asyncio.create_task(self._finish(remaining, duration))
+
+    async def _finish(self, remaining: float, duration: float) -> None:
+        await asyncio.sleep(max(remaining, 0))
+        self.on_playback_finished(playback_position=duration, interrupted=False)
+
+    def clear_buffer(self) -> None:
+        if self._playout_task and not self._playout_task.done():
+            self._playout_task.cancel()
+            self.on_playback_finished(playback_position=0, interrupted=True)
+        elif self._segment_start is not None:
+            self.on_playback_finished(playback_position=0, interrupted=True)
+        self._segment_start = None
+
+
+class FakeAvatarSession:
+    """Avatar session routing the agent's audio to a FakeAvatarAudioOutput
+
+    Accepts (and ignores) the other constructor arguments of ``hedra.AvatarSession``.
+    """
+
+    def __init__(self, timing: PluginTiming | None = None, **_kwargs: Any):
+        self.timing = timing or PluginTiming()
+        self.agent_session: AgentSession | None = None
+        self.audio_output: FakeAvatarAudioOutput | None = None
+
+    async def start(self, agent_session: AgentSession, room: rtc.Room) -> None:
+        """Simulate avatar start-up and take over the session's audio output."""
+        del room
+        await asyncio.sleep(self.timing.avatar_start)
+        self.agent_session = agent_session
+        self.audio_output = FakeAvatarAudioOutput(self.timing)
+        agent_session.output.audio = self.audio_output
@@ -0,0 +1,359 @@
+"""
+In-process stand-in for the LiveKit server API.
+
+Serves the Twirp endpoints of ``AgentDispatchService`` and ``RoomService`` that
+Fancall uses, so ``LiveKitService`` can be exercised without a real LiveKit
+server. Dispatches and rooms are recorded in memory, and latency and errors can
+be injected to test failure handling or shape benchmark load.
+
+Example:
+    async with FakeLiveKitServer(latency=0.02, error_rate=0.01) as server:
+        service = LiveKitService(server.settings())
+        await service.dispatch_agent(AgentDispatchRequest(), "room-1")
+        assert server.dispatches[0].room == "room-1"
+"""
+
+import asyncio
+import random
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import jwt
+from aiohttp import web
+from google.protobuf.message import Message
+from livekit.protocol.agent_dispatch import (
+    AgentDispatch,
+    CreateAgentDispatchRequest,
+    DeleteAgentDispatchRequest,
+    ListAgentDispatchRequest,
+    ListAgentDispatchResponse,
+)
+from livekit.protocol.models import Room
+from livekit.protocol.room import (
+    CreateRoomRequest,
+    DeleteRoomRequest,
+    DeleteRoomResponse,
+    ListParticipantsRequest,
+    ListParticipantsResponse,
+    ListRoomsRequest,
+    ListRoomsResponse,
+)
+
+from fancall.settings import LiveKitSettings
+
+RequestT = TypeVar("RequestT", bound=Message)
+
+# HTTP status of each Twirp error code (https://twitchtv.github.io/twirp/docs/spec_v7.html)
+TWIRP_STATUS = {
+    "invalid_argument": 400,
+    "malformed": 400,
+    "unauthenticated": 401,
+    "permission_denied": 403,
+    "not_found": 404,
+    "bad_route": 404,
+    "already_exists": 409,
+    "resource_exhausted": 429,
+    "internal": 500,
+    "unavailable": 503,
+    "deadline_exceeded": 504,
+}
+
+
+class TwirpFault(Exception):
+    """Error returned to the client as a Twirp JSON error"""
+
+    def __init__(self, code: str, msg: str):
+        super().__init__(msg)
+        self.code = code
+        self.msg = msg
+
+    def to_response(self) -> web.Response:
+        """Encode as Twirp's JSON error body with the matching HTTP status."""
+        return web.json_response(
+            {"code": self.code, "msg": self.msg},
+            status=TWIRP_STATUS.get(self.code, 500),
+        )
+
+
+class FakeLiveKitServer:  # pylint: disable=too-many-instance-attributes
+    """Fake LiveKit agent-dispatch and room service on a local port
+
+    Attributes:
+        dispatches: Created agent dispatches, in creation order (deleted ones removed)
+        rooms: Rooms by name
+        calls: Number of requests per ``Service/Method``, including failed ones
+        latency: Seconds added before every response
+        latency_jitter: Upper bound of extra uniform random latency in seconds
+        error_rate: Probability in [0, 1] of failing a request with ``error_code``
+        error_code: Twirp code of injected errors
+    """
+
+    def __init__(
+        self,
+        api_key: str = "devkey",
+        api_secret: str = "secret",
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_code: str = "unavailable",
+        seed: int | None = None,
+    ):
+        """
+        Configure the fake server; call ``start`` (or use ``async with``) to serve.
+
+        Args:
+            api_key: API key that request tokens must be issued for
+            api_secret: Secret request tokens must be signed with
+            latency: Seconds added before every response
+            latency_jitter: Upper bound of extra uniform random latency in seconds
+            error_rate: Probability in [0, 1] of failing a request
+            error_code: Twirp code of injected errors
+            seed: Seed of the latency jitter and error injection, for reproducible runs
+        """
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.dispatches: list[AgentDispatch] = []
+        self.rooms: dict[str, Room] = {}
+        self.calls: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._forced_failures: list[str] = []
+        self._next_id = 0
+        self._runner: web.AppRunner | None = None
+        self._host = "127.0.0.1"
+        self._port: int | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """
+        Start serving.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        app = web.Application()
+        for service, method, request_class, handler in self._routes():
+            app.router.add_post(
+                f"/twirp/livekit.{service}/{method}",
+                self._endpoint(f"{service}/{method}", request_class, handler),
+            )
+        app.router.add_post("/twirp/{route:.*}", self._bad_route)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        self._port = self._runner.addresses[0][1]
+        self._host = host
+
+    async def stop(self) -> None:
+        """Stop serving; safe to call more than once."""
+        runner, self._runner = self._runner, None
+        if runner is not None:
+            await runner.cleanup()
+
+    async def __aenter__(self) -> "FakeLiveKitServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        await self.stop()
+
+    @property
+    def port(self) -> int:
+        """Bound port"""
+        assert self._port is not None, "FakeLiveKitServer is not started"
+        return self._port
+
+    @property
+    def url(self) -> str:
+        """WebSocket URL to use as ``LiveKitSettings.url``"""
+        return f"ws://{self._host}:{self.port}"
+
+    def settings(self, **overrides: Any) -> LiveKitSettings:
+        """
+        Build LiveKitSettings pointing at this server.
+
+        Args:
+            **overrides: Additional LiveKitSettings fields
+
+        Returns:
+            Settings with this server's URL and credentials
+        """
+        return LiveKitSettings(
+            url=self.url,
+            api_key=self.api_key,
+            api_secret=self.api_secret,
+            **overrides,
+        )
+
+    def fail_next(self, count: int = 1, code: str = "internal") -> None:
+        """
+        Fail the next ``count`` requests with ``code``, regardless of error_rate.
+
+        Args:
+            count: Number of requests to fail
+            code: Twirp error code
+        """
+        self._forced_failures.extend([code] * count)
+
+    def _routes(
+        self,
+    ) -> list[tuple[str, str, type[Message], Callable[[Any], Message]]]:
+        return [
+            (
+                "AgentDispatchService",
+                "CreateDispatch",
+                CreateAgentDispatchRequest,
+                self._create_dispatch,
+            ),
+            (
+                "AgentDispatchService",
+                "ListDispatch",
+                ListAgentDispatchRequest,
+                self._list_dispatch,
+            ),
+            (
+                "AgentDispatchService",
+                "DeleteDispatch",
+                DeleteAgentDispatchRequest,
+                self._delete_dispatch,
+            ),
+            ("RoomService", "CreateRoom", CreateRoomRequest, self._create_room),
+            ("RoomService", "ListRooms", ListRoomsRequest, self._list_rooms),
+            ("RoomService", "DeleteRoom", DeleteRoomRequest, self._delete_room),
+            (
+                "RoomService",
+                "ListParticipants",
+                ListParticipantsRequest,
+                self._list_participants,
+            ),
+        ]
+
+    def _endpoint(
+        self,
+        name: str,
+        request_class: type[RequestT],
+        handler: Callable[[RequestT], Message],
+    ) -> Callable[[web.Request], Awaitable[web.Response]]:
+        async def endpoint(request: web.Request) -> web.Response:
+            self.calls[name] += 1
+            await self._delay()
+            try:
+                self._authenticate(request)
+                self._inject_failure()
+                message = request_class.FromString(await request.read())
+                response = handler(message)
+            except TwirpFault as e:
+                return e.to_response()
+            return web.Response(
+                body=response.SerializeToString(), content_type="application/protobuf"
+            )
+
+        return endpoint
+
+    async def _bad_route(self, request: web.Request) -> web.Response:
+        route = request.match_info["route"]
+        return TwirpFault("bad_route", f"no handler for {route}").to_response()
+
+    async def _delay(self) -> None:
+        delay = self.latency
+        if self.latency_jitter:
+            delay += self._random.uniform(0, self.latency_jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _authenticate(self, request: web.Request) -> None:
+        header = request.headers.get("Authorization", "")
+        if not header.startswith("Bearer "):
+            raise TwirpFault("unauthenticated", "missing bearer token")
+        try:
+            claims = jwt.decode(
+                header.removeprefix("Bearer "),
+                self.api_secret,
+                algorithms=["HS256"],
+                options={"verify_aud": False},
+            )
+        except jwt.InvalidTokenError as e:
+            raise TwirpFault("unauthenticated", str(e)) from e
+        if claims.get("iss") != self.api_key:
+            raise TwirpFault("unauthenticated", "unknown API key")
+
+    def _inject_failure(self) -> None:
+        if self._forced_failures:
+            raise TwirpFault(self._forced_failures.pop(0), "injected failure")
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise TwirpFault(self.error_code, "injected failure")
+
+    def _new_id(self, prefix: str) -> str:
+        self._next_id += 1
+        return f"{prefix}_{self._next_id}"
+
+    def _create_dispatch(self, request: CreateAgentDispatchRequest) -> AgentDispatch:
+        if not request.room:
+            raise TwirpFault("invalid_argument", "room is required")
+        dispatch = AgentDispatch(
+            id=self._new_id("AD"),
+            agent_name=request.agent_name,
+            room=request.room,
+            metadata=request.metadata,
+        )
+        self.dispatches.append(dispatch)
+        return dispatch
+
+    def _list_dispatch(
+        self, request: ListAgentDispatchRequest
+    ) -> ListAgentDispatchResponse:
+        return ListAgentDispatchResponse(
+            agent_dispatches=[
+                dispatch
+                for dispatch in self.dispatches
+                if dispatch.room == request.room
+                and (not request.dispatch_id or dispatch.id == request.dispatch_id)
+            ]
+        )
+
+    def _delete_dispatch(self, request: DeleteAgentDispatchRequest) -> AgentDispatch:
+        for dispatch in self.dispatches:
+            if dispatch.id == request.dispatch_id and dispatch.room == request.room:
+                self.dispatches.remove(dispatch)
+                return dispatch
+        raise TwirpFault("not_found", f"dispatch {request.dispatch_id} not found")
+
+    def _create_room(self, request: CreateRoomRequest) -> Room:
+        # Like LiveKit, creating an existing room returns it unchanged
+        if request.name not in self.rooms:
+            now = time.time()
+            self.rooms[request.name] = Room(
+                sid=self._new_id("RM"),
+                name=request.name,
+                empty_timeout=request.empty_timeout,
+                max_participants=request.max_participants,
+                metadata=request.metadata,
+                creation_time=int(now),
+                creation_time_ms=int(now * 1000),
+            )
+        return self.rooms[request.name]
+
+    def _list_rooms(self, request: ListRoomsRequest) -> ListRoomsResponse:
+        names = set(request.names)
+        return ListRoomsResponse(
+            rooms=[
+                room for name, room in self.rooms.items() if not names or name in names
+            ]
+        )
+
+    def _delete_room(self, request: DeleteRoomRequest) -> DeleteRoomResponse:
+        if self.rooms.pop(request.room, None) is None:
+            raise TwirpFault("not_found", f"room {request.room} not found")
+        return DeleteRoomResponse()
+
+    def _list_participants(
+        self, request: ListParticipantsRequest
+    ) -> ListParticipantsResponse:
+        if request.room not in self.rooms:
+            raise TwirpFault("not_found", f"room {request.room} not found")
+        return ListParticipantsResponse()
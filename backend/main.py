@@ -2,9 +2,13 @@
 Standalone FastAPI application for Fancall.
 
 This module provides the entry point for running Fancall as an independent service.
+Importing it is side-effect free: there is no module-level app. Settings,
+routers and the LiveKit client are built by ``create_app()``, which uvicorn
+calls as a factory, while database engines are created (and the optional
+schema creation runs) in the app lifespan, i.e. once per worker process.
 
 Usage:
-    uvicorn main:app --reload
+    uvicorn --factory main:create_app --reload
 
 Environment Variables:
     DATABASE_URL: PostgreSQL database URL
@@ -12,11 +16,15 @@ Environment Variables:
     LIVEKIT_API_KEY: LiveKit API key
     LIVEKIT_API_SECRET: LiveKit API secret
     JWT_SECRET_KEY: JWT secret key (default: dev-secret for development)
+    FANCALL_API_CREATE_SCHEMA: Create missing tables on startup (default: false)
     LOG_LEVEL: Logging level (default: INFO)
 """
 
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
 
 from aioia_core.errors import (
     INTERNAL_SERVER_ERROR,
@@ -25,18 +33,14 @@ from aioia_core.errors import (
     extract_error_code_from_exception,
     get_error_detail_from_exception,
 )
-from aioia_core.models import Base
-from aioia_core.settings import DatabaseSettings, JWTSettings
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
-from fancall.api.router import create_fancall_router
-from fancall.factories import LiveRoomRepositoryFactory
-from fancall.settings import LiveKitSettings
+from fancall.metrics import API_ERRORS
+from fancall.startup import StartupReport
 
 # Configure logging
 logging.basicConfig(
@@ -45,51 +49,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-
-# ==============================================================================
-# Initialize Settings from Environment Variables
-# ==============================================================================
-
-# BaseSettings automatically reads from environment variables
-db_settings = DatabaseSettings()  # DATABASE_URL
-livekit_settings = LiveKitSettings()  # LIVEKIT_URL, LIVEKIT_API_KEY, LIVEKIT_API_SECRET
-jwt_settings = JWTSettings()  # JWT_SECRET_KEY
-
-logger.info("Loaded settings from environment variables")
-logger.info("LiveKit URL: %s", livekit_settings.url)
-logger.info(
-    "Database: %s", db_settings.url.rsplit("@", maxsplit=1)[-1]
-)  # Hide credentials
-
-
-# ==============================================================================
-# Initialize Database
-# ==============================================================================
-
-engine = create_engine(db_settings.url, echo=False)
-Base.metadata.create_all(engine)
-db_session_factory = sessionmaker(bind=engine)
-
-logger.info("Database initialized")
-
-
-# Create FastAPI app
-app = FastAPI(
-    title="Fancall API",
-    version="0.1.0",
-    description="AI-powered video call with virtual companions",
-    docs_url="/docs",
-    redoc_url="/redoc",
-)
-
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Alembic migration environment used by the startup schema check
+ALEMBIC_SCRIPT_LOCATION = Path(__file__).resolve().parent / "alembic"
 
 
 # ==============================================================================
@@ -97,7 +58,6 @@ app.add_middleware(
 # ==============================================================================
 
 
-@app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTPException with consistent error response format."""
     error_code = extract_error_code_from_exception(exc)
@@ -110,12 +70,12 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         exc.status_code,
         error_code,
     )
+    API_ERRORS.labels(error_code, str(exc.status_code)).inc()
 
     error_data = ErrorResponse(status=exc.status_code, detail=detail, code=error_code)
     return JSONResponse(status_code=exc.status_code, content=error_data.model_dump())
 
 
-@app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle Pydantic validation errors."""
     first_error = exc.errors()[0] if exc.errors() else {}
@@ -131,12 +91,12 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         request.url,
         exc.errors(),
     )
+    API_ERRORS.labels(VALIDATION_ERROR, "422").inc()
 
     error_data = ErrorResponse(status=422, detail=detail, code=VALIDATION_ERROR)
     return JSONResponse(status_code=422, content=error_data.model_dump())
 
 
-@app.exception_handler(Exception)
 async def internal_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions."""
     logger.error(
@@ -146,6 +106,7 @@ async def internal_exception_handler(request: Request, exc: Exception):
         exc,
         exc_info=True,
     )
+    API_ERRORS.labels(INTERNAL_SERVER_ERROR, "500").inc()
 
     error_data = ErrorResponse(
         status=500,
@@ -156,43 +117,250 @@ async def internal_exception_handler(request: Request, exc: Exception):
 
 
 # ==============================================================================
-# Routes
+# Application Factory
 # ==============================================================================
 
-# Create and include Fancall router
-fancall_router = create_fancall_router(
-    livekit_settings=livekit_settings,
-    jwt_settings=jwt_settings,
-    db_session_factory=db_session_factory,
-    repository_factory=LiveRoomRepositoryFactory(db_session_factory),
-    user_info_provider=None,  # Standalone mode: no user authentication
-)
-app.include_router(fancall_router)
-
-logger.info("Fancall router registered")
 
-
-@app.get("/healthz", tags=["management"])
-async def health_check():
-    """
-    Health check endpoint.
-
-    Returns:
-        dict: Status message
+def create_app() -> FastAPI:  # pylint: disable=too-many-locals
     """
-    return {"status": "healthy", "service": "fancall"}
-
+    Create the Fancall API application.
 
-@app.get("/", tags=["management"])
-async def root():
-    """
-    Root endpoint.
+    Fancall modules are imported here rather than at module level, so the API
+    only loads what it serves (never the agent worker stack) and the import cost
+    shows up in the startup report.
 
     Returns:
-        dict: Welcome message with documentation link
+        FastAPI application
     """
-    return {
-        "message": "Fancall API",
-        "description": "AI-powered video call with virtual companions",
-        "docs": "/docs",
-    }
+    report = StartupReport()
+
+    with report.phase("imports"):
+        # pylint: disable=import-outside-toplevel
+        from aioia_core.models import Base
+        from aioia_core.settings import DatabaseSettings, JWTSettings
+        from sqlalchemy.orm import sessionmaker
+
+        from fancall.api.router import create_fancall_router
+        from fancall.database import (
+            PoolMetrics,
+            create_async_db_engine,
+            create_async_session_factory,
+            create_db_engine,
+            schema_is_current,
+        )
+        from fancall.factories import (
+            AsyncLiveRoomRepositoryFactory,
+            AsyncPersonaRepositoryFactory,
+            LiveRoomRepositoryFactory,
+            PersonaRepositoryFactory,
+        )
+        from fancall.services.livekit_service import LiveKitService
+        from fancall.services.room_cache import RoomExistenceCache
+        from fancall.settings import (
+            ApiSettings,
+            DatabasePoolSettings,
+            LiveKitSettings,
+            RoomCacheSettings,
+        )
+
+    with report.phase("settings"):
+        # BaseSettings automatically reads from environment variables
+        api_settings = ApiSettings()  # FANCALL_API_*
+        db_settings = DatabaseSettings()  # DATABASE_URL, DATABASE_POOL_*
+        db_pool_settings = DatabasePoolSettings()  # FANCALL_DB_POOL_*
+        # LIVEKIT_URL, LIVEKIT_API_KEY, LIVEKIT_API_SECRET
+        livekit_settings = LiveKitSettings()
+        jwt_settings = JWTSettings()  # JWT_SECRET_KEY
+        room_cache_settings = RoomCacheSettings()  # FANCALL_ROOM_CACHE_*
+
+    logger.info("Loaded settings from environment variables")
+    logger.info("LiveKit URL: %s", livekit_settings.url)
+    logger.info(
+        "Database: %s", db_settings.url.rsplit("@", maxsplit=1)[-1]
+    )  # Hide credentials
+
+    with report.phase("app"):
+        # Pool telemetry, exposed at /healthz/db-pool
+        sync_pool_metrics = PoolMetrics(db_pool_settings.wait_buckets_ms)
+        async_pool_metrics = PoolMetrics(db_pool_settings.wait_buckets_ms)
+
+        # Unbound until the lifespan creates the engines in the serving process,
+        # so pre-fork servers never share pooled connections across workers
+        db_session_factory = sessionmaker()
+        async_db_session_factory = create_async_session_factory()
+
+        # Shared LiveKit service (pooled server API client), closed by the lifespan
+        livekit_service = LiveKitService(livekit_settings)
+        # Shared room existence cache, stats exposed at /stats/room-cache
+        room_cache = RoomExistenceCache(room_cache_settings)
+
+        def ensure_schema(engine) -> None:
+            """Create missing tables unless Alembic reports the schema current."""
+            with engine.connect() as connection:
+                if schema_is_current(connection, str(ALEMBIC_SCRIPT_LOCATION)):
+                    logger.info("Database is at the Alembic head, skipping create_all")
+                    return
+            Base.metadata.create_all(engine)
+            logger.info("Database schema created")
+
+        @asynccontextmanager
+        async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+            """Create per-process resources on startup and release them on shutdown."""
+            with report.phase("database"):
+                engine = create_db_engine(
+                    db_settings, db_pool_settings, sync_pool_metrics
+                )
+                # Async engine for request handlers, so DB round trips do not
+                # block the event loop
+                async_engine = create_async_db_engine(
+                    db_settings, db_pool_settings, async_pool_metrics
+                )
+                db_session_factory.configure(bind=engine)
+                async_db_session_factory.configure(bind=async_engine)
+            logger.info("Database initialized")
+
+            if api_settings.create_schema:
+                with report.phase("schema"):
+                    ensure_schema(engine)
+
+            report.log(logger)
+            application.state.startup_report = report.to_dict()
+            try:
+                yield
+            finally:
+                await livekit_service.aclose()
+                await async_engine.dispose()
+                engine.dispose()
+                logger.info("LiveKit service and database engines closed")
+
+        application = FastAPI(
+            title="Fancall API",
+            version="0.1.0",
+            description="AI-powered video call with virtual companions",
+            docs_url="/docs",
+            redoc_url="/redoc",
+            lifespan=lifespan,
+        )
+
+        # CORS middleware
+        application.add_middleware(
+            CORSMiddleware,
+            allow_origins=["*"],  # Configure appropriately for production
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+        application.exception_handler(HTTPException)(http_exception_handler)
+        application.exception_handler(RequestValidationError)(
+            validation_exception_handler
+        )
+        application.exception_handler(Exception)(internal_exception_handler)
+
+        # Create and include Fancall router
+        fancall_router = create_fancall_router(
+            livekit_settings=livekit_settings,
+            jwt_settings=jwt_settings,
+            db_session_factory=db_session_factory,
+            repository_factory=LiveRoomRepositoryFactory(db_session_factory),
+            user_info_provider=None,  # Standalone mode: no user authentication
+            livekit_service=livekit_service,
+            async_repository_factory=AsyncLiveRoomRepositoryFactory(
+                async_db_session_factory
+            ),
+            room_cache=room_cache,
+            persona_repository_factory=PersonaRepositoryFactory(db_session_factory),
+            async_persona_repository_factory=AsyncPersonaRepositoryFactory(
+                async_db_session_factory
+            ),
+        )
+        application.include_router(fancall_router)
+
+        logger.info("Fancall router registered")
+
+    @application.get("/healthz", tags=["management"])
+    async def health_check():
+        """
+        Health check endpoint.
+
+        Returns:
+            dict: Status message
+        """
+        return {"status": "healthy", "service": "fancall"}
+
+    @application.get("/healthz/livekit", tags=["management"])
+    async def livekit_health_check():
+        """
+        LiveKit connectivity check using the shared, pooled API client.
+
+        Returns:
+            JSONResponse: 200 if the LiveKit server API is reachable, 503 otherwise
+        """
+        healthy = await livekit_service.check_health()
+        return JSONResponse(
+            status_code=200 if healthy else 503,
+            content={
+                "status": "healthy" if healthy else "unhealthy",
+                "service": "livekit",
+            },
+        )
+
+    @application.get("/healthz/db-pool", tags=["management"])
+    async def db_pool_stats():
+        """
+        Database connection pool telemetry.
+
+        Returns:
+            dict: Occupancy, checkout counters and wait histogram of the sync pool
+                (threadpool handlers, auth lookups) and the async pool (room routes)
+        """
+        return {
+            "sync": sync_pool_metrics.snapshot(),
+            "async": async_pool_metrics.snapshot(),
+        }
+
+    @application.get("/healthz/startup", tags=["management"])
+    async def startup_report(request: Request):
+        """
+        Startup time breakdown of this worker process.
+
+        Returns:
+            dict: Milliseconds spent per startup phase, plus the total
+        """
+        return request.app.state.startup_report
+
+    @application.get("/stats/room-cache", tags=["management"])
+    async def room_cache_stats():
+        """
+        Room existence cache statistics.
+
+        Returns:
+            dict: Hit/miss counters, hit ratio and number of cached rooms
+        """
+        return room_cache.stats()
+
+    @application.get("/metrics", tags=["management"])
+    async def metrics():
+        """
+        Prometheus metrics endpoint.
+
+        Returns:
+            Response: Metrics in the Prometheus text exposition format
+        """
+        return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+    @application.get("/", tags=["management"])
+    async def root():
+        """
+        Root endpoint.
+
+        Returns:
+            dict: Welcome message with documentation link
+        """
+        return {
+            "message": "Fancall API",
+            "description": "AI-powered video call with virtual companions",
+            "docs": "/docs",
+        }
+
+    return application
@@ -0,0 +1,77 @@
+"""
+Unit tests for the simulated agent plugins
+"""
+
+import asyncio
+import unittest
+
+from livekit import rtc
+from livekit.agents import llm
+
+from fancall.testing.agent_plugins import (
+    NUM_CHANNELS,
+    SAMPLE_RATE,
+    FakeAvatarAudioOutput,
+    FakeLLM,
+    FakeTTS,
+    PluginTiming,
+)
+
+TIMING = PluginTiming(
+    llm_ttft=0.01,
+    llm_tokens_per_second=1000,
+    tts_ttfb=0.01,
+    tts_realtime_factor=0.01,
+)
+
+
+def _frame(seconds: float) -> rtc.AudioFrame:
+    samples = int(SAMPLE_RATE * seconds)
+    return rtc.AudioFrame(
+        bytes(samples * NUM_CHANNELS * 2), SAMPLE_RATE, NUM_CHANNELS, samples
+    )
+
+
+class TestAgentPlugins(unittest.IsolatedAsyncioTestCase):
+    """Tests for FakeLLM, FakeTTS and FakeAvatarAudioOutput"""
+
+    async def test_llm_streams_reply(self):
+        """Test that the fake LLM streams its whole reply"""
+        fake_llm = FakeLLM(TIMING, reply="hello there fan")
+
+        async with fake_llm.chat(chat_ctx=llm.ChatContext.empty()) as stream:
+            text = "".join(
+                [
+                    chunk.delta.content
+                    async for chunk in stream
+                    if chunk.delta and chunk.delta.content
+                ]
+            )
+
+        self.assertEqual(text.strip(), "hello there fan")
+
+    async def test_tts_audio_length_follows_text(self):
+        """Test that synthesized audio lasts seconds_per_char per character"""
+        fake_tts = FakeTTS(TIMING)
+
+        frame = await fake_tts.synthesize("x" * 10).collect()
+
+        self.assertAlmostEqual(
+            frame.duration, 10 * TIMING.tts_seconds_per_char, delta=0.02
+        )
+
+    async def test_late_frames_count_as_underruns(self):
+        """Test that a frame arriving after its playout deadline is an underrun"""
+        output = FakeAvatarAudioOutput(TIMING)
+
+        await output.capture_frame(_frame(0.05))
+        await output.capture_frame(_frame(0.05))
+        self.assertEqual(output.underruns, 0)
+
+        await asyncio.sleep(0.2)
+        await output.capture_frame(_frame(0.05))
+        output.flush()
+        playback = await output.wait_for_playout()
+
+        self.assertEqual(output.underruns, 1)
+        self.assertAlmostEqual(playback.playback_position, 0.15, 2)
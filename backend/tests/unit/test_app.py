@@ -0,0 +1,98 @@
+"""
+Unit tests for the standalone application factory
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect, text
+
+from alembic.script import ScriptDirectory
+from main import ALEMBIC_SCRIPT_LOCATION, create_app
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+class TestCreateApp(unittest.TestCase):
+    """Tests for create_app"""
+
+    def setUp(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        self.db_path = Path(tmp_dir) / "fancall.db"
+        self.env = {"DATABASE_URL": f"sqlite:///{self.db_path}"}
+
+    def _tables(self) -> list[str]:
+        engine = create_engine(self.env["DATABASE_URL"])
+        try:
+            return inspect(engine).get_table_names()
+        finally:
+            engine.dispose()
+
+    def test_create_app_does_not_touch_database(self):
+        """Test that building the app opens no connection"""
+        with patch.dict(os.environ, self.env):
+            create_app()
+
+        self.assertFalse(self.db_path.exists())
+
+    def test_schema_creation_is_opt_in(self):
+        """Test that tables are created on startup only when enabled"""
+        with patch.dict(os.environ, self.env):
+            with TestClient(create_app()):
+                pass
+        self.assertNotIn("live_rooms", self._tables())
+
+        with patch.dict(os.environ, {**self.env, "FANCALL_API_CREATE_SCHEMA": "true"}):
+            with TestClient(create_app()) as client:
+                created = client.post("/live-rooms")
+                report = client.get("/healthz/startup").json()
+
+        self.assertEqual(created.status_code, 201)
+        self.assertIn("schema", report)
+        self.assertGreater(report["total"], 0)
+
+    def test_schema_creation_skipped_at_alembic_head(self):
+        """Test that create_all is skipped when the revision check passes"""
+        head = ScriptDirectory(str(ALEMBIC_SCRIPT_LOCATION)).get_current_head()
+        engine = create_engine(self.env["DATABASE_URL"])
+        with engine.begin() as connection:
+            connection.execute(
+                text("CREATE TABLE alembic_version (version_num VARCHAR(32))")
+            )
+            connection.execute(
+                text("INSERT INTO alembic_version VALUES (:head)"), {"head": head}
+            )
+        engine.dispose()
+
+        with patch.dict(os.environ, {**self.env, "FANCALL_API_CREATE_SCHEMA": "true"}):
+            with TestClient(create_app()):
+                pass
+
+        self.assertNotIn("live_rooms", self._tables())
+
+    def test_api_does_not_import_agent_stack(self):
+        """Test that building the app never loads agent-only dependencies"""
+        agent_modules = ["livekit.agents", "openai", "PIL", "fancall.agent"]
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, main; main.create_app(); "
+                f"print([m for m in {agent_modules!r} if m in sys.modules])",
+            ],
+            cwd=BACKEND_DIR,
+            env={**os.environ, **self.env},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        self.assertEqual(result.stdout.strip(), "[]")
@@ -0,0 +1,115 @@
+"""
+Unit tests for the async LiveRoom repository and its router integration
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import httpx
+from aioia_core.models import Base
+from aioia_core.settings import DatabaseSettings, JWTSettings
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from fancall.api.router import create_fancall_router
+from fancall.database import (
+    create_async_db_engine,
+    create_async_session_factory,
+    to_async_database_url,
+)
+from fancall.factories import AsyncLiveRoomRepositoryFactory, LiveRoomRepositoryFactory
+from fancall.repositories.live_room_repository import DatabaseLiveRoomRepository
+from fancall.schemas import LiveRoomCreate
+from fancall.settings import LiveKitSettings
+
+
+class TestToAsyncDatabaseUrl(unittest.TestCase):
+    """Tests for to_async_database_url"""
+
+    def test_sync_urls_map_to_async_drivers(self):
+        """Test that sync drivers are swapped for their asyncio equivalents"""
+        self.assertEqual(
+            to_async_database_url("sqlite:///./local.db"),
+            "sqlite+aiosqlite:///./local.db",
+        )
+        self.assertEqual(
+            to_async_database_url("postgresql+psycopg2://u:p@db:5432/fancall"),
+            "postgresql+asyncpg://u:p@db:5432/fancall",
+        )
+        self.assertEqual(
+            to_async_database_url("postgresql+asyncpg://u:p@db/fancall"),
+            "postgresql+asyncpg://u:p@db/fancall",
+        )
+
+    def test_unsupported_backend_raises(self):
+        """Test that backends without a configured async driver are rejected"""
+        with self.assertRaises(ValueError):
+            to_async_database_url("mysql://u:p@db/fancall")
+
+
+class TestAsyncLiveRoomRepository(unittest.IsolatedAsyncioTestCase):
+    """Tests for AsyncDatabaseLiveRoomRepository on aiosqlite"""
+
+    async def asyncSetUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{Path(self.tmp_dir.name) / 'fancall.db'}"
+        self.engine = create_engine(url)
+        Base.metadata.create_all(self.engine)
+        self.db_session_factory = sessionmaker(bind=self.engine)
+        self.async_engine = create_async_db_engine(DatabaseSettings(url=url))
+        self.factory = AsyncLiveRoomRepositoryFactory(
+            create_async_session_factory(self.async_engine)
+        )
+
+    async def asyncTearDown(self):
+        await self.async_engine.dispose()
+        self.engine.dispose()
+        self.tmp_dir.cleanup()
+
+    async def test_create_and_get_by_id(self):
+        """Test that created rooms are visible to the sync repository too"""
+        async with self.factory.db_session_factory() as db_session:
+            repository = self.factory.create_repository(db_session)
+            created = await repository.create(LiveRoomCreate())
+            fetched = await repository.get_by_id(created.id)
+
+        assert fetched is not None
+        self.assertEqual(fetched.id, created.id)
+        with self.db_session_factory() as db_session:
+            self.assertIsNotNone(
+                DatabaseLiveRoomRepository(db_session).get_by_id(created.id)
+            )
+
+    async def test_missing_room_returns_none(self):
+        """Test that an unknown ID yields None"""
+        async with self.factory.db_session_factory() as db_session:
+            repository = self.factory.create_repository(db_session)
+            self.assertIsNone(await repository.get_by_id("missing"))
+
+    async def test_router_uses_async_repository(self):
+        """Test that create and lookup routes work on the async session"""
+        app = FastAPI()
+        app.include_router(
+            create_fancall_router(
+                livekit_settings=LiveKitSettings(),
+                jwt_settings=JWTSettings(secret_key=None),
+                db_session_factory=self.db_session_factory,
+                repository_factory=LiveRoomRepositoryFactory(self.db_session_factory),
+                async_repository_factory=self.factory,
+            )
+        )
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            created = await client.post("/live-rooms")
+            room_id = created.json()["data"]["id"]
+            token = await client.post(f"/live-rooms/{room_id}/token")
+            missing = await client.post("/live-rooms/missing/token")
+
+        self.assertEqual(created.status_code, 201)
+        self.assertEqual(token.status_code, 200)
+        self.assertEqual(token.json()["roomName"], room_id)
+        self.assertEqual(missing.status_code, 404)
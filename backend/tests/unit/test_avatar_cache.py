@@ -0,0 +1,150 @@
+"""
+Unit tests for the worker avatar image cache
+"""
+
+import base64
+import io
+import tempfile
+import unittest
+
+import httpx
+from PIL import Image
+
+from fancall.agent.avatar_cache import AvatarImageCache
+from fancall.agent.http_client import AssetHttpClient
+from fancall.settings import AssetHttpSettings, AvatarCacheSettings
+
+
+def _png_bytes(size: tuple[int, int] = (4, 4), color: str = "red") -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGBA", size, color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _data_url(size: tuple[int, int] = (4, 4), color: str = "red") -> str:
+    encoded = base64.b64encode(_png_bytes(size, color)).decode()
+    return f"data:image/png;base64,{encoded}"
+
+
+class TestAvatarImageCache(unittest.IsolatedAsyncioTestCase):
+    """Tests for AvatarImageCache"""
+
+    def setUp(self):
+        self.requests: list[httpx.Request] = []
+        self.client = AssetHttpClient(
+            AssetHttpSettings(), transport=httpx.MockTransport(self._handle)
+        )
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=_png_bytes(), headers={"ETag": '"v1"'})
+
+    async def test_data_url_is_decoded_once(self):
+        """Test that a repeated data URL is served from memory as RGB"""
+        cache = AvatarImageCache(AvatarCacheSettings())
+        url = _data_url()
+
+        first = await cache.get_image(url, self.client)
+        second = await cache.get_image(url, self.client)
+
+        self.assertIs(first, second)
+        self.assertEqual(first.mode, "RGB")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(self.requests, [])
+
+    async def test_invalid_data_url_raises(self):
+        """Test that a malformed data URL raises ValueError"""
+        cache = AvatarImageCache(AvatarCacheSettings())
+
+        with self.assertRaises(ValueError):
+            await cache.get_image("data:text/plain,hello", self.client)
+
+    async def test_large_image_is_downscaled_with_stage_timings(self):
+        """Test that images are reduced to target_size and each stage is timed"""
+        cache = AvatarImageCache(AvatarCacheSettings(target_size=8))
+        timings: dict[str, float] = {}
+
+        image = await cache.get_image(_data_url(size=(32, 16)), self.client, timings)
+
+        self.assertEqual(image.size, (8, 4))
+        self.assertLessEqual(
+            {"queue", "hash", "base64", "validate", "decode", "resize"},
+            set(timings),
+        )
+
+    async def test_images_over_limits_raise(self):
+        """Test that oversized payloads and pixel counts are rejected"""
+        url = _data_url(size=(64, 64))
+        too_many_pixels = AvatarImageCache(AvatarCacheSettings(max_pixels=1000))
+        too_many_bytes = AvatarImageCache(AvatarCacheSettings(max_input_bytes=10))
+
+        with self.assertRaisesRegex(ValueError, "pixels"):
+            await too_many_pixels.get_image(url, self.client)
+        timings: dict[str, float] = {}
+        with self.assertRaisesRegex(ValueError, "limit"):
+            await too_many_bytes.get_image(url, self.client, timings)
+        # Rejected on its length, before the payload is hashed
+        self.assertNotIn("hash", timings)
+
+    async def test_undecodable_image_raises(self):
+        """Test that a data URL whose payload is not an image raises ValueError"""
+        cache = AvatarImageCache(AvatarCacheSettings())
+        url = "data:image/png;base64," + base64.b64encode(b"not a png").decode()
+
+        with self.assertRaisesRegex(ValueError, "decode"):
+            await cache.get_image(url, self.client)
+
+    async def test_memory_tier_respects_byte_budget(self):
+        """Test that least recently used images are evicted over budget"""
+        # Each 4x4 RGB image is 48 bytes; budget fits two
+        cache = AvatarImageCache(AvatarCacheSettings(memory_budget_bytes=100))
+        urls = [_data_url(color=color) for color in ("red", "green", "blue")]
+
+        for url in urls:
+            await cache.get_image(url, self.client)
+
+        self.assertEqual(cache.memory_bytes, 96)
+        await cache.get_image(urls[0], self.client)
+        self.assertEqual(cache.misses, 4)
+
+    async def test_http_entry_is_revalidated_with_etag(self):
+        """Test that stale HTTP entries send If-None-Match and reuse on 304"""
+        cache = AvatarImageCache(AvatarCacheSettings(revalidate_after_seconds=0))
+        url = "https://example.com/avatar.png"
+
+        first = await cache.get_image(url, self.client)
+        second = await cache.get_image(url, self.client)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.requests[1].headers["If-None-Match"], '"v1"')
+        self.assertEqual(cache.revalidations, 1)
+
+    async def test_fresh_http_entry_skips_network(self):
+        """Test that fresh HTTP entries are served without a request"""
+        cache = AvatarImageCache(AvatarCacheSettings(revalidate_after_seconds=60))
+        url = "https://example.com/avatar.png"
+
+        await cache.get_image(url, self.client)
+        await cache.get_image(url, self.client)
+
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_disk_tier_survives_new_cache_instance(self):
+        """Test that a new process-level cache reuses normalized images on disk"""
+        url = "https://example.com/avatar.png"
+        with tempfile.TemporaryDirectory() as disk_dir:
+            settings = AvatarCacheSettings(disk_dir=disk_dir)
+            await AvatarImageCache(settings).get_image(url, self.client)
+
+            cache = AvatarImageCache(settings)
+            image = await cache.get_image(url, self.client)
+
+        self.assertEqual(image.size, (4, 4))
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(cache.hits, 1)
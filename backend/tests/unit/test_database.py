@@ -0,0 +1,84 @@
+"""
+Unit tests for database engine and pool telemetry helpers
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from aioia_core.settings import DatabaseSettings
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from fancall.database import PoolMetrics, create_async_db_engine, create_db_engine
+from fancall.settings import DatabasePoolSettings
+
+
+class TestPoolMetrics(unittest.IsolatedAsyncioTestCase):
+    """Tests for pool configuration and checkout telemetry"""
+
+    async def asyncSetUp(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        self.db_settings = DatabaseSettings(
+            url=f"sqlite:///{Path(tmp_dir) / 'fancall.db'}",
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0,
+        )
+        self.metrics = PoolMetrics([1, 1000])
+
+    def test_checkouts_are_recorded(self):
+        """Test that occupancy and the wait histogram reflect checkouts"""
+        engine = create_db_engine(
+            self.db_settings, DatabasePoolSettings(), self.metrics
+        )
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            busy = self.metrics.snapshot()
+        idle = self.metrics.snapshot()
+        engine.dispose()
+
+        self.assertEqual((busy["size"], busy["checked_out"]), (1, 1))
+        self.assertEqual((idle["checked_out"], idle["checked_in"]), (0, 1))
+        self.assertEqual(idle["checkouts"], 1)
+        self.assertEqual(idle["wait_histogram_ms"]["+Inf"], 1)
+        self.assertEqual(list(idle["wait_histogram_ms"]), ["1", "1000", "+Inf"])
+
+    def test_exhausted_pool_counts_timeouts(self):
+        """Test that a checkout beyond pool_size + max_overflow is counted"""
+        engine = create_db_engine(
+            self.db_settings, DatabasePoolSettings(), self.metrics
+        )
+
+        with engine.connect():
+            with self.assertRaises(PoolTimeoutError):
+                engine.connect()
+        engine.dispose()
+
+        self.assertEqual(self.metrics.snapshot()["timeouts"], 1)
+
+    def test_metrics_follow_pool_recreated_by_dispose(self):
+        """Test that the replacement pool created by dispose() keeps reporting"""
+        engine = create_db_engine(
+            self.db_settings, DatabasePoolSettings(), self.metrics
+        )
+        engine.dispose()
+
+        with engine.connect():
+            self.assertEqual(self.metrics.snapshot()["checked_out"], 1)
+        engine.dispose()
+
+    async def test_async_engine_is_instrumented(self):
+        """Test that the asyncio engine records checkouts too"""
+        engine = create_async_db_engine(
+            self.db_settings, DatabasePoolSettings(), self.metrics
+        )
+
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        await engine.dispose()
+
+        self.assertEqual(self.metrics.snapshot()["checkouts"], 1)
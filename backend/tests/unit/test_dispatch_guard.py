@@ -0,0 +1,185 @@
+"""
+Unit tests for the per-room agent dispatch guard
+"""
+
+import asyncio
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+from aioia_core.models import Base
+from aioia_core.settings import DatabaseSettings, JWTSettings
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from fancall.api.router import create_fancall_router
+from fancall.database import create_async_db_engine, create_async_session_factory
+from fancall.factories import AsyncLiveRoomRepositoryFactory, LiveRoomRepositoryFactory
+from fancall.models import DBAgentDispatch
+from fancall.repositories.agent_dispatch_repository import DISPATCH_PENDING
+from fancall.services.dispatch_guard import DispatchGuard
+from fancall.services.livekit_service import LiveKitService
+from fancall.settings import DispatchGuardSettings
+from fancall.testing import FakeLiveKitServer
+
+
+class TestDispatchGuard(unittest.IsolatedAsyncioTestCase):
+    """Tests for POST /live-rooms/{id}/dispatch deduplication"""
+
+    async def asyncSetUp(self):
+        # Slow enough that concurrent requests overlap the first dispatch
+        self.livekit_server = FakeLiveKitServer(latency=0.1)
+        await self.livekit_server.start()
+
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        db_url = f"sqlite:///{Path(tmp_dir) / 'fancall.db'}"
+        self.engine = create_engine(db_url)
+        Base.metadata.create_all(self.engine)
+        self.db_session_factory = sessionmaker(bind=self.engine)
+        self.async_engine = create_async_db_engine(DatabaseSettings(url=db_url))
+        self.livekit_service = LiveKitService(self.livekit_server.settings())
+        self.client = self._client(async_db=True)
+
+    def _client(self, async_db: bool) -> httpx.AsyncClient:
+        app = FastAPI()
+        app.include_router(
+            create_fancall_router(
+                livekit_settings=self.livekit_server.settings(),
+                jwt_settings=JWTSettings(secret_key=None),
+                db_session_factory=self.db_session_factory,
+                repository_factory=LiveRoomRepositoryFactory(self.db_session_factory),
+                async_repository_factory=(
+                    AsyncLiveRoomRepositoryFactory(
+                        create_async_session_factory(self.async_engine)
+                    )
+                    if async_db
+                    else None
+                ),
+                livekit_service=self.livekit_service,
+                dispatch_guard=DispatchGuard(
+                    DispatchGuardSettings(
+                        wait_seconds=2.0,
+                        poll_interval_seconds=0.02,
+                        claim_ttl_seconds=5.0,
+                    )
+                ),
+            )
+        )
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        )
+        self.addAsyncCleanup(client.aclose)
+        return client
+
+    async def asyncTearDown(self):
+        await self.livekit_service.aclose()
+        await self.async_engine.dispose()
+        self.engine.dispose()
+        await self.livekit_server.stop()
+
+    async def _create_room(self) -> str:
+        response = await self.client.post("/live-rooms")
+        return response.json()["data"]["id"]
+
+    async def _dispatch(
+        self, room_id: str, idempotency_key: str | None = None
+    ) -> httpx.Response:
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else {}
+        return await self.client.post(
+            f"/live-rooms/{room_id}/dispatch", json={}, headers=headers
+        )
+
+    async def test_concurrent_dispatches_create_one_agent(self):
+        """Test that a double-tap returns the dispatch of the first request"""
+        room_id = await self._create_room()
+
+        responses = await asyncio.gather(*(self._dispatch(room_id) for _ in range(3)))
+
+        self.assertEqual([r.status_code for r in responses], [200, 200, 200])
+        self.assertEqual(len(self.livekit_server.dispatches), 1)
+        dispatch_id = self.livekit_server.dispatches[0].id
+        self.assertEqual({r.json()["dispatchId"] for r in responses}, {dispatch_id})
+
+    async def test_repeated_dispatch_returns_existing(self):
+        """Test that a later retry, with or without a key, replays the dispatch"""
+        room_id = await self._create_room()
+        first = await self._dispatch(room_id, idempotency_key="tap-1")
+
+        retry = await self._dispatch(room_id, idempotency_key="tap-1")
+        other = await self._dispatch(room_id)
+
+        self.assertEqual(retry.json(), first.json())
+        self.assertEqual(other.json(), first.json())
+        self.assertEqual(len(self.livekit_server.dispatches), 1)
+
+    async def test_idempotency_key_of_another_room_conflicts(self):
+        """Test that reusing a key for a different room is rejected"""
+        await self._dispatch(await self._create_room(), idempotency_key="tap-1")
+
+        response = await self._dispatch(
+            await self._create_room(), idempotency_key="tap-1"
+        )
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["detail"]["code"], "DISPATCH_CONFLICT")
+        self.assertEqual(len(self.livekit_server.dispatches), 1)
+
+    async def test_start_call_dispatch_is_recorded(self):
+        """Test that dispatching to a started call's room returns its agent"""
+        started = await self.client.post("/live-rooms/start-call", json={})
+        room_id = started.json()["room"]["id"]
+
+        response = await self._dispatch(room_id)
+
+        self.assertEqual(response.json(), started.json()["dispatch"])
+        self.assertEqual(len(self.livekit_server.dispatches), 1)
+
+    async def test_failed_dispatch_releases_room(self):
+        """Test that a room whose dispatch failed can be dispatched again"""
+        room_id = await self._create_room()
+        self.livekit_server.fail_next(code="internal")
+        with self.assertRaises(Exception):
+            await self._dispatch(room_id)
+
+        response = await self._dispatch(room_id)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.livekit_server.dispatches), 1)
+
+    async def test_abandoned_claim_is_taken_over(self):
+        """Test that a claim left pending by a stopped replica does not block the room"""
+        room_id = await self._create_room()
+        with self.db_session_factory() as db_session:
+            claimed_at = datetime.now(timezone.utc) - timedelta(seconds=60)
+            db_session.add(
+                DBAgentDispatch(
+                    room_id=room_id, status=DISPATCH_PENDING, created_at=claimed_at
+                )
+            )
+            db_session.commit()
+
+        response = await self._dispatch(room_id)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.livekit_server.dispatches), 1)
+
+    async def test_threaded_fallback_deduplicates(self):
+        """Test the guard on the synchronous database in the threadpool"""
+        self.client = self._client(async_db=False)
+        room_id = await self._create_room()
+
+        responses = await asyncio.gather(
+            self._dispatch(room_id), self._dispatch(room_id)
+        )
+
+        self.assertEqual([r.status_code for r in responses], [200, 200])
+        self.assertEqual(len(self.livekit_server.dispatches), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
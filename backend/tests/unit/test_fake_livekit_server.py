@@ -0,0 +1,88 @@
+"""
+Unit tests for the in-process LiveKit server stand-in
+"""
+
+import time
+import unittest
+
+import aiohttp
+from livekit import api
+from livekit.protocol.agent_dispatch import CreateAgentDispatchRequest
+from livekit.protocol.room import CreateRoomRequest, ListRoomsRequest
+
+from fancall.schemas import AgentDispatchRequest
+from fancall.services.livekit_service import LiveKitService
+from fancall.testing import FakeLiveKitServer
+
+
+class TestFakeLiveKitServer(unittest.IsolatedAsyncioTestCase):
+    """Tests for FakeLiveKitServer"""
+
+    async def asyncSetUp(self):
+        self.server = FakeLiveKitServer(seed=1)
+        await self.server.start()
+        self.session = aiohttp.ClientSession()
+        self.client = api.LiveKitAPI(
+            url=self.server.url,
+            api_key=self.server.api_key,
+            api_secret=self.server.api_secret,
+            session=self.session,
+        )
+
+    async def asyncTearDown(self):
+        await self.session.close()
+        await self.server.stop()
+
+    async def test_records_dispatches_and_rooms(self):
+        """Test that the official client can dispatch, list and manage rooms"""
+        dispatch = await self.client.agent_dispatch.create_dispatch(
+            CreateAgentDispatchRequest(
+                agent_name="fancall", room="room-1", metadata='{"voiceId":"v"}'
+            )
+        )
+        await self.client.room.create_room(CreateRoomRequest(name="room-1"))
+
+        listed = await self.client.agent_dispatch.list_dispatch("room-1")
+        rooms = await self.client.room.list_rooms(ListRoomsRequest(names=["room-1"]))
+
+        self.assertEqual([d.id for d in listed], [dispatch.id])
+        self.assertEqual(self.server.dispatches[0].metadata, '{"voiceId":"v"}')
+        self.assertEqual([room.name for room in rooms.rooms], ["room-1"])
+        self.assertEqual(self.server.calls["AgentDispatchService/CreateDispatch"], 1)
+
+    async def test_rejects_foreign_credentials(self):
+        """Test that tokens signed with another secret are unauthenticated"""
+        foreign = api.LiveKitAPI(
+            url=self.server.url,
+            api_key=self.server.api_key,
+            api_secret="another-secret",
+            session=self.session,
+        )
+
+        with self.assertRaises(api.TwirpError) as raised:
+            await foreign.room.list_rooms(ListRoomsRequest())
+
+        self.assertEqual(raised.exception.code, "unauthenticated")
+
+    async def test_injected_failures_and_latency(self):
+        """Test that forced failures, error rate and latency reach LiveKitService"""
+        service = LiveKitService(self.server.settings())
+        self.addAsyncCleanup(service.aclose)
+
+        self.server.fail_next(code="unavailable")
+        with self.assertRaises(api.TwirpError) as raised:
+            await service.dispatch_agent(AgentDispatchRequest(), "room-1")
+        self.assertEqual(raised.exception.status, 503)
+
+        self.server.error_rate = 1.0
+        with self.assertRaises(api.TwirpError):
+            await service.dispatch_agent(AgentDispatchRequest(), "room-1")
+
+        self.server.error_rate = 0.0
+        self.server.latency = 0.05
+        start = time.perf_counter()
+        response = await service.dispatch_agent(AgentDispatchRequest(), "room-1")
+
+        self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+        assert response is not None
+        self.assertEqual(len(self.server.dispatches), 1)
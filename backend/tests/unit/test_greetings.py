@@ -0,0 +1,58 @@
+"""
+Unit tests for pre-synthesized join greetings
+"""
+
+import unittest
+
+from fancall.agent.greetings import (
+    PendingGreeting,
+    pick_greeting,
+    presynthesize_greetings,
+)
+from fancall.agent.tts_cache import CachedTTS, TtsAudioCache
+from fancall.settings import TtsCacheSettings
+from fancall.testing.agent_plugins import FakeTTS, PluginTiming
+
+TIMING = PluginTiming(tts_ttfb=0.01, tts_realtime_factor=0.01)
+
+
+class BrokenTTS(FakeTTS):
+    """FakeTTS whose synthesis fails"""
+
+    def synthesize(self, text, **kwargs):
+        raise RuntimeError("TTS unavailable")
+
+
+class TestGreetings(unittest.IsolatedAsyncioTestCase):
+    """Tests for greeting selection and synthesis"""
+
+    def test_pick_greeting_skips_blank_entries(self):
+        """Test that only non-blank greetings are picked"""
+        self.assertIsNone(pick_greeting(None))
+        self.assertIsNone(pick_greeting(["", "  "]))
+        self.assertEqual(pick_greeting(["", "Hi!"]), "Hi!")
+
+    async def test_presynthesized_greeting_is_replayed_from_cache(self):
+        """Test that a job's greeting is read from the cache filled at prewarm"""
+        cache = TtsAudioCache(TtsCacheSettings())
+        await presynthesize_greetings(
+            CachedTTS(FakeTTS(TIMING), cache, "voice_a"), ["Hi!", "Hello."]
+        )
+
+        greeting = PendingGreeting(CachedTTS(FakeTTS(TIMING), cache, "voice_a"), "Hi!")
+        frames = await greeting.frames()
+
+        assert frames is not None
+        self.assertGreater(sum(frame.duration for frame in frames), 0)
+        self.assertEqual((cache.misses, cache.memory_hits), (2, 1))
+
+    async def test_failed_synthesis_yields_no_frames(self):
+        """Test that a synthesis error leaves the greeting to the live TTS"""
+        greeting = PendingGreeting(BrokenTTS(TIMING), "Hi!")
+
+        with self.assertLogs("fancall.agent.greetings", level="WARNING"):
+            self.assertIsNone(await greeting.frames())
+
+
+if __name__ == "__main__":
+    unittest.main()
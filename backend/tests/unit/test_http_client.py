@@ -0,0 +1,88 @@
+"""
+Unit tests for the worker asset HTTP client
+"""
+
+import unittest
+
+import httpx
+
+from fancall.agent.http_client import AssetHttpClient, AssetTooLargeError
+from fancall.settings import AssetHttpSettings
+
+
+def _client(handler, max_bytes: int = 8) -> AssetHttpClient:
+    return AssetHttpClient(
+        AssetHttpSettings(max_bytes=max_bytes), transport=httpx.MockTransport(handler)
+    )
+
+
+class _ChunkedBody(httpx.AsyncByteStream):
+    """Streaming body without Content-Length"""
+
+    def __init__(self, chunks: list[bytes]):
+        self.chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+class TestAssetHttpClient(unittest.IsolatedAsyncioTestCase):
+    """Tests for AssetHttpClient"""
+
+    async def test_fetch_returns_body_within_limit(self):
+        """Test that bodies within max_bytes are returned"""
+        client = _client(lambda request: httpx.Response(200, content=b"12345678"))
+
+        asset = await client.fetch("https://example.com/a.png")
+        await client.aclose()
+
+        self.assertEqual(asset.status_code, 200)
+        self.assertEqual(asset.content, b"12345678")
+
+    async def test_fetch_rejects_large_content_length(self):
+        """Test that a declared Content-Length over the limit is rejected upfront"""
+        client = _client(lambda request: httpx.Response(200, content=b"x" * 9))
+
+        with self.assertRaises(AssetTooLargeError):
+            await client.fetch("https://example.com/a.png")
+        await client.aclose()
+
+    async def test_fetch_stops_streaming_over_limit(self):
+        """Test that undeclared bodies are cut off once they exceed the limit"""
+        client = _client(
+            lambda request: httpx.Response(
+                200, stream=_ChunkedBody([b"12345", b"67890"])
+            )
+        )
+
+        with self.assertRaises(AssetTooLargeError):
+            await client.fetch("https://example.com/a.png")
+        await client.aclose()
+
+    async def test_fetch_passes_through_not_modified(self):
+        """Test that 304 is returned (not raised) for conditional requests"""
+        client = _client(lambda request: httpx.Response(304))
+
+        asset = await client.fetch(
+            "https://example.com/a.png", headers={"If-None-Match": '"v1"'}
+        )
+        await client.aclose()
+
+        self.assertEqual(asset.status_code, 304)
+        self.assertEqual(asset.content, b"")
+
+    async def test_fetch_raises_on_error_status(self):
+        """Test that error statuses raise httpx.HTTPStatusError"""
+        client = _client(lambda request: httpx.Response(404))
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await client.fetch("https://example.com/a.png")
+        await client.aclose()
+
+    async def test_client_is_reused_within_loop(self):
+        """Test that the pooled client is shared across fetches on one loop"""
+        client = _client(lambda request: httpx.Response(200))
+
+        self.assertIs(client.client, client.client)
+        await client.aclose()
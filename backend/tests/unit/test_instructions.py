@@ -0,0 +1,93 @@
+"""
+Unit tests for instruction composition and token budgets
+"""
+
+import unittest
+
+from fancall.agent.instructions import InstructionComposer, cacheable_prefix_tokens
+from fancall.prompts import ROLE_PLAYING_GUIDELINES, estimate_tokens, truncate_to_tokens
+from fancall.settings import FancallModelSettings
+
+
+class TestTokenBudget(unittest.TestCase):
+    """Tests for token estimation and truncation"""
+
+    def test_estimate_counts_hangul_per_character(self):
+        """Test that English is ~4 characters per token and Hangul 1 per character"""
+        self.assertEqual(estimate_tokens("abcdefgh"), 2)
+        self.assertEqual(estimate_tokens("안녕하세요"), 5)
+
+    def test_truncate_keeps_whole_lines(self):
+        """Test that texts are cut at a line break within the budget"""
+        summary = "- likes cats\n- has a dog named Bori\n- exam next week"
+
+        self.assertEqual(
+            truncate_to_tokens(summary, 11), "- likes cats\n- has a dog named Bori"
+        )
+
+    def test_cacheable_prefix_follows_provider_steps(self):
+        """Test that only whole cache steps past the minimum are cache-eligible"""
+        self.assertEqual(cacheable_prefix_tokens(1000, 1024, 128), 0)
+        self.assertEqual(cacheable_prefix_tokens(1024, 1024, 128), 1024)
+        self.assertEqual(cacheable_prefix_tokens(1300, 1024, 128), 1280)
+
+
+class TestInstructionComposer(unittest.TestCase):
+    """Tests for InstructionComposer"""
+
+    def setUp(self):
+        self.prefix_tokens = estimate_tokens(
+            f"{ROLE_PLAYING_GUIDELINES}\n\nYou are Eunwoo."
+        )
+        self.composer = InstructionComposer(
+            FancallModelSettings(prompt_max_tokens=self.prefix_tokens + 20)
+        )
+
+    def test_prefix_is_memoized_per_persona_version(self):
+        """Test that jobs of one persona version share the same prefix bytes"""
+        first = self.composer.prefix("persona-1", 1, "You are Eunwoo.")
+        again = self.composer.prefix("persona-1", 1, "You are Eunwoo.")
+        updated = self.composer.prefix("persona-1", 2, "You are Eunwoo!")
+
+        self.assertIs(again, first)
+        self.assertTrue(first.text.startswith(ROLE_PLAYING_GUIDELINES))
+        self.assertTrue(updated.text.endswith("You are Eunwoo!"))
+        self.assertEqual((self.composer.hits, self.composer.misses), (1, 2))
+
+    def test_overridden_prompt_is_memoized_alongside_default(self):
+        """Test that a dispatch-level prompt override does not evict the default"""
+        default = self.composer.prefix("default", None, "You are Eunwoo.")
+        override = self.composer.prefix("default", None, "You are Minji.")
+
+        self.assertIs(self.composer.prefix("default", None, "You are Eunwoo."), default)
+        self.assertIs(self.composer.prefix("default", None, "You are Minji."), override)
+        self.assertTrue(override.text.endswith("You are Minji."))
+        self.assertEqual((self.composer.hits, self.composer.misses), (2, 2))
+
+    def test_context_follows_prefix_within_budget(self):
+        """Test that per-call context comes last and is trimmed to the budget"""
+        memory = "Memory:\n- likes cats\n" + "- detail\n" * 20
+
+        composed = self.composer.compose(
+            "persona-1", 1, "You are Eunwoo.", [memory, "dropped"]
+        )
+
+        prefix = self.composer.prefix("persona-1", 1, "You are Eunwoo.").text
+        self.assertTrue(composed.text.startswith(prefix + "\n\nMemory:\n- likes cats"))
+        self.assertNotIn("dropped", composed.text)
+        self.assertEqual(composed.prefix_tokens, self.prefix_tokens)
+        self.assertLessEqual(composed.tokens, self.prefix_tokens + 20)
+
+    def test_prefix_over_budget_drops_context(self):
+        """Test that the static prefix is never cut, only the context is dropped"""
+        composer = InstructionComposer(FancallModelSettings(prompt_max_tokens=10))
+
+        composed = composer.compose("persona-1", 1, "You are Eunwoo.", ["Memory"])
+
+        self.assertTrue(composed.text.endswith("You are Eunwoo."))
+        self.assertEqual(composed.context_tokens, 0)
+        self.assertEqual(composed.cacheable_tokens, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Unit tests for the agent session lifetime policy
+"""
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+from typing import Any
+
+from livekit import rtc
+from prometheus_client import REGISTRY
+from pydantic import ValidationError
+
+from fancall.agent.lifetime import (
+    REASON_CALLER_LEFT,
+    REASON_IDLE,
+    REASON_MAX_DURATION,
+    REASON_NO_CALLER,
+    SessionReaper,
+)
+from fancall.settings import SessionLifetimeSettings
+
+CALLER_KIND = rtc.ParticipantKind.PARTICIPANT_KIND_STANDARD
+AGENT_KIND = rtc.ParticipantKind.PARTICIPANT_KIND_AGENT
+
+
+def _participant(
+    identity: str, kind: int = CALLER_KIND, attributes: dict[str, str] | None = None
+) -> Any:
+    return SimpleNamespace(identity=identity, kind=kind, attributes=attributes or {})
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _settings(**overrides: Any) -> SessionLifetimeSettings:
+    values: dict[str, Any] = {
+        "max_duration_seconds": {"guest": 5.0, "member": 10.0},
+        "join_timeout_seconds": 5.0,
+        "rejoin_grace_seconds": 0.01,
+    }
+    values.update(overrides)
+    return SessionLifetimeSettings(**values)
+
+
+class TestSessionReaper(unittest.IsolatedAsyncioTestCase):
+    """Tests for SessionReaper"""
+
+    async def _run(self, reaper: SessionReaper) -> str:
+        return await asyncio.wait_for(reaper.run(), timeout=1.0)
+
+    async def test_session_ends_when_last_caller_leaves(self):
+        """Test that the session ends after the rejoin grace, not the tier limit"""
+        reaper = SessionReaper(_settings(), "member")
+        reaper.participant_connected(_participant("fan-1"))
+        reaper.participant_connected(_participant("fan-2"))
+        task = asyncio.create_task(self._run(reaper))
+
+        reaper.participant_disconnected(_participant("fan-1"))
+        await asyncio.sleep(0.05)
+        self.assertFalse(task.done())
+        reaper.participant_disconnected(_participant("fan-2"))
+
+        self.assertEqual(await task, REASON_CALLER_LEFT)
+
+    async def test_rejoin_within_grace_keeps_session(self):
+        """Test that a caller reconnecting within the grace period is not dropped"""
+        reaper = SessionReaper(_settings(rejoin_grace_seconds=0.1), "guest")
+        reaper.participant_connected(_participant("fan"))
+        task = asyncio.create_task(self._run(reaper))
+
+        reaper.participant_disconnected(_participant("fan"))
+        reaper.participant_connected(_participant("fan"))
+        await asyncio.sleep(0.15)
+
+        self.assertFalse(task.done())
+        task.cancel()
+
+    async def test_agents_and_avatars_are_not_callers(self):
+        """Test that only callers keep the session from the join timeout"""
+        reaper = SessionReaper(_settings(join_timeout_seconds=0.01), "guest")
+        reaper.participant_connected(_participant("agent", kind=AGENT_KIND))
+        reaper.participant_connected(
+            _participant("hedra", attributes={"lk.publish_on_behalf": "agent"})
+        )
+
+        self.assertEqual(await self._run(reaper), REASON_NO_CALLER)
+
+    async def test_silence_ends_session(self):
+        """Test that the user turning away ends the session"""
+        reaper = SessionReaper(_settings(), "guest")
+        reaper.participant_connected(_participant("fan"))
+        task = asyncio.create_task(self._run(reaper))
+
+        reaper.user_state_changed("away")
+
+        self.assertEqual(await task, REASON_IDLE)
+
+    async def test_tier_duration_limit(self):
+        """Test per-tier limits, with unknown tiers held to the guest limit"""
+        settings = _settings(max_duration_seconds={"guest": 0.01, "member": 5.0})
+        reaper = SessionReaper(settings, None)
+        reaper.participant_connected(_participant("fan"))
+
+        self.assertEqual(await self._run(reaper), REASON_MAX_DURATION)
+        self.assertEqual(SessionReaper(settings, "member").max_duration, 5.0)
+
+    async def test_report_counts_freed_slot(self):
+        """Test that every job end is counted by tier and reason"""
+        reaper = SessionReaper(_settings(join_timeout_seconds=0.0), "member")
+        labels = {"tier": "member", "reason": REASON_NO_CALLER}
+        before = _sample("fancall_agent_job_slots_freed_total", labels)
+
+        await self._run(reaper)
+        await reaper.report()
+
+        after = _sample("fancall_agent_job_slots_freed_total", labels)
+        self.assertEqual(after, before + 1)
+
+    def test_guest_limit_is_required(self):
+        """Test that the fallback tier must have a duration limit"""
+        with self.assertRaises(ValidationError):
+            SessionLifetimeSettings(max_duration_seconds={"member": 60.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Unit tests for LiveKitService server API pooling
+"""
+
+import unittest
+
+from fancall.schemas import AgentDispatchRequest
+from fancall.services.livekit_service import LiveKitService
+from fancall.testing import FakeLiveKitServer
+
+
+class TestLiveKitServicePooling(unittest.IsolatedAsyncioTestCase):
+    """Tests for the pooled LiveKit API client"""
+
+    async def asyncSetUp(self):
+        self.server = FakeLiveKitServer()
+        await self.server.start()
+        self.service = LiveKitService(self.server.settings())
+
+    async def asyncTearDown(self):
+        await self.service.aclose()
+        await self.server.stop()
+
+    async def test_dispatches_share_one_session(self):
+        """Test that repeated dispatches reuse the pooled session"""
+        first = await self.service.dispatch_agent(AgentDispatchRequest(), "room-1")
+        session = self.service._session
+        second = await self.service.dispatch_agent(AgentDispatchRequest(), "room-2")
+
+        assert first is not None and second is not None
+        self.assertEqual((first.dispatch_id, second.dispatch_id), ("AD_1", "AD_2"))
+        self.assertIs(self.service._session, session)
+        self.assertEqual([d.room for d in self.server.dispatches], ["room-1", "room-2"])
+
+    async def test_reconnects_after_close(self):
+        """Test that a closed session is transparently re-created"""
+        await self.service.dispatch_agent(AgentDispatchRequest(), "room-1")
+        await self.service.aclose()
+
+        response = await self.service.dispatch_agent(AgentDispatchRequest(), "room-1")
+
+        assert response is not None
+        self.assertEqual(len(self.server.dispatches), 2)
+
+    async def test_check_health(self):
+        """Test that health reflects server reachability"""
+        self.assertTrue(await self.service.check_health())
+
+        await self.server.stop()
+
+        self.assertFalse(await self.service.check_health())
+        self.assertIsNone(self.service._session)
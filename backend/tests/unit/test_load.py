@@ -0,0 +1,108 @@
+"""
+Unit tests for the worker load score
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from types import SimpleNamespace
+from typing import Any
+
+from livekit.agents.utils.hw import CPUMonitor
+
+from fancall.agent.load import LoopLagProbe, WorkerLoadMonitor, read_loop_lag
+from fancall.settings import WorkerLoadSettings
+
+
+class FixedCPUMonitor(CPUMonitor):
+    """CPU monitor reporting a fixed utilization"""
+
+    def __init__(self, utilization: float):
+        self.utilization = utilization
+
+    def cpu_count(self) -> float:
+        return 1.0
+
+    def cpu_percent(self, interval: float = 0.5) -> float:
+        time.sleep(interval)
+        return self.utilization
+
+
+def _worker(active_jobs: int) -> Any:
+    return SimpleNamespace(active_jobs=[object()] * active_jobs)
+
+
+class TestWorkerLoadMonitor(unittest.TestCase):
+    """Tests for WorkerLoadMonitor"""
+
+    def setUp(self):
+        self.lag_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.lag_dir)
+        settings = WorkerLoadSettings(
+            max_jobs=4, max_loop_lag_ms=20.0, cpu_sample_seconds=0.001
+        )
+        self.monitor = WorkerLoadMonitor(
+            settings, self.lag_dir, cpu_monitor=FixedCPUMonitor(0.1)
+        )
+
+    def _report_lag(self, job_id: str, lag: float, age: float = 0.0) -> None:
+        path = os.path.join(self.lag_dir, f"{job_id}.lag")
+        with open(path, "w", encoding="utf-8") as lag_file:
+            lag_file.write(str(lag))
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+
+    def test_load_is_the_highest_component(self):
+        """Test that the busiest resource decides the reported load"""
+        self.monitor(_worker(0))
+        time.sleep(0.05)
+
+        scores = self.monitor.components(active_jobs=3)
+        load = self.monitor(_worker(3))
+
+        self.assertEqual(scores["jobs"], 0.75)
+        self.assertAlmostEqual(scores["cpu"], 0.1)
+        self.assertEqual(load, max(scores.values()))
+
+    def test_job_loop_lag_saturates_load(self):
+        """Test that lagging job loops close admission even when CPU looks idle"""
+        self._report_lag("job-1", 0.002)
+        self._report_lag("job-2", 0.030)
+
+        scores = self.monitor.components(active_jobs=1)
+
+        self.assertEqual(scores["loop_lag"], 1.0)
+        self.assertEqual(self.monitor(_worker(1)), 1.0)
+
+    def test_stale_lag_reports_are_ignored(self):
+        """Test that reports left behind by ended jobs do not count"""
+        self._report_lag("job-1", 0.010, age=60.0)
+        self._report_lag("job-2", 0.005)
+
+        self.assertEqual(read_loop_lag(self.lag_dir), 0.005)
+
+
+class TestLoopLagProbe(unittest.IsolatedAsyncioTestCase):
+    """Tests for LoopLagProbe"""
+
+    async def test_blocked_loop_is_reported_and_withdrawn(self):
+        """Test that a blocking call shows up as lag and shutdown removes the report"""
+        with tempfile.TemporaryDirectory() as lag_dir:
+            # Wakes at 0.05 s (late: ~0.055 s), reports at 0.155 s and 0.255 s
+            probe = LoopLagProbe(lag_dir, "job-1", interval=0.05, report_every=2)
+            probe.start()
+            await asyncio.sleep(0.005)
+            time.sleep(0.1)  # blocks the event loop
+            await asyncio.sleep(0.095)
+
+            self.assertGreaterEqual(read_loop_lag(lag_dir), 0.04)
+
+            await probe.aclose()
+            self.assertEqual(os.listdir(lag_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
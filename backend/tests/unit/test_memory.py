@@ -0,0 +1,126 @@
+"""
+Unit tests for long-term conversation memory
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from aioia_core.models import Base
+from aioia_core.settings import DatabaseSettings
+from livekit.agents.llm import ChatContext
+from sqlalchemy import create_engine
+
+from fancall.agent.memory import (
+    MEMORY_HEADER,
+    ConversationMemoryStore,
+    SessionMemory,
+    format_transcript,
+)
+from fancall.settings import ConversationMemorySettings
+from fancall.testing.agent_plugins import FakeLLM, PluginTiming
+
+FAST_LLM = PluginTiming(llm_ttft=0.0, llm_tokens_per_second=10_000.0)
+
+
+def _chat(*turns: tuple[str, str]) -> ChatContext:
+    chat_ctx = ChatContext.empty()
+    chat_ctx.add_message(role="system", content="You are Eunwoo.")
+    for role, text in turns:
+        chat_ctx.add_message(role=role, content=text)  # type: ignore[arg-type]
+    return chat_ctx
+
+
+class TestTranscript(unittest.TestCase):
+    """Tests for the session transcript"""
+
+    def test_transcript_keeps_most_recent_messages(self):
+        """Test that older messages are dropped first and user turns counted"""
+        chat_ctx = _chat(
+            ("user", "first message " * 20),
+            ("assistant", "Hi."),
+            ("user", "I passed my exam!"),
+        )
+
+        transcript, user_turns = format_transcript(chat_ctx, max_tokens=20)
+
+        self.assertEqual(transcript, "You: Hi.\nUser: I passed my exam!")
+        self.assertEqual(user_turns, 2)
+
+
+class TestSessionMemory(unittest.IsolatedAsyncioTestCase):
+    """Tests for SessionMemory on a SQLite database"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        url = f"sqlite:///{Path(self.tmp_dir) / 'fancall.db'}"
+        engine = create_engine(url)
+        Base.metadata.create_all(engine)
+        engine.dispose()
+        self.store = ConversationMemoryStore(DatabaseSettings(url=url))
+        self.settings = ConversationMemorySettings(summary_max_tokens=50)
+
+    async def _session(self) -> SessionMemory:
+        memory = SessionMemory(self.store, self.settings, "user-1", "default")
+        memory.start_loading()
+        return memory
+
+    async def test_session_summary_is_loaded_by_next_session(self):
+        """Test that a finished session's summary reaches the next session"""
+        first = await self._session()
+        self.assertIsNone(await first.context())
+        await first.remember(
+            _chat(("user", "My dog is Bori.")), FakeLLM(FAST_LLM, reply="- dog: Bori")
+        )
+
+        second = await self._session()
+        context = await second.context()
+
+        self.assertEqual(context, f"{MEMORY_HEADER}\n- dog: Bori")
+        assert second.memory is not None
+        self.assertEqual(second.memory.session_count, 1)
+
+    async def test_summary_is_replaced_within_budget(self):
+        """Test that memory is one rolling summary, cut to the token budget"""
+        for reply in ("- short", "- long " * 100):
+            memory = await self._session()
+            await memory.context()
+            await memory.remember(_chat(("user", "Hi")), FakeLLM(FAST_LLM, reply))
+
+        saved = await self.store.load("user-1", "default")
+
+        assert saved is not None
+        self.assertEqual(saved.session_count, 2)
+        self.assertLessEqual(saved.summary_tokens, 50)
+        self.assertTrue(saved.summary.startswith("- long"))
+
+    async def test_failed_load_keeps_stored_summary(self):
+        """Test that a session whose memory failed to load does not overwrite it"""
+        first = await self._session()
+        await first.context()
+        await first.remember(_chat(("user", "Hi")), FakeLLM(FAST_LLM, "- dog: Bori"))
+
+        with patch.object(self.store, "load", side_effect=OSError("timed out")):
+            second = await self._session()
+            self.assertIsNone(await second.context())
+        await second.remember(_chat(("user", "Hi")), FakeLLM(FAST_LLM, "- new"))
+
+        saved = await self.store.load("user-1", "default")
+        assert saved is not None
+        self.assertEqual((saved.summary, saved.session_count), ("- dog: Bori", 1))
+
+    async def test_session_without_user_turns_is_not_remembered(self):
+        """Test that a call where the user never spoke leaves memory untouched"""
+        memory = await self._session()
+        await memory.context()
+
+        await memory.remember(_chat(("assistant", "Hello?")), FakeLLM(FAST_LLM))
+
+        self.assertIsNone(await self.store.load("user-1", "default"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Unit tests for the Prometheus metrics surface
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from aioia_core.errors import RESOURCE_NOT_FOUND
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from main import create_app
+
+TOKEN_ROUTE = "/live-rooms/{room_id}/token"
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestMetrics(unittest.TestCase):
+    """Tests for /metrics and the instrumented routes"""
+
+    def setUp(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        env = {
+            "DATABASE_URL": f"sqlite:///{Path(tmp_dir) / 'fancall.db'}",
+            "FANCALL_API_CREATE_SCHEMA": "true",
+        }
+        with patch.dict(os.environ, env):
+            self.client = TestClient(create_app())
+        self.client.__enter__()  # pylint: disable=unnecessary-dunder-call
+        self.addCleanup(self.client.__exit__, None, None, None)
+
+    def test_route_latency_is_labelled_by_template(self):
+        """Test that requests are recorded under the route template and status"""
+        before = _sample(
+            "fancall_http_request_duration_seconds_count",
+            method="POST",
+            route=TOKEN_ROUTE,
+            status="200",
+        )
+        db_before = _sample(
+            "fancall_db_operation_duration_seconds_count", operation="create"
+        )
+
+        room_id = self.client.post("/live-rooms").json()["data"]["id"]
+        self.client.post(f"/live-rooms/{room_id}/token")
+
+        self.assertEqual(
+            _sample(
+                "fancall_http_request_duration_seconds_count",
+                method="POST",
+                route=TOKEN_ROUTE,
+                status="200",
+            ),
+            before + 1,
+        )
+        self.assertEqual(
+            _sample("fancall_db_operation_duration_seconds_count", operation="create"),
+            db_before + 1,
+        )
+        self.assertEqual(
+            _sample(
+                "fancall_http_requests_in_progress", method="POST", route=TOKEN_ROUTE
+            ),
+            0,
+        )
+
+    def test_errors_are_counted_by_aioia_code(self):
+        """Test that handled errors increment the counter of their error code"""
+        before = _sample(
+            "fancall_api_errors_total", code=RESOURCE_NOT_FOUND, status="404"
+        )
+
+        response = self.client.post("/live-rooms/missing/token")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(
+            _sample("fancall_api_errors_total", code=RESOURCE_NOT_FOUND, status="404"),
+            before + 1,
+        )
+
+    def test_metrics_endpoint_exposes_text_format(self):
+        """Test that /metrics serves the Prometheus exposition format"""
+        self.client.post("/live-rooms")
+
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        self.assertIn("fancall_http_request_duration_seconds_bucket", response.text)
+        self.assertIn("fancall_token_signing_duration_seconds", response.text)
@@ -0,0 +1,165 @@
+"""
+Unit tests for the persona registry (repository versions, worker-side cache)
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+from aioia_core.models import Base
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from fancall.agent.persona_registry import PersonaRegistry
+from fancall.persona import Persona, merge_personas, resolve_persona
+from fancall.repositories.persona_repository import DatabasePersonaRepository
+from fancall.schemas import PersonaCreate, PersonaUpdate, RegisteredPersona
+from fancall.settings import PersonaCacheSettings
+
+
+class FakePersonaStore:
+    """In-memory persona loader counting loads"""
+
+    def __init__(self):
+        self.personas: dict[str, RegisteredPersona] = {}
+        self.loads = 0
+
+    def save(self, persona_id: str, version: int, system_prompt: str) -> None:
+        """Store a persona version"""
+        now = datetime.now(timezone.utc)
+        self.personas[persona_id] = RegisteredPersona(
+            id=persona_id,
+            version=version,
+            system_prompt=system_prompt,
+            created_at=now,
+            updated_at=now,
+        )
+
+    async def __call__(self, persona_id: str) -> RegisteredPersona | None:
+        self.loads += 1
+        return self.personas.get(persona_id)
+
+
+class TestPersonaRegistry(unittest.IsolatedAsyncioTestCase):
+    """Tests for PersonaRegistry"""
+
+    def setUp(self):
+        self.store = FakePersonaStore()
+        self.store.save("eunwoo", 1, "v1")
+        self.registry = PersonaRegistry(PersonaCacheSettings(), self.store)
+
+    async def test_cached_version_is_not_loaded_again(self):
+        """Test that a dispatch of a cached version is served from memory"""
+        first = await self.registry.resolve("eunwoo", 1)
+        second = await self.registry.resolve("eunwoo", 1)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.store.loads, 1)
+        self.assertEqual(self.registry.memory_hits, 1)
+
+    async def test_new_version_is_loaded(self):
+        """Test that an updated persona replaces the cached version"""
+        await self.registry.resolve("eunwoo", 1)
+        self.store.save("eunwoo", 2, "v2")
+
+        persona = await self.registry.resolve("eunwoo", 2)
+
+        assert persona is not None
+        self.assertEqual(persona.system_prompt, "v2")
+        self.assertEqual(self.store.loads, 2)
+
+    async def test_unversioned_reference_is_always_loaded(self):
+        """Test that without a version the cache cannot be trusted"""
+        await self.registry.resolve("eunwoo", None)
+        await self.registry.resolve("eunwoo", None)
+
+        self.assertEqual(self.store.loads, 2)
+
+    async def test_unknown_persona(self):
+        """Test that an unknown persona resolves to None"""
+        self.assertIsNone(await self.registry.resolve("missing", 1))
+
+    async def test_disk_tier_is_shared_across_processes(self):
+        """Test that another registry on the same directory skips the load"""
+        with tempfile.TemporaryDirectory() as disk_dir:
+            settings = PersonaCacheSettings(disk_dir=disk_dir)
+            await PersonaRegistry(settings, self.store).resolve("eunwoo", 1)
+            other = PersonaRegistry(settings, self.store)
+
+            persona = await other.resolve("eunwoo", 1)
+
+            assert persona is not None
+            self.assertEqual(persona.system_prompt, "v1")
+            self.assertEqual(self.store.loads, 1)
+            self.assertEqual(other.disk_hits, 1)
+
+    async def test_memory_tier_is_bounded(self):
+        """Test that the least recently used persona is evicted"""
+        registry = PersonaRegistry(PersonaCacheSettings(max_entries=1), self.store)
+        self.store.save("other", 1, "other")
+
+        await registry.resolve("eunwoo", 1)
+        await registry.resolve("other", 1)
+        await registry.resolve("eunwoo", 1)
+
+        self.assertEqual(self.store.loads, 3)
+
+
+class TestPersonaRepository(unittest.TestCase):
+    """Tests for DatabasePersonaRepository"""
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.db_session = sessionmaker(bind=self.engine)()
+        self.repository = DatabasePersonaRepository(self.db_session)
+
+    def tearDown(self):
+        self.db_session.close()
+        self.engine.dispose()
+
+    def test_update_increments_version(self):
+        """Test that every update produces a new version"""
+        persona = self.repository.create(
+            PersonaCreate(voice_id="voice_1", greetings=["Hi."])
+        )
+        self.assertEqual(persona.version, 1)
+
+        updated = self.repository.update(persona.id, PersonaUpdate(voice_id="voice_2"))
+
+        assert updated is not None
+        self.assertEqual(updated.version, 2)
+        self.assertEqual(updated.greetings, ["Hi."])
+        self.assertEqual(self.repository.get_version(persona.id), 2)
+        self.assertIsNone(self.repository.get_version("missing"))
+
+
+class TestMergePersonas(unittest.TestCase):
+    """Tests for merge_personas"""
+
+    def test_first_persona_setting_a_field_wins(self):
+        """Test dispatch metadata > registered persona > default precedence"""
+        merged = merge_personas(
+            Persona(voice_id="inline"),
+            Persona(voice_id="registered", system_prompt="registered"),
+            Persona(voice_id="default", system_prompt="default", avatar_id="a"),
+        )
+
+        self.assertEqual(
+            merged,
+            Persona(voice_id="inline", system_prompt="registered", avatar_id="a"),
+        )
+
+    def test_registered_persona_does_not_inherit_default_greetings(self):
+        """Test that only unregistered jobs fall back to the default greetings"""
+        default = Persona(voice_id="default", greetings=["Hi."])
+
+        registered = resolve_persona(Persona(), Persona(voice_id="r"), default)
+        unregistered = resolve_persona(Persona(), None, default)
+
+        self.assertIsNone(registered.greetings)
+        self.assertEqual(unregistered.greetings, ["Hi."])
+
+
+if __name__ == "__main__":
+    unittest.main()
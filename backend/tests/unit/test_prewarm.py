@@ -0,0 +1,118 @@
+"""
+Unit tests for the worker prewarm stage
+"""
+
+import shutil
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aioia_core.settings import DatabaseSettings, FishAudioSettings, HedraSettings
+from livekit.agents import JobExecutorType, JobProcess
+
+from fancall.agent.prewarm import WorkerResources, get_worker_resources, prewarm
+from fancall.persona import Persona
+from fancall.settings import (
+    AssetHttpSettings,
+    AvatarCacheSettings,
+    FancallModelSettings,
+    PersonaCacheSettings,
+    TtsCacheSettings,
+    TtsSegmentationSettings,
+)
+
+PERSONA = Persona(voice_id="voice_default", system_prompt="You are Eunwoo.")
+
+
+def _prewarm(
+    proc: JobProcess,
+    default_persona: Persona = PERSONA,
+    tts_cache_settings: TtsCacheSettings | None = None,
+) -> None:
+    prewarm(
+        proc,
+        default_persona=default_persona,
+        fish_settings=FishAudioSettings(api_key="fish-key"),
+        hedra_settings=HedraSettings(enabled=False),
+        database_settings=DatabaseSettings(),
+        persona_cache_settings=PersonaCacheSettings(),
+        model_settings=FancallModelSettings(),
+        avatar_cache_settings=AvatarCacheSettings(),
+        asset_http_settings=AssetHttpSettings(),
+        tts_cache_settings=tts_cache_settings or TtsCacheSettings(),
+        segmentation_settings=TtsSegmentationSettings(),
+    )
+
+
+@patch.object(WorkerResources, "create_llm", side_effect=MagicMock)
+@patch.object(WorkerResources, "create_tts", side_effect=lambda voice_id: MagicMock())
+class TestPrewarm(unittest.TestCase):
+    """Tests for prewarm and WorkerResources"""
+
+    def setUp(self):
+        self.proc = JobProcess(
+            executor_type=JobExecutorType.THREAD, user_arguments=None, http_proxy=None
+        )
+
+    def test_prewarm_stores_resources_in_userdata(self, create_tts, create_llm):
+        """Test that prewarm builds LLM and default TTS once per process"""
+        _prewarm(self.proc)
+
+        resources = get_worker_resources(self.proc)
+        self.assertIs(resources.get_llm(), resources.get_llm())
+        create_llm.assert_called_once_with()
+        create_tts.assert_called_once_with("voice_default")
+
+    def test_default_voice_reuses_prewarmed_tts(self, create_tts, _create_llm):
+        """Test that only non-default voices construct a new TTS in the job"""
+        _prewarm(self.proc)
+        resources = get_worker_resources(self.proc)
+
+        self.assertIs(
+            resources.get_tts("voice_default"), resources.get_tts("voice_default")
+        )
+        resources.get_tts("voice_other")
+
+        create_tts.assert_called_with("voice_other")
+        self.assertEqual(create_tts.call_count, 2)
+
+    def test_default_instructions_are_precomposed(self, _create_tts, _create_llm):
+        """Test that the default prompt reuses the prewarmed instructions prefix"""
+        _prewarm(self.proc)
+        resources = get_worker_resources(self.proc)
+
+        instructions = resources.get_instructions("You are Eunwoo.")
+
+        self.assertTrue(instructions.text.endswith("You are Eunwoo."))
+        self.assertEqual(resources.instruction_composer.hits, 1)
+        self.assertIn("Other persona", resources.get_instructions("Other persona").text)
+
+    def test_greetings_are_presynthesized_only_to_disk(self, _create_tts, _create_llm):
+        """Test that greetings cost TTS calls at prewarm only with the disk tier"""
+        persona = PERSONA.model_copy(update={"greetings": ["Hi."]})
+        disk_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, disk_dir)
+
+        with patch.object(
+            WorkerResources, "presynthesize_greetings", new_callable=AsyncMock
+        ) as presynthesize:
+            _prewarm(self.proc, persona)
+            presynthesize.assert_not_called()
+
+            _prewarm(self.proc, persona, TtsCacheSettings(disk_dir=disk_dir))
+            presynthesize.assert_awaited_once()
+
+    def test_warm_up_failure_is_deferred_to_job(self, _create_tts, create_llm):
+        """Test that prewarm survives client errors and the job retries them"""
+        create_llm.side_effect = [ValueError("missing key"), MagicMock()]
+
+        _prewarm(self.proc)
+        resources = get_worker_resources(self.proc)
+
+        self.assertIsNotNone(resources.get_llm())
+        self.assertEqual(create_llm.call_count, 2)
+
+    def test_missing_prewarm_fails_fast(self, _create_tts, _create_llm):
+        """Test that a job without prewarmed resources is an invariant violation"""
+        with self.assertRaises(AssertionError):
+            get_worker_resources(self.proc)
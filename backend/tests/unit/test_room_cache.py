@@ -0,0 +1,63 @@
+"""
+Unit tests for the room existence cache
+"""
+
+import unittest
+from unittest.mock import patch
+
+from fancall.services.room_cache import RoomExistenceCache
+from fancall.settings import RoomCacheSettings
+
+
+class TestRoomExistenceCache(unittest.TestCase):
+    """Tests for RoomExistenceCache"""
+
+    def setUp(self):
+        self.cache = RoomExistenceCache(
+            RoomCacheSettings(ttl_seconds=60, negative_ttl_seconds=2, max_entries=2)
+        )
+
+    def test_hits_and_misses_are_counted(self):
+        """Test that lookups count hits and misses"""
+        self.assertIsNone(self.cache.get("room-1"))
+        self.cache.put("room-1", True)
+        self.cache.put("room-2", False)
+
+        self.assertTrue(self.cache.get("room-1"))
+        self.assertFalse(self.cache.get("room-2"))
+        self.assertEqual(
+            self.cache.stats(),
+            {"hits": 2, "misses": 1, "hit_ratio": 2 / 3, "entries": 2},
+        )
+
+    @patch("fancall.services.room_cache.time.monotonic")
+    def test_negative_entries_expire_first(self, monotonic):
+        """Test that unknown rooms are only cached for the negative TTL"""
+        monotonic.return_value = 100.0
+        self.cache.put("room-1", True)
+        self.cache.put("room-2", False)
+
+        monotonic.return_value = 103.0
+
+        self.assertTrue(self.cache.get("room-1"))
+        self.assertIsNone(self.cache.get("room-2"))
+
+    def test_invalidate_and_capacity(self):
+        """Test that invalidation drops entries and capacity evicts the LRU entry"""
+        self.cache.put("room-1", True)
+        self.cache.put("room-2", True)
+        self.cache.get("room-1")
+        self.cache.put("room-3", True)
+
+        self.assertIsNone(self.cache.get("room-2"))
+        self.cache.invalidate("room-1")
+        self.assertIsNone(self.cache.get("room-1"))
+        self.assertTrue(self.cache.get("room-3"))
+
+    def test_zero_ttl_disables_entries(self):
+        """Test that a zero TTL stores nothing"""
+        cache = RoomExistenceCache(RoomCacheSettings(negative_ttl_seconds=0))
+
+        cache.put("room-1", False)
+
+        self.assertIsNone(cache.get("room-1"))
@@ -0,0 +1,116 @@
+"""
+Unit tests for LLM-to-TTS text segmentation
+"""
+
+import asyncio
+import unittest
+
+from livekit.agents import tts
+
+from fancall.agent.segmentation import (
+    MixedSentenceTokenizer,
+    create_sentence_tokenizer,
+    segment_tts,
+    spoken_length,
+)
+from fancall.settings import TtsSegmentationSettings
+from fancall.testing.agent_plugins import FakeTTS, PluginTiming
+
+
+async def _segments(tokenizer: MixedSentenceTokenizer, chunks: list[str]):
+    """Stream chunks into a sentence stream; return (seconds, segment) pairs."""
+    stream = tokenizer.stream()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    async def feed() -> None:
+        for chunk in chunks:
+            stream.push_text(chunk)
+            await asyncio.sleep(0.01)
+        stream.end_input()
+
+    feed_task = asyncio.create_task(feed())
+    segments = [(loop.time() - start, data.token) async for data in stream]
+    await feed_task
+    return segments
+
+
+class TestSegmentation(unittest.IsolatedAsyncioTestCase):
+    """Tests for MixedSentenceTokenizer"""
+
+    def setUp(self):
+        self.tokenizer = MixedSentenceTokenizer(TtsSegmentationSettings())
+
+    def test_spoken_length_weighs_hangul(self):
+        """Test that Hangul syllables count double and spaces not at all"""
+        self.assertEqual(spoken_length("hi 안녕"), 6)
+
+    def test_tokenize_mixed_text(self):
+        """Test sentence ends, merged short sentences and removed actions"""
+        segments = self.tokenizer.tokenize(
+            "*blushes* Dr. Kim said 3.5 hours. 응. 좋아~ 내일 봐요. "
+            "오늘 공연 어땠어요? 저는 조금 긴장했어요."
+        )
+
+        self.assertEqual(
+            segments,
+            [
+                "Dr. Kim said 3.5 hours. 응. 좋아~",
+                "내일 봐요. 오늘 공연 어땠어요?",
+                "저는 조금 긴장했어요.",
+            ],
+        )
+
+    async def test_first_segment_ends_at_clause(self):
+        """Test that the first segment is released at a comma, later ones at sentences"""
+        segments = await _segments(
+            self.tokenizer,
+            ["*웃으며* ", "안녕하세요, ", "팬 ", "여러분! ", "오늘 와줘서 고마워요."],
+        )
+
+        self.assertEqual(
+            [segment for _, segment in segments],
+            ["안녕하세요,", "팬 여러분! 오늘 와줘서 고마워요."],
+        )
+
+    async def test_first_segment_budget(self):
+        """Test that words are released when no boundary arrives within the budget"""
+        tokenizer = MixedSentenceTokenizer(
+            TtsSegmentationSettings(first_chunk_budget=0.05)
+        )
+        words = "I was just thinking about the concert last week and".split()
+
+        segments = await _segments(tokenizer, [f"{word} " for word in words])
+
+        first_at, first = segments[0]
+        self.assertLess(first_at, 0.09)
+        self.assertTrue("I was just thinking about".startswith(first))
+        self.assertEqual(" ".join(s for _, s in segments), " ".join(words))
+
+    async def test_segmented_tts_synthesizes_each_segment(self):
+        """Test that the session TTS streams audio for every segment"""
+        timing = PluginTiming(tts_ttfb=0.01, tts_realtime_factor=0.01)
+        session_tts = segment_tts(FakeTTS(timing), self.tokenizer)
+
+        self.assertIsInstance(session_tts, tts.StreamAdapter)
+        async with session_tts.stream() as stream:
+            stream.push_text("안녕하세요, 팬 여러분! 오늘 와줘서 고마워요.")
+            stream.end_input()
+            frames = [audio.frame async for audio in stream]
+
+        self.assertGreater(sum(frame.duration for frame in frames), 0)
+
+    def test_provider_segmenter_keeps_tts(self):
+        """Test that the provider segmenter leaves the TTS unwrapped"""
+        provider_tts = FakeTTS(PluginTiming())
+
+        tokenizer = create_sentence_tokenizer(
+            TtsSegmentationSettings(segmenter="provider")
+        )
+
+        self.assertIsNone(tokenizer)
+        self.assertIs(segment_tts(provider_tts, tokenizer), provider_tts)
+
+
+if __name__ == "__main__":
+    unittest.main()
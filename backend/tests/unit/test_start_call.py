@@ -0,0 +1,218 @@
+"""
+Unit tests for the one-shot start call endpoint
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import jwt
+from aioia_core.models import Base
+from aioia_core.settings import DatabaseSettings, JWTSettings
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
+
+from fancall.api.router import create_fancall_router
+from fancall.database import create_async_db_engine, create_async_session_factory
+from fancall.factories import AsyncLiveRoomRepositoryFactory, LiveRoomRepositoryFactory
+from fancall.repositories.live_room_repository import (
+    AsyncDatabaseLiveRoomRepository,
+    DatabaseLiveRoomRepository,
+)
+from fancall.repositories.persona_repository import DatabasePersonaRepository
+from fancall.schemas import AgentDispatchRequest, PersonaCreate, PersonaUpdate
+from fancall.services.livekit_service import LiveKitService
+from fancall.services.room_cache import RoomExistenceCache
+from fancall.settings import RoomCacheSettings
+from fancall.testing import FakeLiveKitServer
+
+
+class TestStartCall(unittest.IsolatedAsyncioTestCase):
+    """Tests for POST /live-rooms/start-call"""
+
+    async def asyncSetUp(self):
+        self.livekit_server = FakeLiveKitServer()
+        await self.livekit_server.start()
+
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        url = f"sqlite:///{Path(tmp_dir) / 'fancall.db'}"
+        self.engine = create_engine(url)
+        Base.metadata.create_all(self.engine)
+        self.db_session_factory = sessionmaker(bind=self.engine)
+        self.async_engine = create_async_db_engine(DatabaseSettings(url=url))
+
+        self.livekit_service = LiveKitService(self.livekit_server.settings())
+        self.room_cache = RoomExistenceCache(RoomCacheSettings())
+        self.client = self._client(
+            AsyncLiveRoomRepositoryFactory(
+                create_async_session_factory(self.async_engine)
+            )
+        )
+
+    def _client(
+        self, async_repository_factory: AsyncLiveRoomRepositoryFactory | None
+    ) -> httpx.AsyncClient:
+        """Client of an app on the async database, or on the threaded fallback"""
+        livekit_settings = self.livekit_server.settings()
+        app = FastAPI()
+        app.include_router(
+            create_fancall_router(
+                livekit_settings=livekit_settings,
+                jwt_settings=JWTSettings(secret_key=None),
+                db_session_factory=self.db_session_factory,
+                repository_factory=LiveRoomRepositoryFactory(self.db_session_factory),
+                async_repository_factory=async_repository_factory,
+                livekit_service=self.livekit_service,
+                room_cache=self.room_cache,
+            )
+        )
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        )
+        self.addAsyncCleanup(client.aclose)
+        return client
+
+    def _room_count(self) -> int:
+        with self.db_session_factory() as db_session:
+            _, total = DatabaseLiveRoomRepository(db_session).get_all()
+        return total
+
+    def _create_persona(self) -> str:
+        with self.db_session_factory() as db_session:
+            repository = DatabasePersonaRepository(db_session)
+            persona = repository.create(
+                PersonaCreate(system_prompt="You are Eunwoo." * 100)
+            )
+            repository.update(persona.id, PersonaUpdate(voice_id="voice_2"))
+        return persona.id
+
+    async def asyncTearDown(self):
+        await self.livekit_service.aclose()
+        await self.async_engine.dispose()
+        self.engine.dispose()
+        await self.livekit_server.stop()
+
+    async def test_start_call_returns_room_token_and_dispatch(self):
+        """Test that one request creates, authorizes and dispatches the same room"""
+        response = await self.client.post(
+            "/live-rooms/start-call", json={"systemPrompt": "You are Eunwoo."}
+        )
+
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        room_id = body["room"]["id"]
+        self.assertEqual(body["token"]["roomName"], room_id)
+        self.assertEqual(body["dispatch"]["roomName"], room_id)
+        dispatch = self.livekit_server.dispatches[0]
+        self.assertEqual(body["dispatch"]["dispatchId"], dispatch.id)
+        self.assertIn("You are Eunwoo.", dispatch.metadata)
+
+        claims = jwt.decode(body["token"]["token"], options={"verify_signature": False})
+        self.assertEqual(claims["video"]["room"], room_id)
+        self.assertTrue(claims["sub"].startswith("guest-"))
+        with self.db_session_factory() as db_session:
+            self.assertIsNotNone(
+                DatabaseLiveRoomRepository(db_session).get_by_id(room_id)
+            )
+        self.assertTrue(self.room_cache.get(room_id))
+
+    async def test_registered_persona_is_dispatched_by_reference(self):
+        """Test that metadata carries the persona ID and version, not its content"""
+        persona_id = self._create_persona()
+
+        response = await self.client.post(
+            "/live-rooms/start-call", json={"personaId": persona_id}
+        )
+
+        self.assertEqual(response.status_code, 201)
+        metadata = self.livekit_server.dispatches[0].metadata
+        self.assertNotIn("You are Eunwoo.", metadata)
+        self.assertEqual(
+            AgentDispatchRequest.model_validate_json(metadata),
+            AgentDispatchRequest(
+                persona_id=persona_id, persona_version=2, session_tier="guest"
+            ),
+        )
+
+    async def test_session_tier_is_set_by_server(self):
+        """Test that a client cannot pick its own session lifetime tier"""
+        response = await self.client.post(
+            "/live-rooms/start-call", json={"sessionTier": "member"}
+        )
+
+        self.assertEqual(response.status_code, 201)
+        metadata = self.livekit_server.dispatches[0].metadata
+        self.assertEqual(
+            AgentDispatchRequest.model_validate_json(metadata).session_tier, "guest"
+        )
+
+    async def test_forged_persona_version_is_cleared(self):
+        """Test that a client cannot pick a persona version without a persona"""
+        response = await self.client.post(
+            "/live-rooms/start-call", json={"personaVersion": 7, "userId": "admin"}
+        )
+
+        self.assertEqual(response.status_code, 201)
+        metadata = AgentDispatchRequest.model_validate_json(
+            self.livekit_server.dispatches[0].metadata
+        )
+        self.assertIsNone(metadata.persona_version)
+        self.assertIsNone(metadata.user_id)
+
+    async def test_unknown_persona_is_not_dispatched(self):
+        """Test that a dispatch referring to an unknown persona is rejected"""
+        response = await self.client.post(
+            "/live-rooms/start-call", json={"personaId": "missing"}
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.livekit_server.dispatches, [])
+        self.assertEqual(self._room_count(), 0)
+
+    async def test_failed_room_insert_deletes_dispatch(self):
+        """Test that an agent dispatched to a room that was not stored is removed"""
+        with patch.object(
+            AsyncDatabaseLiveRoomRepository,
+            "create",
+            side_effect=SQLAlchemyError("insert failed"),
+        ):
+            with self.assertRaises(SQLAlchemyError):
+                await self.client.post("/live-rooms/start-call", json={})
+
+        self.assertEqual(self.livekit_server.dispatches, [])
+
+    async def test_token_failure_leaves_no_room_or_dispatch(self):
+        """Test that a call whose token cannot be issued leaves nothing behind"""
+        with patch.object(self.livekit_service, "generate_token", return_value=None):
+            response = await self.client.post("/live-rooms/start-call", json={})
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.livekit_server.dispatches, [])
+        self.assertEqual(self._room_count(), 0)
+
+    async def test_threaded_fallback_with_registered_persona(self):
+        """Test start call on the synchronous database in the threadpool"""
+        client = self._client(async_repository_factory=None)
+
+        response = await client.post(
+            "/live-rooms/start-call", json={"personaId": self._create_persona()}
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(self.livekit_server.dispatches), 1)
+        self.assertEqual(self._room_count(), 1)
+
+    async def test_dispatch_failure_keeps_room(self):
+        """Test that a failed dispatch surfaces as an error after the room is stored"""
+        self.livekit_server.fail_next(code="internal")
+
+        with self.assertRaises(Exception):
+            await self.client.post("/live-rooms/start-call", json={})
+
+        self.assertEqual(self._room_count(), 1)
@@ -0,0 +1,99 @@
+"""
+Unit tests for the agent session timeline
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from prometheus_client import REGISTRY
+
+from fancall.agent.timeline import SessionTimeline
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestSessionTimeline(unittest.TestCase):
+    """Tests for SessionTimeline"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.timeline = SessionTimeline("room-1", "job-1", clock=self.clock)
+
+    def test_stages_and_events_are_relative_to_job_entry(self):
+        """Test that stage offsets, durations and first events are recorded"""
+        self.clock.now += 0.5
+        with self.timeline.stage("connect"):
+            self.clock.now += 0.25
+        self.clock.now += 1.0
+        self.timeline.mark("first_llm_token")
+        self.clock.now += 1.0
+        self.timeline.mark("first_llm_token")
+
+        record = self.timeline.to_record()
+
+        self.assertEqual(record["stages"]["connect"], {"start": 0.5, "duration": 0.25})
+        self.assertEqual(record["events"], {"first_llm_token": 1.75})
+        self.assertEqual(record["elapsed"], 2.75)
+
+    def test_stage_is_recorded_when_it_raises(self):
+        """Test that a failing stage still records its duration"""
+        with self.assertRaises(ValueError):
+            with self.timeline.stage("avatar_image"):
+                self.clock.now += 2.0
+                raise ValueError("bad image")
+
+        self.assertEqual(self.timeline.stages["avatar_image"], (0.0, 2.0))
+
+    def test_breakdown_is_included_in_record(self):
+        """Test that sub-stage durations are recorded under their stage"""
+        self.timeline.breakdown("avatar_image", {"decode": 0.123456, "resize": 0.01})
+
+        record = self.timeline.to_record()
+
+        self.assertEqual(
+            record["breakdowns"], {"avatar_image": {"decode": 0.1235, "resize": 0.01}}
+        )
+
+    def test_export_observes_histograms_and_appends_once(self):
+        """Test that export feeds histograms and writes one JSON line"""
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        path = Path(tmp_dir) / "timelines.jsonl"
+        before = _sample("fancall_agent_session_stage_seconds_count", stage="connect")
+        with self.timeline.stage("connect"):
+            self.clock.now += 0.1
+        self.timeline.mark("first_tts_audio")
+
+        record = self.timeline.export(str(path), shutdown_reason="done")
+        self.timeline.export(str(path), shutdown_reason="done")
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0]), record)
+        self.assertEqual(record["shutdown_reason"], "done")
+        self.assertEqual(
+            _sample("fancall_agent_session_stage_seconds_count", stage="connect"),
+            before + 1,
+        )
+        self.assertGreater(
+            _sample(
+                "fancall_agent_session_event_offset_seconds_count",
+                event="first_tts_audio",
+            ),
+            0,
+        )
@@ -0,0 +1,79 @@
+"""
+Unit tests for the LiveKit token signer
+"""
+
+import unittest
+
+import jwt
+from livekit import api
+
+from fancall.services.token_signer import TokenGrant, TokenSigner
+
+API_KEY = "devkey"
+API_SECRET = "secret-that-is-long-enough-for-hs256-signing"
+
+
+class TestTokenSigner(unittest.TestCase):
+    """Tests for TokenSigner"""
+
+    def setUp(self):
+        self.signer = TokenSigner(API_KEY, API_SECRET)
+
+    def test_token_verifies_with_livekit_verifier(self):
+        """Test that signed tokens are accepted by LiveKit's own verifier"""
+        token = self.signer.sign(TokenGrant("user-1", "Fan", "room-1"))
+
+        claims = api.TokenVerifier(API_KEY, API_SECRET).verify(token)
+
+        self.assertEqual(claims.identity, "user-1")
+        self.assertEqual(claims.name, "Fan")
+        assert claims.video is not None
+        self.assertTrue(claims.video.room_join)
+        self.assertEqual(claims.video.room, "room-1")
+
+    def test_claims_match_access_token_builder(self):
+        """Test that claims equal the api.AccessToken builder output"""
+        expected = (
+            api.AccessToken(API_KEY, API_SECRET)
+            .with_identity("user-1")
+            .with_name("Fan")
+            .with_grants(
+                api.VideoGrants(
+                    room_join=True,
+                    room="room-1",
+                    can_publish=True,
+                    can_subscribe=True,
+                )
+            )
+            .to_jwt()
+        )
+        actual = self.signer.sign(TokenGrant("user-1", "Fan", "room-1"))
+
+        def decode(token: str) -> dict:
+            claims = jwt.decode(token, API_SECRET, algorithms=["HS256"])
+            claims.pop("nbf")
+            claims.pop("exp")
+            return claims
+
+        self.assertEqual(decode(actual), decode(expected))
+
+    def test_sign_many_shares_issue_time(self):
+        """Test that batch tokens keep input order and share nbf"""
+        grants = [TokenGrant(f"user-{i}", "", f"room-{i % 2}") for i in range(3)]
+
+        tokens = self.signer.sign_many(grants)
+
+        decoded = [jwt.decode(t, API_SECRET, algorithms=["HS256"]) for t in tokens]
+        self.assertEqual([c["sub"] for c in decoded], ["user-0", "user-1", "user-2"])
+        self.assertEqual(len({c["nbf"] for c in decoded}), 1)
+        self.assertNotIn("name", decoded[0])
+
+    def test_missing_room_raises(self):
+        """Test that a grant without room is rejected"""
+        with self.assertRaises(ValueError):
+            self.signer.sign(TokenGrant("user-1", "Fan", ""))
+
+    def test_missing_credentials_raise(self):
+        """Test that the signer requires credentials"""
+        with self.assertRaises(ValueError):
+            TokenSigner(API_KEY, "")
@@ -0,0 +1,134 @@
+"""
+Unit tests for the synthesized speech cache
+"""
+
+import tempfile
+import unittest
+
+from livekit.agents import tts
+
+from fancall.agent.tts_cache import CachedTTS, TtsAudioCache, normalize_tts_text
+from fancall.settings import TtsCacheSettings
+from fancall.testing.agent_plugins import FakeTTS, PluginTiming
+
+TIMING = PluginTiming(tts_ttfb=0.01, tts_realtime_factor=0.01)
+
+
+class CountingTTS(FakeTTS):
+    """FakeTTS counting provider streams"""
+
+    def __init__(self):
+        super().__init__(TIMING)
+        self.streams = 0
+
+    def stream(self, **kwargs):
+        self.streams += 1
+        return super().stream(**kwargs)
+
+
+async def _stream_audio(cached_tts: tts.TTS, *chunks: str) -> float:
+    """Stream text chunks and return the seconds of audio produced."""
+    async with cached_tts.stream() as stream:
+        for chunk in chunks:
+            stream.push_text(chunk)
+        stream.end_input()
+        seconds = 0.0
+        async for audio in stream:
+            seconds += audio.frame.duration
+        return seconds
+
+
+class TestTtsCache(unittest.IsolatedAsyncioTestCase):
+    """Tests for CachedTTS and TtsAudioCache"""
+
+    def setUp(self):
+        self.provider = CountingTTS()
+
+    def _cached_tts(self, settings: TtsCacheSettings, voice_id: str = "voice_a"):
+        return CachedTTS(self.provider, TtsAudioCache(settings), voice_id)
+
+    def test_normalize_text(self):
+        """Test that keys ignore width and whitespace differences"""
+        self.assertEqual(
+            normalize_tts_text("  안녕，\n 팬  여러분 "), "안녕, 팬 여러분"
+        )
+
+    async def test_repeated_utterance_is_served_from_memory(self):
+        """Test that a repeated phrase is synthesized once and replayed"""
+        cached_tts = self._cached_tts(TtsCacheSettings())
+
+        first = await _stream_audio(cached_tts, "Hello ", "there!")
+        second = await _stream_audio(cached_tts, "Hello  there!")
+
+        self.assertAlmostEqual(first, second, delta=0.001)
+        self.assertEqual(self.provider.streams, 1)
+        self.assertEqual(cached_tts.cache.stats()["memory_hits"], 1)
+        self.assertEqual(cached_tts.cache.stats()["hit_rate"], 0.5)
+
+    async def test_voices_do_not_share_entries(self):
+        """Test that the voice ID is part of the cache key"""
+        settings = TtsCacheSettings()
+        cache = TtsAudioCache(settings)
+
+        await _stream_audio(CachedTTS(self.provider, cache, "voice_a"), "Hi!")
+        await _stream_audio(CachedTTS(self.provider, cache, "voice_b"), "Hi!")
+
+        self.assertEqual(self.provider.streams, 2)
+
+    async def test_long_text_is_passed_through(self):
+        """Test that text beyond max_text_chars streams uncached"""
+        cached_tts = self._cached_tts(TtsCacheSettings(max_text_chars=10))
+
+        seconds = 0.0
+        for _ in range(2):
+            seconds = await _stream_audio(cached_tts, "This reply ", "is far too long")
+
+        self.assertAlmostEqual(
+            seconds,
+            len("This reply is far too long") * TIMING.tts_seconds_per_char,
+            delta=0.02,
+        )
+        self.assertEqual(self.provider.streams, 2)
+        self.assertEqual(cached_tts.cache.stats()["misses"], 0)
+
+    async def test_disk_tier_survives_processes(self):
+        """Test that a new cache instance replays audio from disk"""
+        with tempfile.TemporaryDirectory() as disk_dir:
+            settings = TtsCacheSettings(disk_dir=disk_dir)
+
+            first = await self._cached_tts(settings).synthesize("Welcome!").collect()
+            reloaded = self._cached_tts(settings)
+            second = await reloaded.synthesize("Welcome!").collect()
+
+        self.assertEqual(first.data.tobytes(), second.data.tobytes())
+        self.assertEqual(self.provider.streams, 1)
+        self.assertEqual(reloaded.cache.disk_hits, 1)
+
+    async def test_budgets_evict_least_recently_used(self):
+        """Test that memory and disk tiers stay within their byte budgets"""
+        probe = self._cached_tts(TtsCacheSettings())
+        await probe.synthesize("one").collect()
+        entry_bytes = probe.cache.stats()["memory_bytes"]
+        with tempfile.TemporaryDirectory() as disk_dir:
+            cached_tts = self._cached_tts(
+                TtsCacheSettings(
+                    memory_budget_bytes=2 * entry_bytes,
+                    disk_dir=disk_dir,
+                    disk_budget_bytes=2 * (entry_bytes + 100),
+                )
+            )
+
+            for text in ("one", "two", "six", "one"):
+                await cached_tts.synthesize(text).collect()
+            stats = cached_tts.cache.stats()
+
+        self.assertEqual(stats["memory_entries"], 2)
+        self.assertEqual(stats["memory_evictions"], 2)
+        self.assertEqual(stats["memory_bytes"], 2 * entry_bytes)
+        self.assertLessEqual(stats["disk_bytes"], 2 * (entry_bytes + 100))
+        # "one" was evicted from both tiers before it was requested again
+        self.assertEqual(stats["misses"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -43,8 +43,11 @@ export type DispatchResponse = z.infer<typeof dispatchResponseSchema>;
  * Generic specification for LiveKit agent dispatch
  */
 export interface AgentDispatchRequest {
+  /** ID of a persona registered via /personas; inline fields override it */
+  personaId?: string | null;
   avatarId?: string | null;
   profilePictureUrl?: string | null;
   voiceId?: string | null;
   systemPrompt?: string | null;
+  greetings?: string[] | null;
 }